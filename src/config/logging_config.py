@@ -1,5 +1,8 @@
+import hashlib
 import logging.config
+import marshal
 import os
+import tempfile
 from pathlib import Path
 
 import yaml
@@ -7,39 +10,198 @@ import yaml
 from config.settings_config import get_settings
 from core.utils import deep_merge
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader  # type: ignore[assignment]
+
+# Directory holding the logging configuration YAML files
+_LOGGING_DIR = Path(__file__).resolve().parents[2] / "config" / "logging"
+# Path to the base logging configuration YAML file
+_BASE_CONFIG_PATH = _LOGGING_DIR / "logging.yaml"
+
+# Environment-specific config paths already found to be absent in this process
+_MISSING_ENV_CONFIGS: set[Path] = set()
+
+
+def _load_yaml(path: Path) -> dict:
+    """
+    Loads and parses a YAML file.
+
+    Args:
+        path (Path): Path to the YAML file.
+
+    Returns:
+        dict: The parsed YAML content.
+
+    Raises:
+        FileNotFoundError: If the YAML file does not exist.
+        yaml.YAMLError: If there is an error parsing the YAML file.
+    """
+    with open(path, "r") as f:
+        return yaml.load(f, Loader=SafeLoader)
+
+
+def _env_config_exists(env_config_path: Path) -> bool:
+    """
+    Checks whether the environment-specific logging configuration file exists.
+
+    Absent files are remembered for the lifetime of the process, so repeated calls
+    skip the filesystem lookup.
+
+    Args:
+        env_config_path (Path): Path to the environment-specific configuration file.
+
+    Returns:
+        bool: True if the file exists, False otherwise.
+    """
+    if env_config_path in _MISSING_ENV_CONFIGS:
+        return False
+
+    if env_config_path.is_file():
+        return True
+
+    _MISSING_ENV_CONFIGS.add(env_config_path)
+    return False
+
+
+def _get_cache_dir() -> Path | None:
+    """
+    Returns the private directory holding the merged logging configuration cache.
+
+    The configured ``logging_cache_dir`` is created with mode 0700. The cached config
+    is passed to ``dictConfig``, which can call arbitrary factories, so the cache is
+    only used if the directory is owned by the current user and not accessible to
+    anyone else.
+
+    Returns:
+        Path | None: The cache directory, or None if it cannot be used safely.
+    """
+    cache_dir = get_settings().logging_cache_dir.expanduser()
+    try:
+        cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        stat = cache_dir.stat()
+    except OSError:
+        return None
+
+    if stat.st_uid != os.getuid() or stat.st_mode & 0o077:
+        return None
+    return cache_dir
+
+
+def _get_cache_path(
+    cache_dir: Path, base_config_path: Path, env_config_path: Path, env: str
+) -> Path:
+    """
+    Builds the cache file path for the merged logging configuration.
+
+    The file name is derived from the config file paths, their modification times and
+    the environment name, so any change to the inputs results in a cache miss.
+
+    Args:
+        cache_dir (Path): Directory holding the cache.
+        base_config_path (Path): Path to the base logging configuration file.
+        env_config_path (Path): Path to the environment-specific configuration file.
+        env (str): The environment name.
+
+    Returns:
+        Path: Path of the cache file for the current inputs.
+
+    Raises:
+        FileNotFoundError: If the base logging configuration file does not exist.
+    """
+    base_mtime_ns = base_config_path.stat().st_mtime_ns
+    env_mtime_ns = (
+        env_config_path.stat().st_mtime_ns if _env_config_exists(env_config_path) else 0
+    )
+
+    key = f"{base_config_path}:{base_mtime_ns}:{env_config_path}:{env_mtime_ns}:{env}"
+    digest = hashlib.sha1(key.encode()).hexdigest()
+    return cache_dir / f"logging_config.{digest}.cache"
+
+
+def _read_cached_config(cache_path: Path) -> dict | None:
+    """
+    Reads the merged logging configuration from the cache.
+
+    Args:
+        cache_path (Path): Path of the cache file.
+
+    Returns:
+        dict | None: The cached configuration, or None if it is missing or unreadable.
+    """
+    try:
+        config = marshal.loads(cache_path.read_bytes())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+
+    return config if isinstance(config, dict) else None
+
+
+def _write_cached_config(cache_path: Path, config: dict) -> None:
+    """
+    Writes the merged logging configuration to the cache.
+
+    The file is written to a fresh temporary file and moved into place, so concurrent
+    processes never read a partial cache. Failures (e.g. a read-only filesystem or
+    non built-in values) are ignored.
+
+    Args:
+        cache_path (Path): Path of the cache file.
+        config (dict): The merged logging configuration.
+    """
+    tmp_name = None
+    try:
+        data = marshal.dumps(config)
+        fd, tmp_name = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_name, cache_path)
+    except (OSError, ValueError):
+        if tmp_name is not None:
+            Path(tmp_name).unlink(missing_ok=True)
+
 
 def setup_logging():
     """
     Sets up logging configuration for the application.
 
     Loads the base logging configuration from a YAML file, and if an environment-specific
-    override exists, merges it with the base configuration. Ensures that any directories
-    for file handlers exist before applying the logging configuration.
+    override exists, merges it with the base configuration. The merged configuration is
+    cached in the private ``logging_cache_dir``, keyed by the config files' modification times and the
+    environment, so later process starts skip YAML parsing and merging.
 
     Raises:
         FileNotFoundError: If the base logging configuration file does not exist.
         yaml.YAMLError: If there is an error parsing the YAML files.
     """
-    # Determine the base directory of the project
-    base_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-    # Path to the base logging configuration YAML file
-    base_config_path = os.path.join(base_dir, "config", "logging", "logging.yaml")
+    env = get_settings().env
     # Path to the environment-specific logging configuration YAML file
-    env_config_path = os.path.join(
-        base_dir, "config", "logging", f"logging.{get_settings().env}.yaml"
+    env_config_path = _LOGGING_DIR / f"logging.{env}.yaml"
+
+    # Reuse the merged configuration if the inputs have not changed
+    cache_dir = _get_cache_dir()
+    cache_path = (
+        _get_cache_path(cache_dir, _BASE_CONFIG_PATH, env_config_path, env)
+        if cache_dir is not None
+        else None
     )
+    config = _read_cached_config(cache_path) if cache_path is not None else None
+
+    if config is None:
+        # Load the base logging configuration
+        base_config = _load_yaml(_BASE_CONFIG_PATH)
+
+        # If an environment-specific config exists, load and merge it
+        if _env_config_exists(env_config_path):
+            override_config = _load_yaml(env_config_path)
+            config = deep_merge(base_config, override_config)
+        else:
+            config = base_config
 
-    # Load the base logging configuration
-    with open(base_config_path, "r") as f:
-        base_config = yaml.safe_load(f)
-
-    # If an environment-specific config exists, load and merge it
-    if Path(env_config_path).exists():
-        with open(env_config_path, "r") as f:
-            override_config = yaml.safe_load(f)
-        config = deep_merge(base_config, override_config)
-    else:
-        config = base_config
+        if cache_path is not None:
+            _write_cached_config(cache_path, config)
 
     # Apply the logging configuration
     logging.config.dictConfig(config)
@@ -1,9 +1,10 @@
 import logging
-from functools import lru_cache
+from functools import cache
+from pathlib import Path
 from typing import Annotated
 
 from pydantic import AnyHttpUrl, BeforeValidator, Field, ValidationError, computed_field
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from enums.mcp_transport import McpTransport
 
@@ -11,6 +12,13 @@ logger = logging.getLogger(__name__)
 
 
 class Settings(BaseSettings):
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+        frozen=True,
+    )
+
     env: Annotated[str, BeforeValidator(str.strip), Field(min_length=1)]
 
     mcp_project_name: Annotated[str, BeforeValidator(str.strip), Field(min_length=1)]
@@ -22,17 +30,19 @@ class Settings(BaseSettings):
     openweather_api_key: Annotated[str, BeforeValidator(str.strip), Field(min_length=1)]
     openweather_base_url: AnyHttpUrl
     openweather_geo_base_url: AnyHttpUrl
+    openweather_max_concurrency: Annotated[int, Field(ge=1)] = 8
+    openweather_rpm: Annotated[int, Field(ge=1)] = 55
 
-    class ConfigDict:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
+    logging_cache_dir: Path = Path("~/.cache/weather_mcp/logging")
+    geo_cache_dir: Path = Path("~/.cache/weather_mcp/geo")
+    response_cache_dir: Path = Path("~/.cache/weather_mcp/responses")
 
     @computed_field
     def mcp_project_info(self) -> str:
         return f"{self.mcp_project_name} - {self.mcp_project_version}"
 
 
-@lru_cache()
+@cache
 def get_settings() -> Settings:
     try:
         return Settings()  # type: ignore
@@ -0,0 +1,129 @@
+import asyncio
+import time
+
+
+class CircuitOpenError(Exception):
+    """
+    Raised when a call is rejected because the circuit breaker is open.
+    """
+
+
+class AIMDGate:
+    """
+    Adaptive concurrency limiter with a circuit breaker.
+
+    The concurrency limit grows additively after each fast successful call and is
+    halved after a failure or a call slower than the target (additive increase,
+    multiplicative decrease). The limit is halved at most once per round of in-flight
+    calls: the other calls that were already running when it was halved do not halve
+    it again. After ``failure_threshold``
+    consecutive failures the circuit opens and calls are rejected for ``cooldown``
+    seconds; afterwards the next result closes or re-opens it.
+
+    Args:
+        initial (float): Initial concurrency limit.
+        maximum (float): Upper bound of the concurrency limit.
+        latency_target (float): Mean latency, in seconds, above which the limit shrinks.
+        failure_threshold (int, optional): Consecutive failures that open the circuit.
+            Defaults to 5.
+        cooldown (float, optional): Seconds the circuit stays open. Defaults to 30.
+    """
+
+    def __init__(
+        self,
+        initial: float,
+        maximum: float,
+        latency_target: float,
+        failure_threshold: int = 5,
+        cooldown: float = 30.0,
+    ):
+        self.limit = initial
+        self.maximum = maximum
+        self.latency_target = latency_target
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._in_flight = 0
+        # Releases left from calls that were in flight at the last decrease
+        self._unaffected = 0
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._resume_at = 0.0
+        self._condition = asyncio.Condition()
+
+    @property
+    def is_open(self) -> bool:
+        """
+        bool: Whether calls are currently being rejected.
+        """
+        return (
+            self._opened_at is not None
+            and time.monotonic() - self._opened_at < self.cooldown
+        )
+
+    def hold(self, delay: float) -> None:
+        """
+        Pauses new calls for ``delay`` seconds, e.g. until a rate limit resets.
+
+        Args:
+            delay (float): Seconds to pause for.
+        """
+        self._resume_at = max(self._resume_at, time.monotonic() + delay)
+
+    async def acquire(self) -> None:
+        """
+        Waits for a free slot under the current concurrency limit.
+
+        Raises:
+            CircuitOpenError: If the circuit breaker is open.
+        """
+        if self.is_open:
+            raise CircuitOpenError("Circuit breaker is open")
+
+        # Honor a pause requested by the upstream before taking a slot
+        pause = self._resume_at - time.monotonic()
+        if pause > 0:
+            await asyncio.sleep(pause)
+
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < int(self.limit))
+            self._in_flight += 1
+
+    async def release(self, success: bool | None, latency: float) -> None:
+        """
+        Frees a slot and adjusts the concurrency limit based on the call's outcome.
+
+        Args:
+            success (bool | None): Whether the upstream handled the call normally, or
+                None if the call ended without an outcome (e.g. it was cancelled), in
+                which case only the slot is freed.
+            latency (float): Duration of the call, in seconds.
+        """
+        async with self._condition:
+            self._in_flight -= 1
+            if success is None:
+                self._condition.notify_all()
+                return
+
+            if success:
+                self._failures = 0
+                self._opened_at = None
+            else:
+                self._failures += 1
+                if self._failures >= self.failure_threshold:
+                    self._opened_at = time.monotonic()
+
+            # Calls started before the last decrease already saw the old limit
+            overloaded = not success or latency > self.latency_target
+            if self._unaffected:
+                self._unaffected -= 1
+                if overloaded:
+                    self._condition.notify_all()
+                    return
+
+            if overloaded:
+                self.limit = max(1.0, self.limit * 0.5)
+                self._unaffected = self._in_flight
+            else:
+                self.limit = min(self.maximum, self.limit + 0.5)
+
+            self._condition.notify_all()
@@ -1,6 +1,43 @@
+import re
 from typing import Annotated, Optional
 
-from pydantic import BeforeValidator, Field
+from pydantic import AfterValidator, BeforeValidator, Field
+
+# Patterns are compiled once and shared by every annotated type that uses them
+_COUNTRY_CODE_PATTERN = re.compile(r"^[A-Z]{2}$")
+
+# Language codes supported by the OpenWeather API
+_LANGS = frozenset(
+    {
+        "af", "al", "ar", "az", "bg", "ca", "cz", "da", "de", "el", "en", "es",
+        "eu", "fa", "fi", "fr", "gl", "he", "hi", "hr", "hu", "id", "it", "ja",
+        "kr", "la", "lt", "lv", "mk", "nl", "no", "pl", "pt", "pt_br", "ro", "ru",
+        "se", "sk", "sl", "sp", "sq", "sr", "sv", "th", "tr", "ua", "uk", "vi",
+        "zh_cn", "zh_tw", "zu",
+    }
+)  # fmt: skip
+
+
+def _validate_lang(lang: str) -> str:
+    """
+    Checks that a language code is supported by the OpenWeather API.
+
+    Args:
+        lang (str): The language code.
+
+    Returns:
+        str: The language code, unchanged.
+
+    Raises:
+        ValueError: If the language code is not supported.
+    """
+    if lang not in _LANGS:
+        raise ValueError(f"Unsupported language code: {lang!r}")
+    return lang
+
+
+# Upper bound on the number of locations a single batch tool call may request
+MAX_BATCH_LOCATIONS = 50
 
 ANNOTATED_CITY = Annotated[
     str,
@@ -15,7 +52,7 @@ ANNOTATED_STATE_CODE = Annotated[
     str,
     Field(
         description="Country code in ISO 3166-1 alpha-2 format (e.g., 'US', 'GB', 'JP')",
-        pattern=r"^[A-Z]{2}$",
+        pattern=_COUNTRY_CODE_PATTERN,
     ),
 ]
 
@@ -24,7 +61,7 @@ ANNOTATED_OPTIONAL_COUNTRY_CODE = Annotated[
     Field(
         default=None,
         description="ISO 3166-1 alpha-2 country code (e.g., 'US', 'GB', 'JP'). Strongly recommended for cities with duplicate names. Helps ensure forecast accuracy for intended location. Defaults to None (global search, returns best match).",
-        pattern=r"^[A-Z]{2}$",
+        pattern=_COUNTRY_CODE_PATTERN,
     ),
 ]
 
@@ -32,7 +69,7 @@ ANNOTATED_COUNTRY_CODE = Annotated[
     str,
     Field(
         description="Country code in ISO 3166-1 alpha-2 format (e.g., 'US', 'GB', 'JP')",
-        pattern=r"^[A-Z]{2}$",
+        pattern=_COUNTRY_CODE_PATTERN,
     ),
 ]
 
@@ -56,9 +93,9 @@ ANNOTATED_LON = Annotated[
 
 ANNOTATED_LANG = Annotated[
     str,
+    AfterValidator(_validate_lang),
     Field(
         default="en",
-        pattern=r"^[a-z]{2}$",
-        description="Language code (ISO 639-1) for weather descriptions. Defaults to 'en'.",
+        description="Language code (ISO 639-1, or e.g. 'zh_cn', 'pt_br') for weather descriptions. Defaults to 'en'.",
     ),
 ]
@@ -0,0 +1,281 @@
+import asyncio
+import heapq
+import itertools
+import time
+from collections import OrderedDict, defaultdict
+from collections.abc import Awaitable, Callable, Hashable
+from functools import partial
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class TTLCache:
+    """
+    In-memory LRU cache whose entries expire after a time-to-live.
+
+    Entries are kept in least-recently-used order, so once ``maxsize`` is reached the
+    oldest entry is evicted. Expiry uses a monotonic clock and is checked lazily on
+    lookup.
+
+    Args:
+        maxsize (int): Maximum number of entries to keep.
+        ttl (float): Default time-to-live of an entry, in seconds.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # key -> (expires_at, value)
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Any | None:
+        """
+        Returns the cached value for a key.
+
+        Args:
+            key (Hashable): The cache key.
+
+        Returns:
+            Any | None: The cached value, or None if it is missing or expired.
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        # Drop expired entries on access
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        """
+        Stores a value in the cache, evicting the least recently used entry if full.
+
+        Args:
+            key (Hashable): The cache key.
+            value (Any): The value to store.
+            ttl (float | None, optional): Time-to-live in seconds. Defaults to the
+                cache's ``ttl``.
+        """
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Removes all entries from the cache.
+        """
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class LFUTTLCache:
+    """
+    In-memory LFU cache whose entries expire after a time-to-live.
+
+    Once ``maxsize`` is reached an expired entry is evicted if there is one, otherwise
+    the least frequently used entry, ties going to the least recently used one, so
+    popular keys survive bursts of one-off keys. Expired entries are no longer
+    returned but keep their use count until evicted, so a popular key refreshed after
+    expiry stays popular.
+
+    Args:
+        maxsize (int): Maximum number of entries to keep.
+        ttl (float): Default time-to-live of an entry, in seconds.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # key -> (expires_at, value)
+        self._data: dict[Hashable, tuple[float, Any]] = {}
+        # key -> use count, and use count -> keys in least-recently-used order
+        self._counts: dict[Hashable, int] = {}
+        self._by_count: defaultdict[int, OrderedDict[Hashable, None]] = defaultdict(
+            OrderedDict
+        )
+        self._min_count = 0
+        # Min-heap of (expires_at, sequence, key); entries outdated by a later set
+        # are skipped when popped
+        self._expiries: list[tuple[float, int, Hashable]] = []
+        self._sequence = itertools.count()
+
+    def _push_expiry(self, key: Hashable, expires_at: float) -> None:
+        heapq.heappush(self._expiries, (expires_at, next(self._sequence), key))
+
+        # Rebuild the heap once outdated entries make up most of it
+        if len(self._expiries) > 2 * self.maxsize:
+            self._expiries = [
+                (entry[0], next(self._sequence), key)
+                for key, entry in self._data.items()
+            ]
+            heapq.heapify(self._expiries)
+
+    def _remove(self, key: Hashable) -> None:
+        count = self._counts.pop(key)
+        keys = self._by_count[count]
+        del keys[key]
+        if not keys:
+            del self._by_count[count]
+        del self._data[key]
+
+    def _touch(self, key: Hashable) -> None:
+        count = self._counts[key]
+        keys = self._by_count[count]
+        del keys[key]
+        if not keys:
+            del self._by_count[count]
+            if self._min_count == count:
+                self._min_count = count + 1
+
+        self._counts[key] = count + 1
+        self._by_count[count + 1][key] = None
+
+    def _evict(self) -> None:
+        # Expired entries go first, whatever their use count
+        now = time.monotonic()
+        while self._expiries and self._expiries[0][0] <= now:
+            expires_at, _, key = heapq.heappop(self._expiries)
+            entry = self._data.get(key)
+            if entry is not None and entry[0] == expires_at:
+                self._remove(key)
+                return
+
+        if self._min_count not in self._by_count:
+            self._min_count = min(self._by_count)
+
+        keys = self._by_count[self._min_count]
+        key, _ = keys.popitem(last=False)
+        if not keys:
+            del self._by_count[self._min_count]
+        del self._counts[key]
+        del self._data[key]
+
+    def get(self, key: Hashable) -> Any | None:
+        """
+        Returns the cached value for a key.
+
+        Args:
+            key (Hashable): The cache key.
+
+        Returns:
+            Any | None: The cached value, or None if it is missing or expired.
+        """
+        entry = self._data.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+
+        self._touch(key)
+        return entry[1]
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        """
+        Stores a value in the cache, evicting the least frequently used entry if full.
+
+        Args:
+            key (Hashable): The cache key.
+            value (Any): The value to store.
+            ttl (float | None, optional): Time-to-live in seconds. Defaults to the
+                cache's ``ttl``.
+        """
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+
+        if key in self._data:
+            self._data[key] = (expires_at, value)
+            self._push_expiry(key, expires_at)
+            self._touch(key)
+            return
+
+        if len(self._data) >= self.maxsize:
+            self._evict()
+
+        self._data[key] = (expires_at, value)
+        self._push_expiry(key, expires_at)
+        self._counts[key] = 1
+        self._by_count[1][key] = None
+        self._min_count = 1
+
+    def clear(self) -> None:
+        """
+        Removes all entries from the cache.
+        """
+        self._data.clear()
+        self._counts.clear()
+        self._by_count.clear()
+        self._min_count = 0
+        self._expiries.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share a key into a single execution.
+
+    While a call for a key is in flight, later callers with the same key await its
+    result instead of starting their own. The call runs in its own task, so a caller
+    that is cancelled stops waiting without cancelling it for the others; the call is
+    only cancelled once every caller has stopped waiting.
+    """
+
+    def __init__(self):
+        self._calls: dict[Hashable, asyncio.Task] = {}
+        # Number of callers awaiting each in-flight call
+        self._waiters: dict[asyncio.Task, int] = {}
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+
+    def _on_done(self, key: Hashable, task: asyncio.Task) -> None:
+        self._forget(key, task)
+        # Mark the exception as retrieved in case nobody was waiting any more
+        if not task.cancelled():
+            task.exception()
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Runs ``fn`` unless a call for ``key`` is already in flight.
+
+        Args:
+            key (Hashable): Key identifying the call.
+            fn (Callable): Coroutine function to run on the first call.
+
+        Returns:
+            T: The result of the in-flight or new call.
+
+        Raises:
+            Exception: Whatever ``fn`` raised, for every caller sharing the call.
+        """
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(partial(self._on_done, key))
+
+        self._waiters[task] = self._waiters.get(task, 0) + 1
+        try:
+            # Shield so a cancelled caller does not cancel the shared call
+            return await asyncio.shield(task)
+        finally:
+            self._waiters[task] -= 1
+            if not self._waiters[task]:
+                del self._waiters[task]
+                # Nobody is waiting any more, so stop the call if it is still running
+                if not task.done():
+                    self._forget(key, task)
+                    task.cancel()
+
+    def __len__(self) -> int:
+        return len(self._calls)
@@ -0,0 +1,88 @@
+import logging
+import sqlite3
+import time
+
+from config.settings_config import get_settings
+from core.sqlite_store import SQLiteStore
+
+logger = logging.getLogger(__name__)
+
+# Resolved coordinates are kept on disk for 30 days
+_TTL_SECONDS = 30 * 24 * 60 * 60
+
+# Database in the configured geo_cache_dir, opened on first use
+_store = SQLiteStore(
+    lambda: get_settings().geo_cache_dir.expanduser() / "geo_cache.sqlite3",
+    "CREATE TABLE IF NOT EXISTS geo ("
+    " city TEXT NOT NULL,"
+    " state TEXT NOT NULL,"
+    " country TEXT NOT NULL,"
+    " lat REAL NOT NULL,"
+    " lon REAL NOT NULL,"
+    " expires_at REAL NOT NULL,"
+    " PRIMARY KEY (city, state, country))",
+)
+
+
+def _get(
+    connection: sqlite3.Connection, key: tuple[str, str, str]
+) -> tuple[float, float] | None:
+    row = connection.execute(
+        "SELECT lat, lon FROM geo"
+        " WHERE city = ? AND state = ? AND country = ? AND expires_at > ?",
+        (*key, time.time()),
+    ).fetchone()
+    return (row[0], row[1]) if row else None
+
+
+def _set(
+    connection: sqlite3.Connection, key: tuple[str, str, str], lat: float, lon: float
+) -> None:
+    connection.execute(
+        "INSERT OR REPLACE INTO geo VALUES (?, ?, ?, ?, ?, ?)",
+        (*key, lat, lon, time.time() + _TTL_SECONDS),
+    )
+    connection.commit()
+
+
+async def get(key: tuple[str, str, str]) -> tuple[float, float] | None:
+    """
+    Looks up cached coordinates for a normalized (city, state, country) key.
+
+    Failures to read the cache are logged and treated as a miss.
+
+    Args:
+        key (tuple[str, str, str]): The normalized (city, state, country) key.
+
+    Returns:
+        tuple[float, float] | None: Latitude and longitude, or None on a miss.
+    """
+    try:
+        return await _store.run_in_thread(lambda connection: _get(connection, key))
+    except (OSError, sqlite3.Error) as e:
+        logger.warning("Geocoding disk cache read failed: %s", e)
+        return None
+
+
+async def set(key: tuple[str, str, str], lat: float, lon: float) -> None:
+    """
+    Stores coordinates for a normalized (city, state, country) key.
+
+    Failures to write the cache are logged and ignored.
+
+    Args:
+        key (tuple[str, str, str]): The normalized (city, state, country) key.
+        lat (float): Latitude.
+        lon (float): Longitude.
+    """
+    try:
+        await _store.run_in_thread(lambda connection: _set(connection, key, lat, lon))
+    except (OSError, sqlite3.Error) as e:
+        logger.warning("Geocoding disk cache write failed: %s", e)
+
+
+def close() -> None:
+    """
+    Closes the SQLite connection backing the geocoding cache.
+    """
+    _store.close()
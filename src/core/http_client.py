@@ -0,0 +1,71 @@
+import logging
+
+import httpx
+
+from config.settings_config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Shared client, created lazily on first use
+_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Returns the shared asynchronous HTTP client.
+
+    The client is created on first use and reused afterwards, so DNS resolution,
+    TCP connections and TLS sessions are pooled across requests instead of being
+    rebuilt for every call. HTTP/2 is enabled so concurrent requests to the same
+    host are multiplexed over a single connection.
+
+    Returns:
+        httpx.AsyncClient: The shared HTTP client.
+    """
+    global _client
+
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=httpx.Timeout(2.0),
+            limits=httpx.Limits(
+                max_keepalive_connections=32,
+                max_connections=64,
+                keepalive_expiry=60,
+            ),
+            http2=True,
+        )
+    return _client
+
+
+async def close_http_client() -> None:
+    """
+    Closes the shared HTTP client and releases its pooled connections.
+    """
+    global _client
+
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+async def warmup_openweather() -> None:
+    """
+    Opens pooled connections to the OpenWeather hosts ahead of the first tool call.
+
+    A ``HEAD`` request is sent to each distinct OpenWeather origin, so the TCP and
+    TLS handshakes are paid at startup and the first real request reuses the idle
+    keep-alive connection. Failures are logged and ignored; the connection is then
+    simply opened by the first request instead.
+    """
+    settings = get_settings()
+    origins = {
+        httpx.URL(str(url)).copy_with(path="/", query=None)
+        for url in (settings.openweather_base_url, settings.openweather_geo_base_url)
+    }
+
+    client = get_http_client()
+    for origin in origins:
+        try:
+            await client.head(origin)
+        except httpx.HTTPError as e:
+            logger.warning("OpenWeather connection warmup failed for %s: %s", origin, e)
@@ -1,26 +1,58 @@
 # Application metrics
-from prometheus_client import Counter, Gauge, Histogram, Info
+from prometheus_client import (
+    GC_COLLECTOR,
+    PLATFORM_COLLECTOR,
+    PROCESS_COLLECTOR,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    Info,
+)
 
 from config.settings_config import get_settings
 
+# Dedicated registry for the application, keeping the default process, GC and
+# platform collectors so /metrics still exposes process_*, python_gc_* and python_info
+registry = CollectorRegistry()
+for _collector in (PROCESS_COLLECTOR, PLATFORM_COLLECTOR, GC_COLLECTOR):
+    registry.register(_collector)
+
 tool_calls_counter = Counter(
-    "mcp_tool_calls_total", "Total tool calls", ["tool_name", "status"]
+    "mcp_tool_calls_total",
+    "Total tool calls",
+    ["tool_name", "status"],
+    registry=registry,
 )
 tool_duration_histogram = Histogram(
-    "mcp_tool_duration_seconds", "Tool execution time", ["tool_name"]
+    "mcp_tool_duration_seconds",
+    "Tool execution time",
+    ["tool_name"],
+    registry=registry,
+)
+cache_requests_counter = Counter(
+    "mcp_cache_requests_total",
+    "OpenWeather response cache lookups",
+    ["endpoint", "result"],
+    registry=registry,
 )
-active_connections = Gauge("mcp_active_connections", "Number of active MCP connections")
-server_info = Info("mcp_server_info", "Server information")
+active_connections = Gauge(
+    "mcp_active_connections", "Number of active MCP connections", registry=registry
+)
+server_info = Info("mcp_server_info", "Server information", registry=registry)
 
 # System metrics
-memory_usage = Gauge("mcp_memory_usage_bytes", "Memory usage in bytes")
-cpu_usage = Gauge("mcp_cpu_usage_percent", "CPU usage percentage")
+memory_usage = Gauge(
+    "mcp_memory_usage_bytes", "Memory usage in bytes", registry=registry
+)
+cpu_usage = Gauge("mcp_cpu_usage_percent", "CPU usage percentage", registry=registry)
 
 # Set server info
+settings = get_settings()
 server_info.info(
     {
-        "version": get_settings().mcp_project_version,
-        "name": get_settings().mcp_project_name,
-        "transport": get_settings().mcp_transport.value,
+        "version": settings.mcp_project_version,
+        "name": settings.mcp_project_name,
+        "transport": settings.mcp_transport.value,
     }
 )
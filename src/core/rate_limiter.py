@@ -0,0 +1,46 @@
+import asyncio
+import time
+
+
+class AsyncRateLimiter:
+    """
+    Leaky-bucket rate limiter for asyncio code.
+
+    Allows at most ``max_rate`` acquisitions per ``time_period`` seconds. Bursts up to
+    ``max_rate`` go through immediately; after that, callers wait in FIFO order until
+    the bucket has drained enough.
+
+    Args:
+        max_rate (float): Maximum number of acquisitions per period.
+        time_period (float, optional): Length of the period, in seconds. Defaults to 60.
+    """
+
+    def __init__(self, max_rate: float, time_period: float = 60.0):
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._leak_rate = max_rate / time_period
+        self._level = 0.0
+        self._last_leak = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _leak(self) -> None:
+        now = time.monotonic()
+        self._level = max(0.0, self._level - (now - self._last_leak) * self._leak_rate)
+        self._last_leak = now
+
+    async def acquire(self) -> None:
+        """
+        Waits until the rate limit allows another acquisition.
+        """
+        async with self._lock:
+            self._leak()
+            if self._level + 1 > self.max_rate:
+                await asyncio.sleep((self._level + 1 - self.max_rate) / self._leak_rate)
+                self._leak()
+            self._level += 1
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
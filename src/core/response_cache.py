@@ -0,0 +1,113 @@
+import logging
+import sqlite3
+import time
+from typing import Any
+
+import orjson
+
+from config.settings_config import get_settings
+from core.sqlite_store import SQLiteStore
+
+logger = logging.getLogger(__name__)
+
+# Entries kept on disk; the oldest are pruned beyond this
+_MAX_ENTRIES = 10_000
+# Number of writes between prunes of expired and excess entries
+_PRUNE_EVERY = 256
+
+# Database in the configured response_cache_dir, opened on first use
+_store = SQLiteStore(
+    lambda: get_settings().response_cache_dir.expanduser() / "response_cache.sqlite3",
+    "CREATE TABLE IF NOT EXISTS responses ("
+    " key TEXT PRIMARY KEY,"
+    " value BLOB NOT NULL,"
+    " fresh_until REAL NOT NULL,"
+    " expires_at REAL NOT NULL,"
+    " stored_at REAL NOT NULL)",
+)
+_writes = 0
+
+
+def _prune(connection: sqlite3.Connection, now: float) -> None:
+    connection.execute("DELETE FROM responses WHERE expires_at <= ?", (now,))
+    connection.execute(
+        "DELETE FROM responses WHERE key NOT IN"
+        " (SELECT key FROM responses ORDER BY stored_at DESC LIMIT ?)",
+        (_MAX_ENTRIES,),
+    )
+
+
+def _get(connection: sqlite3.Connection, key: str) -> tuple[Any, float, float] | None:
+    now = time.time()
+    row = connection.execute(
+        "SELECT value, fresh_until, expires_at FROM responses"
+        " WHERE key = ? AND expires_at > ?",
+        (key, now),
+    ).fetchone()
+    if row is None:
+        return None
+    return orjson.loads(row[0]), row[1] - now, row[2] - now
+
+
+def _set(
+    connection: sqlite3.Connection, key: str, value: Any, ttl: float, keep_for: float
+) -> None:
+    global _writes
+
+    now = time.time()
+    blob = orjson.dumps(value)
+    connection.execute(
+        "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+        (key, blob, now + ttl, now + keep_for, now),
+    )
+    _writes += 1
+    if _writes % _PRUNE_EVERY == 0:
+        _prune(connection, now)
+    connection.commit()
+
+
+async def get(key: str) -> tuple[Any, float, float] | None:
+    """
+    Looks up a cached response.
+
+    Failures to read the cache are logged and treated as a miss.
+
+    Args:
+        key (str): The serialized cache key.
+
+    Returns:
+        tuple | None: The response, the seconds it stays fresh (negative once stale)
+            and the seconds until it expires, or None on a miss.
+    """
+    try:
+        return await _store.run_in_thread(lambda connection: _get(connection, key))
+    except (OSError, sqlite3.Error, orjson.JSONDecodeError) as e:
+        logger.warning("Response disk cache read failed: %s", e)
+        return None
+
+
+async def set(key: str, value: Any, ttl: float, keep_for: float) -> None:
+    """
+    Stores a response.
+
+    Failures to write the cache are logged and ignored.
+
+    Args:
+        key (str): The serialized cache key.
+        value (Any): The JSON-serializable response.
+        ttl (float): Seconds the response stays fresh.
+        keep_for (float): Seconds the response is kept, including any stale period.
+    """
+    try:
+        await _store.run_in_thread(
+            lambda connection: _set(connection, key, value, ttl, keep_for)
+        )
+    except (OSError, sqlite3.Error, orjson.JSONEncodeError) as e:
+        logger.warning("Response disk cache write failed: %s", e)
+
+
+def close() -> None:
+    """
+    Closes the SQLite connection backing the response cache.
+    """
+    _store.close()
@@ -0,0 +1,81 @@
+import asyncio
+import sqlite3
+import threading
+from collections.abc import Callable
+from pathlib import Path
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+class SQLiteStore:
+    """
+    Lazily opened SQLite database shared by asyncio worker threads.
+
+    The connection is opened on first use, so the database path is resolved from the
+    settings at that point, and access is serialized by a lock. Write-ahead logging
+    with relaxed syncing keeps per-entry commits cheap; a crash can only lose the
+    most recent entries, which callers are expected to be able to rebuild.
+
+    Args:
+        get_path (Callable[[], Path]): Returns the database file path; its parent
+            directory is created if needed.
+        schema (str): Statement creating the database's table if it does not exist.
+    """
+
+    def __init__(self, get_path: Callable[[], Path], schema: str):
+        self._get_path = get_path
+        self._schema = schema
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            path = self._get_path()
+            path.parent.mkdir(parents=True, exist_ok=True)
+
+            connection = sqlite3.connect(path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(self._schema)
+            connection.commit()
+            self._connection = connection
+        return self._connection
+
+    def run(self, fn: Callable[[sqlite3.Connection], T]) -> T:
+        """
+        Calls ``fn`` with the open connection while holding the lock.
+
+        Args:
+            fn (Callable): Function running statements on the connection.
+
+        Returns:
+            T: The result of ``fn``.
+
+        Raises:
+            sqlite3.Error: If opening the database or running ``fn`` fails.
+            OSError: If the database directory cannot be created.
+        """
+        with self._lock:
+            return fn(self._get_connection())
+
+    async def run_in_thread(self, fn: Callable[[sqlite3.Connection], T]) -> T:
+        """
+        Like ``run``, but in a worker thread so the event loop is not blocked.
+
+        Args:
+            fn (Callable): Function running statements on the connection.
+
+        Returns:
+            T: The result of ``fn``.
+        """
+        return await asyncio.to_thread(self.run, fn)
+
+    def close(self) -> None:
+        """
+        Closes the connection; the next use opens it again.
+        """
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
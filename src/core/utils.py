@@ -1,22 +1,47 @@
+import unicodedata
+
+
 def deep_merge(base: dict, override: dict) -> dict:
     """
-    Recursively merges two dictionaries.
+    Recursively merges two dictionaries in place.
 
     Values from the override dictionary will overwrite those in the base dictionary.
-    If both values are dictionaries, the merge is performed recursively.
+    If both values are dictionaries, the merge is performed recursively into the
+    existing nested dictionary of the base.
 
     Args:
         base (dict): The base dictionary to merge into.
         override (dict): The dictionary with override values.
 
     Returns:
-        dict: The merged dictionary.
+        dict: The merged dictionary (the same object as ``base``).
     """
+    # Nothing to merge
+    if not override:
+        return base
+
     for key, value in override.items():
-        # If both base and override have a dict at this key, merge them recursively
-        if isinstance(value, dict) and key in base and isinstance(base[key], dict):
-            base[key] = deep_merge(base[key], value)
+        base_value = base.get(key)
+        # If both base and override have a dict at this key, merge them in place
+        if isinstance(value, dict) and isinstance(base_value, dict):
+            deep_merge(base_value, value)
         else:
             # Otherwise, override the base value
             base[key] = value
     return base
+
+
+def normalize_text(value: str) -> str:
+    """
+    Normalizes free text for use in cache keys.
+
+    Applies Unicode NFKC normalization, strips surrounding whitespace and casefolds,
+    so "Paris", " paris " and full-width variants map to the same key.
+
+    Args:
+        value (str): The text to normalize.
+
+    Returns:
+        str: The normalized text.
+    """
+    return unicodedata.normalize("NFKC", value).strip().casefold()
@@ -8,11 +8,22 @@ from starlette.requests import Request
 from starlette.responses import JSONResponse, PlainTextResponse
 
 from config.settings_config import get_settings
-from core.monitoring import cpu_usage, memory_usage
+from core.http_client import get_http_client
+from core.monitoring import cpu_usage, memory_usage, registry
 from weather_mcp.server import mcp
 
 logger = logging.getLogger(__name__)
 
+# Readiness probe request, resolved once at import
+settings = get_settings()
+_READYZ_URL = httpx.URL(str(settings.openweather_base_url))
+_READYZ_PARAMS = {"q": "Tokyo,JP", "appid": settings.openweather_api_key}
+
+# Process handle reused across scrapes. cpu_percent() is primed here because its
+# first call always returns 0.0.
+_process = psutil.Process(os.getpid())
+_process.cpu_percent()
+
 
 @mcp.custom_route("/healthz", methods=["GET"])
 async def healthz(request: Request) -> JSONResponse:
@@ -34,16 +45,11 @@ async def readyz(request: Request) -> JSONResponse:
     """
     logger.debug("Readiness check endpoint called")
     try:
-        location = "Tokyo,JP"
-        params = {"q": location, "appid": get_settings().openweather_api_key}
-
-        async with httpx.AsyncClient(timeout=2.0) as client:
-            response = await client.get(
-                str(get_settings().openweather_base_url), params=params
-            )
+        client = get_http_client()
+        response = await client.get(_READYZ_URL, params=_READYZ_PARAMS, timeout=2.0)
 
-            # Raise error for any HTTP response with 4xx or 5xx status
-            response.raise_for_status()
+        # Raise error for any HTTP response with 4xx or 5xx status
+        response.raise_for_status()
 
         return JSONResponse(status_code=200, content={"status": "ready"})
 
@@ -66,10 +72,9 @@ async def metrics_endpoint(request: Request) -> PlainTextResponse:
     memory usage, and CPU usage.
     """
     logger.debug("Metrics endpoint called")
-    process = psutil.Process(os.getpid())
-    memory_usage.set(process.memory_info().rss)
-    cpu_usage.set(process.cpu_percent())
+    memory_usage.set(_process.memory_info().rss)
+    cpu_usage.set(_process.cpu_percent())
 
     return PlainTextResponse(
-        generate_latest(), headers={"Content-Type": CONTENT_TYPE_LATEST}
+        generate_latest(registry), headers={"Content-Type": CONTENT_TYPE_LATEST}
     )
@@ -1,16 +1,45 @@
 import logging
 
+import anyio
+
 from config.logging_config import setup_logging
 from config.settings_config import get_settings
+from core import geo_cache, response_cache
+from core.http_client import close_http_client, warmup_openweather
+from enums.mcp_transport import McpTransport
 from weather_mcp.server import mcp
 
 setup_logging()
 
 logger = logging.getLogger(__name__)
 
+settings = get_settings()
+
+
+async def serve() -> None:
+    """
+    Runs the MCP server with the configured transport and closes the shared
+    HTTP client and the geocoding and response disk caches once the server stops.
+
+    Connections to OpenWeather are warmed up alongside server startup, so the
+    first tool call does not pay for the TCP and TLS handshakes.
+    """
+    try:
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(warmup_openweather)
+            if settings.mcp_transport == McpTransport.STDIO:
+                await mcp.run_stdio_async()
+            else:
+                await mcp.run_streamable_http_async()
+    finally:
+        await close_http_client()
+        geo_cache.close()
+        response_cache.close()
+
+
 if __name__ == "__main__":
     import weather_mcp.custom_routes  # noqa: F401
     import weather_mcp.tools  # noqa: F401
 
-    logger.info(f"Start: {get_settings().mcp_project_info}")
-    mcp.run(transport=get_settings().mcp_transport.value)
+    logger.info("Start: %s", settings.mcp_project_info)
+    anyio.run(serve)
@@ -1,8 +1,12 @@
 import logging
+import math
+import time
+from array import array
 from typing import Annotated, Any
 
 from mcp.server.fastmcp import Context
-from pydantic import Field
+from mcp.server.fastmcp.exceptions import ToolError
+from pydantic import BaseModel, Field
 
 from core.annotated import (
     ANNOTATED_CITY,
@@ -10,11 +14,19 @@ from core.annotated import (
     ANNOTATED_LAT,
     ANNOTATED_LON,
     ANNOTATED_STATE_CODE,
+    MAX_BATCH_LOCATIONS,
 )
+from core.cache import TTLCache
+from core.utils import normalize_text
 from enums.openweather import OpenWeatherEndpoint
 from weather_mcp.server import mcp
-from weather_mcp.tools.geocoding import _get_geo_by_location
-from weather_mcp.utils import call_openweather_api
+from weather_mcp.tools.geocoding import _resolve_city
+from weather_mcp.utils import (
+    COORD_PRECISION,
+    HISTORY_FINAL_AFTER,
+    call_openweather_api,
+    gather_bounded,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -35,33 +47,229 @@ ANNOTATED_END = Annotated[
     ),
 ]
 
+_DAY = 24 * 60 * 60
+
+# Finalized UTC days of historical air pollution data, keyed by rounded coordinates
+# and the day's start; values are (coord, packed records)
+_history_cache = TTLCache(maxsize=4096, ttl=math.inf)
 
-async def _get_current_air_pollution_by_geo(
-    lat: float, lon: float, mcp_ctx: Context
-) -> dict[str, Any]:
-    params = {"lat": lat, "lon": lon}
-    return await call_openweather_api(
-        OpenWeatherEndpoint.CURRENT_AIR_POLLUTION, params, mcp_ctx=mcp_ctx
-    )
 
+class CityLocation(BaseModel):
+    city: ANNOTATED_CITY
+    state_code: ANNOTATED_STATE_CODE
+    country_code: ANNOTATED_COUNTRY_CODE
 
-async def _get_forecast_air_pollution_by_geo(
-    lat: float, lon: float, mcp_ctx: Context
+
+async def _get_air_pollution_by_geo(
+    endpoint: OpenWeatherEndpoint,
+    lat: float,
+    lon: float,
+    mcp_ctx: Context,
+    extra: dict[str, Any] | None = None,
 ) -> dict[str, Any]:
-    params = {"lat": lat, "lon": lon}
-    return await call_openweather_api(
-        OpenWeatherEndpoint.FORECAST_AIR_POLLUTION, params, mcp_ctx=mcp_ctx
-    )
+    params = {"lat": lat, "lon": lon, **extra} if extra else {"lat": lat, "lon": lon}
+
+    return await call_openweather_api(endpoint, params, mcp_ctx=mcp_ctx)
+
+
+def _to_columns(response: dict[str, Any]) -> dict[str, Any]:
+    """
+    Converts an air pollution response into one list per field.
+
+    Args:
+        response (dict): Response of an air pollution endpoint.
+
+    Returns:
+        dict: ``coord``, ``dt`` and ``aqi`` plus one list per pollutant, aligned by index.
+    """
+    records = response.get("list", [])
+    components = records[0].get("components", {}) if records else {}
+
+    columns: dict[str, Any] = {
+        "coord": response.get("coord"),
+        "dt": [record["dt"] for record in records],
+        "aqi": [record["main"]["aqi"] for record in records],
+    }
+    for name in components:
+        columns[name] = [record["components"].get(name) for record in records]
+    return columns
+
+
+def _pack_records(records: list[dict[str, Any]]) -> Any:
+    """
+    Packs air pollution records into typed arrays for compact cache storage.
+
+    Timestamps are stored as int64, AQI as uint8 and concentrations as float64, or
+    int64 for components whose values are all integers, which takes a fraction of the
+    memory of the equivalent dicts of Python objects. Records that do not have the
+    usual shape, or mix integer and float values within a component, are returned
+    unchanged so they serialize exactly as fetched.
+
+    Args:
+        records (list): Records of an air pollution response.
+
+    Returns:
+        tuple | list: (dt, aqi, {component: values}) arrays, or the original records.
+    """
+    if not records:
+        return records
+
+    names = tuple(records[0].get("components", {}))
+    try:
+        if any(
+            record.keys() != {"dt", "main", "components"}
+            or record["main"].keys() != {"aqi"}
+            or tuple(record["components"]) != names
+            for record in records
+        ):
+            return records
+
+        columns: dict[str, array] = {}
+        for name in names:
+            values = [record["components"][name] for record in records]
+            value_types = {type(value) for value in values}
+            if value_types == {float}:
+                columns[name] = array("d", values)
+            elif value_types == {int}:
+                columns[name] = array("q", values)
+            else:
+                return records
+
+        return (
+            array("q", [record["dt"] for record in records]),
+            array("B", [record["main"]["aqi"] for record in records]),
+            columns,
+        )
+    except (AttributeError, TypeError, OverflowError):
+        return records
+
+
+def _unpack_records(packed: Any) -> list[dict[str, Any]]:
+    """
+    Rebuilds air pollution records packed by ``_pack_records``.
+
+    Args:
+        packed (tuple | list): Packed arrays, or records stored unchanged.
+
+    Returns:
+        list: The air pollution records.
+    """
+    if isinstance(packed, list):
+        return packed
+
+    dts, aqis, components = packed
+    return [
+        {
+            "main": {"aqi": aqis[i]},
+            "components": {name: values[i] for name, values in components.items()},
+            "dt": dts[i],
+        }
+        for i in range(len(dts))
+    ]
+
+
+def _cache_history_days(
+    rlat: float, rlon: float, start: int, end: int, response: dict[str, Any]
+) -> list[dict[str, Any]]:
+    """
+    Caches the final UTC days fully covered by a historical air pollution response.
+
+    Args:
+        rlat (float): Rounded latitude.
+        rlon (float): Rounded longitude.
+        start (int): Start of the fetched range as a Unix timestamp (inclusive).
+        end (int): End of the fetched range as a Unix timestamp (inclusive).
+        response (dict): Response of the history endpoint for the range.
+
+    Returns:
+        list: The response records within the fetched range.
+    """
+    records = [
+        record for record in response.get("list", []) if start <= record["dt"] <= end
+    ]
+
+    by_day: dict[int, list[dict[str, Any]]] = {}
+    for record in records:
+        by_day.setdefault(record["dt"] - record["dt"] % _DAY, []).append(record)
 
+    final_before = time.time() - HISTORY_FINAL_AFTER
+    first_day = start + (-start % _DAY)
+    for bucket in range(first_day, end + 2 - _DAY, _DAY):
+        if bucket + _DAY <= final_before:
+            _history_cache.set(
+                (rlat, rlon, bucket),
+                (response.get("coord"), _pack_records(by_day.get(bucket, []))),
+            )
+    return records
 
-async def _get_historical_air_pollution_by_geo(
+
+async def _get_historical_air_pollution(
     lat: float, lon: float, start: int, end: int, mcp_ctx: Context
 ) -> dict[str, Any]:
-    params = {"lat": lat, "lon": lon, "start": start, "end": end}
+    """
+    Fetches historical air pollution data, reusing previously fetched days.
 
-    return await call_openweather_api(
-        OpenWeatherEndpoint.HISTORICAL_AIR_POLLUTION, params, mcp_ctx=mcp_ctx
-    )
+    The range is split into UTC day buckets. Days that are final (older than
+    ``HISTORY_FINAL_AFTER``) are cached once fetched. A single request covers the
+    span from the first to the last uncached day, and cached days outside that span
+    are served from the cache.
+
+    Args:
+        lat (float): Latitude.
+        lon (float): Longitude.
+        start (int): Start of the range as a Unix timestamp (inclusive).
+        end (int): End of the range as a Unix timestamp (inclusive).
+        mcp_ctx (Context): MCP context for logging and progress reporting.
+
+    Returns:
+        dict: Response in the same format as the history endpoint.
+    """
+    endpoint = OpenWeatherEndpoint.HISTORICAL_AIR_POLLUTION
+    # Let the API report invalid ranges
+    if start > end:
+        return await _get_air_pollution_by_geo(
+            endpoint, lat, lon, mcp_ctx, extra={"start": start, "end": end}
+        )
+
+    rlat = round(lat, COORD_PRECISION)
+    rlon = round(lon, COORD_PRECISION)
+    buckets = range(start - start % _DAY, end + 1, _DAY)
+    cached = {bucket: _history_cache.get((rlat, rlon, bucket)) for bucket in buckets}
+    missing = [bucket for bucket in buckets if cached[bucket] is None]
+
+    # Fetch the span of uncached days with one request, keeping a range with
+    # scattered cached days to a single upstream call
+    span: tuple[int, int] | None = None
+    response: dict[str, Any] = {}
+    if missing:
+        span = (max(start, missing[0]), min(end, missing[-1] + _DAY - 1))
+        response = await _get_air_pollution_by_geo(
+            endpoint, lat, lon, mcp_ctx, extra={"start": span[0], "end": span[1]}
+        )
+
+        # The span covers the whole range, so the response can be returned as is
+        if span == (start, end):
+            _cache_history_days(rlat, rlon, start, end, response)
+            return response
+
+    coord = response.get("coord")
+    records: list[dict[str, Any]] = []
+    if span is not None:
+        records.extend(_cache_history_days(rlat, rlon, *span, response))
+
+    for bucket, entry in cached.items():
+        if entry is None or (span is not None and span[0] <= bucket <= span[1]):
+            continue
+
+        coord = coord or entry[0]
+        records.extend(
+            record
+            for record in _unpack_records(entry[1])
+            if start <= record["dt"] <= end
+        )
+
+    records.sort(key=lambda record: record["dt"])
+    return {"coord": coord, "list": records}
 
 
 @mcp.tool()
@@ -144,7 +352,9 @@ async def get_current_air_pollution_by_geo(
     - Real estate: Inform buyers about air quality in different neighborhoods
     - Fitness apps: Recommend indoor/outdoor activities based on air quality
     """
-    return await _get_current_air_pollution_by_geo(lat, lon, ctx)
+    return await _get_air_pollution_by_geo(
+        OpenWeatherEndpoint.CURRENT_AIR_POLLUTION, lat, lon, mcp_ctx=ctx
+    )
 
 
 @mcp.tool()
@@ -233,19 +443,88 @@ async def get_current_air_pollution_by_city(
     - Educational tools: Teaching about global air quality patterns
     - News and media: Reporting on air quality conditions in major cities
     """
-    geo_data = await _get_geo_by_location(
-        city=city,
-        state_code=state_code,
-        country_code=country_code,
-        limit=1,
-        mcp_ctx=ctx,
+    lat, lon = await _resolve_city(city, state_code, country_code, mcp_ctx=ctx)
+
+    return await _get_air_pollution_by_geo(
+        OpenWeatherEndpoint.CURRENT_AIR_POLLUTION, lat, lon, mcp_ctx=ctx
     )
 
-    first_result = geo_data[0]  # type: ignore
-    lat: float = first_result["lat"]
-    lon: float = first_result["lon"]
 
-    return await _get_current_air_pollution_by_geo(lat=lat, lon=lon, mcp_ctx=ctx)
+@mcp.tool()
+async def get_current_air_pollution_bulk(
+    ctx: Context,
+    locations: Annotated[
+        list[CityLocation],
+        Field(
+            max_length=MAX_BATCH_LOCATIONS,
+            description=f"Cities to query (at most {MAX_BATCH_LOCATIONS}).",
+        ),
+    ],
+) -> list[dict[str, Any]]:
+    """
+    **Function Description**
+    Retrieves current air quality data for several cities in one call. Geocoding and
+    pollution requests for all cities run concurrently (bounded by the
+    OPENWEATHER_MAX_CONCURRENCY setting), so the total latency is close to that of a
+    single city instead of growing with the number of cities. Duplicate locations are
+    fetched only once.
+
+    **Args/Returns/Raises**
+    Args:
+        locations (list): Cities to query (at most 50), each with:
+            - city (str): Name of the city (e.g., "New York", "London", "Tokyo")
+            - state_code (str): State/province code in ISO 3166-2 format (e.g., "NY")
+            - country_code (str): Country code in ISO 3166-1 alpha-2 format (e.g., "US")
+
+    Returns:
+        list: One entry per input location, in the same order. Each entry is either the
+            same response as get_current_air_pollution_by_city, or {"error": message}
+            if that location could not be resolved or fetched.
+
+    **Usage Examples**
+    ```python
+    results = await get_current_air_pollution_bulk([
+        {"city": "London", "state_code": "ENG", "country_code": "GB"},
+        {"city": "Paris", "state_code": "IDF", "country_code": "FR"},
+    ])
+    aqis = [r["list"][0]["main"]["aqi"] for r in results if "error" not in r]
+    ```
+    """
+
+    async def _fetch(location: CityLocation) -> dict[str, Any]:
+        lat, lon = await _resolve_city(
+            location.city, location.state_code, location.country_code, mcp_ctx=ctx
+        )
+        return await _get_air_pollution_by_geo(
+            OpenWeatherEndpoint.CURRENT_AIR_POLLUTION, lat, lon, mcp_ctx=ctx
+        )
+
+    # Fetch each distinct location once
+    keys = [
+        (
+            normalize_text(location.city),
+            normalize_text(location.state_code),
+            normalize_text(location.country_code),
+        )
+        for location in locations
+    ]
+    unique = dict(zip(keys, locations))
+    results = dict(
+        zip(unique, await gather_bounded(_fetch(loc) for loc in unique.values()))
+    )
+
+    responses: list[dict[str, Any]] = []
+    for key in keys:
+        result = results[key]
+        if isinstance(result, IndexError):
+            responses.append({"error": "Location not found."})
+        elif isinstance(result, ToolError):
+            responses.append({"error": str(result)})
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            responses.append(result)
+    return responses
 
 
 @mcp.tool()
@@ -342,7 +621,9 @@ async def get_forecast_air_pollution_by_geo(
     - Environmental compliance: Predict when pollution levels may exceed thresholds
     - Sports scheduling: Plan outdoor sports events for optimal air quality conditions
     """
-    return await _get_forecast_air_pollution_by_geo(lat, lon, mcp_ctx=ctx)
+    return await _get_air_pollution_by_geo(
+        OpenWeatherEndpoint.FORECAST_AIR_POLLUTION, lat, lon, mcp_ctx=ctx
+    )
 
 
 @mcp.tool()
@@ -437,15 +718,11 @@ async def get_forecast_air_pollution_by_city(
     - Media and journalism: Report on upcoming air quality conditions in major cities
     - International events: Plan conferences, sports events based on air quality forecasts
     """
-    geo_data = await _get_geo_by_location(
-        city, state_code, country_code, limit=1, mcp_ctx=ctx
-    )
-
-    first_result = geo_data[0]  # type: ignore
-    lat: float = first_result["lat"]
-    lon: float = first_result["lon"]
+    lat, lon = await _resolve_city(city, state_code, country_code, mcp_ctx=ctx)
 
-    return await _get_forecast_air_pollution_by_geo(lat, lon, mcp_ctx=ctx)
+    return await _get_air_pollution_by_geo(
+        OpenWeatherEndpoint.FORECAST_AIR_POLLUTION, lat, lon, mcp_ctx=ctx
+    )
 
 
 @mcp.tool()
@@ -553,7 +830,56 @@ async def get_historical_air_pollution_by_geo(
     - Academic research: Environmental science and public health policy studies
     - Policy evaluation: Assess effectiveness of pollution control measures over time
     """
-    return await _get_historical_air_pollution_by_geo(lat, lon, start, end, mcp_ctx=ctx)
+    return await _get_historical_air_pollution(lat, lon, start, end, mcp_ctx=ctx)
+
+
+@mcp.tool()
+async def get_historical_air_pollution_columns_by_geo(
+    ctx: Context,
+    lat: ANNOTATED_LAT,
+    lon: ANNOTATED_LON,
+    start: ANNOTATED_START,
+    end: ANNOTATED_END,
+) -> dict[str, Any]:
+    """
+    **Function Description**
+    Retrieves the same historical air pollution data as get_historical_air_pollution_by_geo,
+    but in a columnar layout: one array per field instead of one object per hour. Long
+    ranges (30+ days of hourly data) are much smaller this way, and aggregates such as
+    mean or max AQI can be computed directly over a single array.
+
+    **Args/Returns/Raises**
+    Args:
+        lat (float): Latitude coordinate in decimal degrees (-90.0 to 90.0)
+        lon (float): Longitude coordinate in decimal degrees (-180.0 to 180.0)
+        start (int): Start date as Unix timestamp (inclusive)
+        end (int): End date as Unix timestamp (inclusive, max 1 year from start)
+
+    Returns:
+        dict: Columnar historical air pollution data containing:
+            - coord: Dictionary with lat/lon coordinates
+            - dt: Array of Unix timestamps, one per measurement
+            - aqi: Array of AQI values (1-5 scale), aligned with dt
+            - co, no, no2, o3, so2, pm2_5, pm10, nh3: Arrays of pollutant
+              concentrations in μg/m³, aligned with dt
+
+    Raises:
+        APIError: If OpenWeatherMap API request fails
+        NetworkError: If network connectivity issues occur
+
+    **Usage Examples**
+    ```python
+    import statistics
+
+    historical = await get_historical_air_pollution_columns_by_geo(
+        40.7128, -74.0060, start_time, end_time
+    )
+    avg_aqi = statistics.mean(historical['aqi'])
+    peak_pm25 = max(historical['pm2_5'])
+    ```
+    """
+    historical = await _get_historical_air_pollution(lat, lon, start, end, mcp_ctx=ctx)
+    return _to_columns(historical)
 
 
 @mcp.tool()
@@ -669,12 +995,6 @@ async def get_historical_air_pollution_by_city(
     - Climate change research: Study long-term pollution trends in urban areas
     - Investment analysis: Assess environmental factors for real estate and business investments
     """
-    geo_data = await _get_geo_by_location(
-        city, state_code, country_code, limit=1, mcp_ctx=ctx
-    )
-
-    first_result = geo_data[0]  # type: ignore
-    lat: float = first_result["lat"]
-    lon: float = first_result["lon"]
+    lat, lon = await _resolve_city(city, state_code, country_code, mcp_ctx=ctx)
 
-    return await _get_historical_air_pollution_by_geo(lat, lon, start, end, mcp_ctx=ctx)
+    return await _get_historical_air_pollution(lat, lon, start, end, mcp_ctx=ctx)
@@ -1,7 +1,8 @@
 import logging
-from typing import Any
+from typing import Annotated, Any, Optional
 
 from mcp.server.fastmcp import Context
+from pydantic import BaseModel, Field, model_validator
 
 from core.annotated import (
     ANNOTATED_CITY,
@@ -9,14 +10,57 @@ from core.annotated import (
     ANNOTATED_LAT,
     ANNOTATED_LON,
     ANNOTATED_OPTIONAL_COUNTRY_CODE,
+    MAX_BATCH_LOCATIONS,
 )
 from enums.openweather import OpenWeatherEndpoint
 from weather_mcp.server import mcp
-from weather_mcp.utils import call_openweather_api
+from weather_mcp.utils import (
+    call_openweather_api,
+    call_openweather_api_batch,
+    get_city_query,
+)
 
 logger = logging.getLogger(__name__)
 
 
+class WeatherLocation(BaseModel):
+    lat: Optional[ANNOTATED_LAT] = None
+    lon: Optional[ANNOTATED_LON] = None
+    city: Optional[ANNOTATED_CITY] = None
+    country_code: ANNOTATED_OPTIONAL_COUNTRY_CODE = None
+
+    @model_validator(mode="after")
+    def _check_location(self) -> "WeatherLocation":
+        # Either a coordinate pair or a city name identifies the location
+        if (self.lat is None) != (self.lon is None):
+            raise ValueError("lat and lon must be given together")
+        if self.lat is None and self.city is None:
+            raise ValueError("Either lat and lon or city must be given")
+        return self
+
+    def to_params(self) -> dict[str, Any]:
+        """
+        Builds the OpenWeather query parameters identifying this location.
+
+        Coordinates take precedence over the city name.
+
+        Returns:
+            dict: Either the lat and lon parameters or the q city query.
+        """
+        if self.lat is not None or self.city is None:
+            return {"lat": self.lat, "lon": self.lon}
+        return {"q": get_city_query(self.city, self.country_code)}
+
+
+ANNOTATED_LOCATIONS = Annotated[
+    list[WeatherLocation],
+    Field(
+        max_length=MAX_BATCH_LOCATIONS,
+        description=f"Locations to query (at most {MAX_BATCH_LOCATIONS}), each given by lat and lon or by city and optional country_code.",
+    ),
+]
+
+
 @mcp.tool()
 async def get_current_weather_by_geo(
     ctx: Context,
@@ -190,9 +234,52 @@ async def get_current_weather_by_city(
         - International business apps showing weather at office locations
         - Event management platforms for venue weather checking
     """
-    location = f"{city},{country_code}" if country_code else city
-    params = {"q": location, "lang": lang}
+    params = {"q": get_city_query(city, country_code), "lang": lang}
 
     return await call_openweather_api(
         OpenWeatherEndpoint.CURRENT_WEATHER, params, mcp_ctx=ctx
     )
+
+
+@mcp.tool()
+async def get_current_weather_batch(
+    ctx: Context,
+    locations: ANNOTATED_LOCATIONS,
+    lang: ANNOTATED_LANG = "en",
+) -> list[dict[str, Any]]:
+    """
+    Get current weather conditions for several locations in one call.
+
+    **Function Description:**
+    Retrieves real-time weather data for a list of locations, each given either by
+    coordinates or by city name. Requests run concurrently (bounded by the
+    OPENWEATHER_MAX_CONCURRENCY setting) and share the cache and rate limiter with the
+    single-location tools, so the total latency is close to that of one location
+    instead of growing with the number of locations. Duplicate locations are fetched
+    only once.
+
+    **Args:**
+        locations (list): Locations to query (at most 50), each with either:
+            - lat (float) and lon (float): Geographic coordinates, or
+            - city (str) and optional country_code (str): City name and ISO 3166-1
+              alpha-2 country code, as for get_current_weather_by_city
+        lang (str, optional): Language code for weather descriptions. Defaults to "en" (English).
+
+    **Returns:**
+        list: One entry per input location, in the same order. Each entry is either the
+            same response as get_current_weather_by_geo / get_current_weather_by_city,
+            or {"error": message} if that location could not be fetched.
+
+    **Usage Examples:**
+        results = await get_current_weather_batch([
+            {"lat": 35.6762, "lon": 139.6503},
+            {"city": "London", "country_code": "GB"},
+        ])
+        temps = [r["main"]["temp"] for r in results if "error" not in r]
+    """
+
+    return await call_openweather_api_batch(
+        OpenWeatherEndpoint.CURRENT_WEATHER,
+        [{**location.to_params(), "lang": lang} for location in locations],
+        mcp_ctx=ctx,
+    )
@@ -1,7 +1,8 @@
 import logging
-from typing import Any
+from typing import Annotated, Any, Optional
 
 from mcp.server.fastmcp import Context
+from pydantic import Field
 
 from core.annotated import (
     ANNOTATED_CITY,
@@ -10,12 +11,96 @@ from core.annotated import (
     ANNOTATED_LON,
     ANNOTATED_OPTIONAL_COUNTRY_CODE,
 )
+from core.cache import TTLCache
+from core.utils import normalize_text
 from enums.openweather import OpenWeatherEndpoint
 from weather_mcp.server import mcp
-from weather_mcp.utils import call_openweather_api
+from weather_mcp.tools.current_weather import ANNOTATED_LOCATIONS
+from weather_mcp.utils import (
+    alias_cached_response,
+    call_openweather_api,
+    call_openweather_api_batch,
+    get_city_query,
+)
 
 logger = logging.getLogger(__name__)
 
+# Coordinates OpenWeather resolved for a city query, keyed by the normalized query.
+# Repeat city forecasts are requested by coordinates, so they share cache entries
+# with get_forecast_by_geo.
+_city_coords = TTLCache(maxsize=1024, ttl=24 * 60 * 60)
+
+ANNOTATED_FIELDS = Annotated[
+    Optional[frozenset[str]],
+    Field(
+        default=None,
+        description="Forecast entry fields to return (e.g., ['main', 'pop']); 'dt' is always included. Defaults to None (all fields).",
+    ),
+]
+
+ANNOTATED_SUMMARY = Annotated[
+    bool,
+    Field(
+        default=False,
+        description="Return a compact summary (time, temperature, precipitation chance and condition per entry) instead of the full forecast. Takes precedence over fields. Defaults to False.",
+    ),
+]
+
+
+def _select_fields(
+    response: dict[str, Any], fields: frozenset[str] | None
+) -> dict[str, Any]:
+    """
+    Keeps only the requested fields of each forecast entry.
+
+    The cached response is not modified; a trimmed copy is returned instead.
+
+    Args:
+        response (dict): Forecast response.
+        fields (frozenset[str] | None): Entry fields to keep, besides ``dt``. None keeps
+            all fields.
+
+    Returns:
+        dict: The response with trimmed forecast entries.
+    """
+    if fields is None:
+        return response
+
+    keep = fields | {"dt"}
+    return {
+        **response,
+        "list": [
+            {key: value for key, value in entry.items() if key in keep}
+            for entry in response.get("list", [])
+        ],
+    }
+
+
+def _summarize(response: dict[str, Any]) -> dict[str, Any]:
+    """
+    Reduces a forecast response to a compact summary.
+
+    Args:
+        response (dict): Forecast response.
+
+    Returns:
+        dict: The ``cnt`` and ``city`` of the response, and for each forecast entry
+            its ``dt``, ``temp``, ``pop`` and main weather condition ``cond``.
+    """
+    return {
+        "cnt": response.get("cnt"),
+        "city": response.get("city"),
+        "list": [
+            {
+                "dt": entry.get("dt"),
+                "temp": entry.get("main", {}).get("temp"),
+                "pop": entry.get("pop"),
+                "cond": (entry.get("weather") or [{}])[0].get("main"),
+            }
+            for entry in response.get("list", [])
+        ],
+    }
+
 
 @mcp.tool()
 async def get_forecast_by_geo(
@@ -23,6 +108,8 @@ async def get_forecast_by_geo(
     lat: ANNOTATED_LAT,
     lon: ANNOTATED_LON,
     lang: ANNOTATED_LANG = "en",
+    fields: ANNOTATED_FIELDS = None,
+    summary: ANNOTATED_SUMMARY = False,
 ) -> dict[str, Any]:
     """
     Get 5-day weather forecast with 3-hour intervals for a specific geographic location using coordinates.
@@ -44,6 +131,12 @@ async def get_forecast_by_geo(
                               Supports 40+ languages: en, es, fr, de, it, pt, ru, ja, zh_cn, zh_tw,
                               ar, bg, ca, cz, da, el, fa, fi, gl, he, hi, hr, hu, kr, la, lt, lv,
                               mk, nl, no, pl, ro, sk, sl, sv, th, tr, ua, vi, zu
+        fields (frozenset[str] | None, optional): Forecast entry fields to return, e.g.
+                              {"main", "pop"} for temperatures and precipitation chance.
+                              "dt" is always included. Defaults to None (all fields).
+        summary (bool, optional): Return only dt, temp, pop and the main condition per entry,
+                              plus cnt and city (~10x smaller). Takes precedence over fields.
+                              Defaults to False.
 
     **Returns:**
         dict: 5-day/3-hour forecast data containing:
@@ -200,7 +293,12 @@ async def get_forecast_by_geo(
         - Marine and aviation weather services requiring intermediate-term detailed forecasts
     """
     params = {"lat": lat, "lon": lon, "lang": lang}
-    return await call_openweather_api(OpenWeatherEndpoint.FORECAST, params, mcp_ctx=ctx)
+    response = await call_openweather_api(
+        OpenWeatherEndpoint.FORECAST, params, mcp_ctx=ctx
+    )
+    if summary:
+        return _summarize(response)
+    return _select_fields(response, fields)
 
 
 @mcp.tool()
@@ -209,6 +307,8 @@ async def get_forecast_by_city(
     city: ANNOTATED_CITY,
     country_code: ANNOTATED_OPTIONAL_COUNTRY_CODE = None,
     lang: ANNOTATED_LANG = "en",
+    fields: ANNOTATED_FIELDS = None,
+    summary: ANNOTATED_SUMMARY = False,
 ) -> dict[str, Any]:
     """
     Get 5-day weather forecast with 3-hour intervals for a city by name with optional country specification.
@@ -220,6 +320,8 @@ async def get_forecast_by_city(
     maintaining full temporal resolution. Automatically handles city name resolution, geocoding, timezone
     determination, and location disambiguation when combined with country codes. Perfect for applications
     where users specify locations by familiar city names rather than coordinates.
+    The coordinates resolved for a city are remembered for a day, so repeat queries for the same city are
+    requested by coordinates and share cached forecasts with get_forecast_by_geo.
 
     **Args:**
         city (str): City name (e.g., "London", "New York", "São Paulo", "東京").
@@ -233,6 +335,12 @@ async def get_forecast_by_city(
                               Supports 40+ languages: en, es, fr, de, it, pt, ru, ja, zh_cn, zh_tw,
                               ar, bg, ca, cz, da, el, fa, fi, gl, he, hi, hr, hu, kr, la, lt, lv,
                               mk, nl, no, pl, ro, sk, sl, sv, th, tr, ua, vi, zu
+        fields (frozenset[str] | None, optional): Forecast entry fields to return, e.g.
+                              {"main", "pop"} for temperatures and precipitation chance.
+                              "dt" is always included. Defaults to None (all fields).
+        summary (bool, optional): Return only dt, temp, pop and the main condition per entry,
+                              plus cnt and city (~10x smaller). Takes precedence over fields.
+                              Defaults to False.
 
     **Returns:**
         dict: Complete 5-day/3-hour forecast structure identical to get_forecast_by_geo():
@@ -398,7 +506,76 @@ async def get_forecast_by_city(
         - Educational applications teaching weather patterns and climate analysis for global cities
         - Emergency management systems for multi-city weather preparedness and response planning
     """
-    location = f"{city},{country_code}" if country_code else city
-    params = {"q": location, "lang": lang}
+    query = get_city_query(city, country_code)
+    key = normalize_text(query)
+
+    # Reuse the coordinates of an earlier lookup of the same city
+    coords = _city_coords.get(key)
+    if coords is not None:
+        params = {"lat": coords[0], "lon": coords[1], "lang": lang}
+    else:
+        params = {"q": query, "lang": lang}
+
+    response = await call_openweather_api(
+        OpenWeatherEndpoint.FORECAST, params, mcp_ctx=ctx
+    )
+
+    # Remember the resolved coordinates and share the response with them, so the
+    # next call is served from the cache by coordinates
+    coord = response.get("city", {}).get("coord")
+    if coords is None and coord:
+        _city_coords.set(key, (coord["lat"], coord["lon"]))
+        await alias_cached_response(
+            OpenWeatherEndpoint.FORECAST,
+            params,
+            {"lat": coord["lat"], "lon": coord["lon"], "lang": lang},
+        )
+    if summary:
+        return _summarize(response)
+    return _select_fields(response, fields)
 
-    return await call_openweather_api(OpenWeatherEndpoint.FORECAST, params, mcp_ctx=ctx)
+
+@mcp.tool()
+async def get_forecast_batch(
+    ctx: Context,
+    locations: ANNOTATED_LOCATIONS,
+    lang: ANNOTATED_LANG = "en",
+) -> list[dict[str, Any]]:
+    """
+    Get 5-day weather forecasts with 3-hour intervals for several locations in one call.
+
+    **Function Description:**
+    Retrieves forecasts for a list of locations, each given either by coordinates or by
+    city name. Requests run concurrently (bounded by the OPENWEATHER_MAX_CONCURRENCY
+    setting) and share the cache and rate limiter with the single-location tools, so
+    the total latency is close to that of one location instead of growing with the
+    number of locations. Duplicate locations are fetched only once.
+
+    **Args:**
+        locations (list): Locations to query (at most 50), each with either:
+            - lat (float) and lon (float): Geographic coordinates, or
+            - city (str) and optional country_code (str): City name and ISO 3166-1
+              alpha-2 country code, as for get_forecast_by_city
+        lang (str, optional): Language code for weather descriptions. Defaults to "en" (English).
+
+    **Returns:**
+        list: One entry per input location, in the same order. Each entry is either the
+            same response as get_forecast_by_geo / get_forecast_by_city, or
+            {"error": message} if that location could not be fetched.
+
+    **Usage Examples:**
+        forecasts = await get_forecast_batch([
+            {"city": "London", "country_code": "GB"},
+            {"city": "Paris", "country_code": "FR"},
+        ])
+        rain = [
+            any("rain" in item for item in f["list"])
+            for f in forecasts
+            if "error" not in f
+        ]
+    """
+    return await call_openweather_api_batch(
+        OpenWeatherEndpoint.FORECAST,
+        [{**location.to_params(), "lang": lang} for location in locations],
+        mcp_ctx=ctx,
+    )
@@ -11,6 +11,9 @@ from core.annotated import (
     ANNOTATED_LON,
     ANNOTATED_STATE_CODE,
 )
+from core import geo_cache
+from core.cache import SingleFlight, TTLCache
+from core.utils import normalize_text
 from enums.openweather import OpenWeatherEndpoint
 from weather_mcp.server import mcp
 from weather_mcp.utils import call_openweather_api
@@ -29,6 +32,13 @@ ANNOTATED_LIMIT = Annotated[
 ]
 
 
+# Resolved city coordinates, keyed by the normalized (city, state, country) triple.
+# Administrative boundaries rarely move, so entries are kept for 30 days.
+_geo_cache = TTLCache(maxsize=10_000, ttl=30 * 24 * 60 * 60)
+# Concurrent misses for the same city share a single lookup
+_geo_inflight = SingleFlight()
+
+
 async def _get_geo_by_location(
     city: str,
     state_code: str,
@@ -43,6 +53,58 @@ async def _get_geo_by_location(
     )
 
 
+async def _resolve_city(
+    city: str, state_code: str, country_code: str, mcp_ctx: Context
+) -> tuple[float, float]:
+    """
+    Resolves a city to its coordinates.
+
+    Lookups go through the in-memory cache, then the on-disk cache, then the
+    geocoding API. Results from the API are written through to both caches.
+
+    Args:
+        city (str): City name.
+        state_code (str): State code.
+        country_code (str): Country code.
+        mcp_ctx (Context): MCP context for logging and progress reporting.
+
+    Returns:
+        tuple[float, float]: Latitude and longitude of the best match.
+
+    Raises:
+        IndexError: If geocoding returns no results.
+    """
+    key = (
+        normalize_text(city),
+        normalize_text(state_code),
+        normalize_text(country_code),
+    )
+
+    coords = _geo_cache.get(key)
+    if coords is not None:
+        return coords
+
+    async def _lookup() -> tuple[float, float]:
+        # Fall back to the on-disk cache, which survives restarts
+        coords = await geo_cache.get(key)
+        if coords is not None:
+            _geo_cache.set(key, coords)
+            return coords
+
+        # Fall back to the geocoding API and write through to both caches
+        geo_data = await _get_geo_by_location(
+            city, state_code, country_code, limit=1, mcp_ctx=mcp_ctx
+        )
+
+        first_result = geo_data[0]  # type: ignore
+        coords = (first_result["lat"], first_result["lon"])
+        _geo_cache.set(key, coords)
+        await geo_cache.set(key, *coords)
+        return coords
+
+    return await _geo_inflight.do(key, _lookup)
+
+
 @mcp.tool()
 async def get_geo_by_location(
     ctx: Context,
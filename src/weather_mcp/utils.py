@@ -1,15 +1,266 @@
+import asyncio
 import logging
+import math
+import random
+import time
+from collections.abc import Awaitable, Iterable
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
 from typing import Any
 
 import httpx
+import orjson
 from mcp.server.fastmcp import Context
 from mcp.server.fastmcp.exceptions import ToolError
 
 from config.settings_config import get_settings
+from core import response_cache
+from core.aimd_gate import AIMDGate, CircuitOpenError
+from core.cache import LFUTTLCache, SingleFlight, TTLCache
+from core.http_client import get_http_client
+from core.monitoring import cache_requests_counter
+from core.rate_limiter import AsyncRateLimiter
+from core.utils import normalize_text
 from enums.openweather import OpenWeatherEndpoint
 
 logger = logging.getLogger(__name__)
 
+# Settings used on every request, resolved once at import
+settings = get_settings()
+_API_KEY = settings.openweather_api_key
+_BASE_URL = str(settings.openweather_base_url).rstrip("/")
+_GEO_BASE_URL = str(settings.openweather_geo_base_url).rstrip("/")
+
+# Endpoints served from the geocoding API base URL
+_GEO_ENDPOINTS = frozenset(
+    {OpenWeatherEndpoint.DIRECT_GEOCODING, OpenWeatherEndpoint.REVERSE_GEOCODING}
+)
+
+# Response time-to-live per endpoint, in seconds; other endpoints are not cached.
+# OpenWeather refreshes current weather every ~10 minutes, forecasts a few times a
+# day and air pollution data roughly hourly.
+_RESPONSE_TTLS: dict[OpenWeatherEndpoint, float] = {
+    OpenWeatherEndpoint.CURRENT_WEATHER: 5 * 60,
+    OpenWeatherEndpoint.FORECAST: 30 * 60,
+    OpenWeatherEndpoint.CURRENT_AIR_POLLUTION: 10 * 60,
+    OpenWeatherEndpoint.FORECAST_AIR_POLLUTION: 60 * 60,
+    OpenWeatherEndpoint.HISTORICAL_AIR_POLLUTION: 10 * 60,
+}
+# How long past its TTL a response may still be served while it is refreshed in the
+# background, in seconds
+_STALE_TTLS: dict[OpenWeatherEndpoint, float] = {
+    OpenWeatherEndpoint.CURRENT_WEATHER: 5 * 60,
+    OpenWeatherEndpoint.FORECAST: 90 * 60,
+}
+# Historical data ending longer ago than this no longer changes
+HISTORY_FINAL_AFTER = 24 * 60 * 60
+# Coordinates are rounded to 0.01° (~1 km) in cache keys, matching the air pollution
+# grid; weather and forecast keys keep 0.001° (~110 m), well within a weather cell
+COORD_PRECISION = 2
+_COORD_PRECISIONS: dict[OpenWeatherEndpoint, int] = {
+    OpenWeatherEndpoint.CURRENT_WEATHER: 3,
+    OpenWeatherEndpoint.FORECAST: 3,
+}
+
+# Evicts by use count so popular locations survive bursts of one-off coordinates
+_response_cache = LFUTTLCache(maxsize=2048, ttl=10 * 60)
+# Requests the API answered with 404, remembered briefly so repeated lookups of an
+# unknown location do not each cost a round trip
+_not_found_cache = TTLCache(maxsize=1024, ttl=60)
+# Concurrent identical requests share one network call
+_inflight = SingleFlight()
+# Background refreshes of stale responses, by cache key, and how many may call the
+# API at once so they leave room for requests a caller is waiting on
+_refreshes: dict[Any, asyncio.Task] = {}
+_refresh_semaphore = asyncio.Semaphore(4)
+# Relative spread applied to response ttls so entries cached together do not all
+# expire at the same moment
+_TTL_JITTER = 0.1
+
+# Outgoing requests per minute allowed by the OpenWeather plan
+_rate_limiter = AsyncRateLimiter(settings.openweather_rpm, time_period=60)
+
+# Adaptive concurrency limit, starting at the configured concurrency and capped at
+# the HTTP client's connection pool; shrinks when mean latency exceeds half the
+# request timeout, and stops calling a failing upstream for a while
+_gate = AIMDGate(
+    initial=settings.openweather_max_concurrency,
+    maximum=64,
+    latency_target=1.0,
+)
+
+# Retries of rate-limited (429) requests, and the longest wait worth retrying after
+_MAX_RETRIES = 2
+_MAX_RETRY_DELAY = 10.0
+_DEFAULT_RETRY_DELAY = 1.0
+
+
+class LocationNotFoundError(ToolError):
+    """
+    Raised when the OpenWeather API has no data for the requested location.
+    """
+
+
+@lru_cache(maxsize=None)
+def _get_endpoint_url(endpoint: OpenWeatherEndpoint) -> httpx.URL:
+    """
+    Builds the full URL of an OpenWeather API endpoint.
+
+    The result is cached per endpoint as a parsed ``httpx.URL``, so the URL is only
+    built and parsed once instead of on every request.
+
+    Args:
+        endpoint (OpenWeatherEndpoint): The API endpoint.
+
+    Returns:
+        httpx.URL: The full URL of the endpoint.
+    """
+    base_url = _GEO_BASE_URL if endpoint in _GEO_ENDPOINTS else _BASE_URL
+    return httpx.URL(f"{base_url}/{endpoint.value}")
+
+
+def _get_response_ttl(
+    endpoint: OpenWeatherEndpoint, params: dict[str, Any]
+) -> float | None:
+    """
+    Returns how long a response for the given request may be cached.
+
+    Args:
+        endpoint (OpenWeatherEndpoint): The API endpoint.
+        params (dict): Query parameters of the request.
+
+    Returns:
+        float | None: Time-to-live in seconds, or None if the response is not cached.
+    """
+    ttl = _RESPONSE_TTLS.get(endpoint)
+
+    # Past air pollution data is immutable, so keep it until evicted
+    if (
+        endpoint == OpenWeatherEndpoint.HISTORICAL_AIR_POLLUTION
+        and params.get("end", math.inf) < time.time() - HISTORY_FINAL_AFTER
+    ):
+        ttl = math.inf
+    return ttl
+
+
+def _get_cache_key(endpoint: OpenWeatherEndpoint, params: dict[str, Any]) -> tuple:
+    """
+    Builds the response cache key for a request.
+
+    Coordinates are rounded so nearby points share an entry, and ``q`` location
+    queries are Unicode-, case- and whitespace-normalized.
+
+    Args:
+        endpoint (OpenWeatherEndpoint): The API endpoint.
+        params (dict): Query parameters of the request.
+
+    Returns:
+        tuple: The cache key.
+    """
+    precision = _COORD_PRECISIONS.get(endpoint, COORD_PRECISION)
+
+    items = []
+    for key, value in params.items():
+        if key in ("lat", "lon"):
+            value = round(value, precision)
+        elif key == "q":
+            value = normalize_text(value)
+        items.append((key, value))
+
+    return (endpoint, tuple(sorted(items)))
+
+
+def _get_retry_delay(headers: httpx.Headers) -> float:
+    """
+    Returns how long to wait before retrying a rate-limited request.
+
+    ``Retry-After`` is read as either delta-seconds or an HTTP date, falling back to
+    ``X-RateLimit-Reset`` as a Unix timestamp or delta-seconds.
+
+    Args:
+        headers (httpx.Headers): Headers of the 429 response.
+
+    Returns:
+        float: Delay in seconds.
+    """
+    retry_after = headers.get("Retry-After")
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(retry_after).timestamp()
+            return max(0.0, retry_at - time.time())
+        except (TypeError, ValueError):
+            pass
+
+    reset = headers.get("X-RateLimit-Reset")
+    if reset:
+        try:
+            reset_value = float(reset)
+        except ValueError:
+            pass
+        else:
+            # Large values are absolute Unix timestamps, small ones are deltas
+            if reset_value > 1e9:
+                reset_value -= time.time()
+            return max(0.0, reset_value)
+
+    return _DEFAULT_RETRY_DELAY
+
+
+async def _send(url: httpx.URL, params: dict[str, Any]) -> httpx.Response:
+    """
+    Sends a GET request through the rate limiter and the concurrency gate.
+
+    Rate-limited (429) responses are retried after the delay the API asks for, up to
+    ``_MAX_RETRIES`` times; other responses are returned as is.
+
+    Args:
+        url (httpx.URL): The endpoint URL.
+        params (dict): Full query parameters, including 'appid'.
+
+    Returns:
+        httpx.Response: The last response received.
+
+    Raises:
+        CircuitOpenError: If the circuit breaker is open.
+        httpx.RequestError: If the request fails due to network issues, timeouts, etc.
+    """
+    client = get_http_client()
+
+    for attempt in range(_MAX_RETRIES + 1):
+        async with _rate_limiter:
+            await _gate.acquire()
+            started = time.monotonic()
+            # Calls ending without a response or request error (e.g. cancelled by
+            # the client) say nothing about the upstream's health
+            healthy: bool | None = None
+            try:
+                response = await client.get(url, params=params, timeout=2.0)
+                # Throttling and server errors mean the upstream is struggling
+                healthy = response.status_code != 429 and response.status_code < 500
+            except httpx.RequestError:
+                healthy = False
+                raise
+            finally:
+                await _gate.release(healthy, time.monotonic() - started)
+
+        if response.status_code != 429 or attempt == _MAX_RETRIES:
+            return response
+
+        delay = _get_retry_delay(response.headers)
+        if delay > _MAX_RETRY_DELAY:
+            return response
+
+        # Pause other requests too, then retry with a little jitter
+        _gate.hold(delay)
+        logger.warning("OpenWeather API rate limited, retrying in %.1fs", delay)
+        await asyncio.sleep(delay * random.uniform(1.0, 1.1))
+
+    return response
+
 
 async def call_openweather_api(
     endpoint: OpenWeatherEndpoint,
@@ -19,6 +270,13 @@ async def call_openweather_api(
     """
     Calls the specified OpenWeatherMap API endpoint with given query parameters.
 
+    Responses from endpoints listed in ``_RESPONSE_TTLS`` are cached in memory and
+    served without a network round trip until they expire. They are also written to a
+    disk cache, which is consulted on a memory miss so restarts start warm. Endpoints
+    listed in ``_STALE_TTLS`` keep serving an expired response for a while longer,
+    refreshing it in the background. Concurrent identical requests share a single
+    network call.
+
     Args:
         endpoint (OpenWeatherEndpoint): Enum value representing the API endpoint to call
                                         (e.g., OpenWeatherEndpoint.WEATHER or FORECAST).
@@ -33,100 +291,409 @@ async def call_openweather_api(
         httpx.HTTPStatusError: If the API responds with a 4xx or 5xx error.
         httpx.RequestError: If the request fails due to network issues, timeouts, etc.
     """
-    # Construct full URL to the specific OpenWeather endpoint
-    url = (
-        str(get_settings().openweather_geo_base_url)
-        if endpoint
-        in [OpenWeatherEndpoint.DIRECT_GEOCODING, OpenWeatherEndpoint.REVERSE_GEOCODING]
-        else str(get_settings().openweather_base_url)
+    # Serve cacheable responses from memory when possible
+    ttl = _get_response_ttl(endpoint, params)
+    if ttl is not None:
+        cache_key = _get_cache_key(endpoint, params)
+        not_found = _not_found_cache.get(cache_key)
+        if not_found is not None:
+            cache_requests_counter.labels(endpoint.value, "not_found").inc()
+            raise LocationNotFoundError(not_found)
+
+        cached = _response_cache.get(cache_key)
+        if cached is None:
+            cached = await _load_cached(cache_key)
+        if cached is not None:
+            fresh_until, data = cached
+            if fresh_until > time.monotonic():
+                cache_requests_counter.labels(endpoint.value, "hit").inc()
+                logger.debug("OpenWeather API cache hit [%s]", endpoint.value)
+                return data
+
+            # Serve the stale response and refresh it without making the caller wait
+            cache_requests_counter.labels(endpoint.value, "stale").inc()
+            logger.debug("OpenWeather API stale cache hit [%s]", endpoint.value)
+            if cache_key not in _refreshes:
+                task = asyncio.create_task(
+                    _refresh_cached(cache_key, endpoint, params, ttl)
+                )
+                _refreshes[cache_key] = task
+                task.add_done_callback(lambda _: _refreshes.pop(cache_key, None))
+            return data
+
+        cache_requests_counter.labels(endpoint.value, "miss").inc()
+        return await _fetch_cached(cache_key, endpoint, params, mcp_ctx, ttl)
+
+    # Uncached endpoints still coalesce concurrent requests with identical params
+    return await _inflight.do(
+        (endpoint, tuple(sorted(params.items()))),
+        lambda: _request_openweather_api(endpoint, params, mcp_ctx),
     )
-    url = f"{url.rstrip('/')}/{endpoint.value}"
+
+
+async def _load_cached(cache_key: tuple) -> tuple[float, dict[str, Any]] | None:
+    """
+    Loads a response from the disk cache into the in-memory cache.
+
+    Args:
+        cache_key (tuple): Cache key of the request.
+
+    Returns:
+        tuple | None: The (fresh_until, response) cache entry, or None on a miss.
+    """
+    stored = await response_cache.get(orjson.dumps(cache_key).decode())
+    if stored is None:
+        return None
+
+    data, fresh_for, expires_in = stored
+    entry = (time.monotonic() + fresh_for, data)
+    _response_cache.set(cache_key, entry, ttl=expires_in)
+    return entry
+
+
+async def _fetch_cached(
+    cache_key: tuple,
+    endpoint: OpenWeatherEndpoint,
+    params: dict[str, Any],
+    mcp_ctx: Context | None,
+    ttl: float,
+) -> dict[str, Any]:
+    """
+    Requests a cacheable response and stores it in the memory and disk caches.
+
+    A 404 from the API is remembered for a minute, so repeated requests for an
+    unknown location fail fast.
+
+    The entry is fresh for ``ttl`` seconds, give or take ``_TTL_JITTER``, and kept
+    for the endpoint's stale period on top of that.
+
+    Args:
+        cache_key (tuple): Cache key of the request.
+        endpoint (OpenWeatherEndpoint): The API endpoint.
+        params (dict): Query parameters for the API call, without 'appid'.
+        mcp_ctx (Context | None): MCP context of the tool call, or None for a
+            background refresh.
+        ttl (float): Time-to-live of the response, in seconds.
+
+    Returns:
+        dict: Parsed JSON response from the OpenWeather API.
+
+    Raises:
+        ToolError: If the API responds with an error or the request fails.
+    """
+
+    async def _fetch() -> dict[str, Any]:
+        try:
+            data = await _request_openweather_api(endpoint, params, mcp_ctx)
+        except LocationNotFoundError as e:
+            _not_found_cache.set(cache_key, str(e))
+            raise
+
+        fresh_for = ttl * random.uniform(1 - _TTL_JITTER, 1 + _TTL_JITTER)
+        keep_for = fresh_for + _STALE_TTLS.get(endpoint, 0)
+        _response_cache.set(
+            cache_key, (time.monotonic() + fresh_for, data), ttl=keep_for
+        )
+        await response_cache.set(
+            orjson.dumps(cache_key).decode(), data, fresh_for, keep_for
+        )
+        return data
+
+    # Only the call that does the request stores the response
+    return await _inflight.do(cache_key, _fetch)
+
+
+async def alias_cached_response(
+    endpoint: OpenWeatherEndpoint,
+    params: dict[str, Any],
+    alias_params: dict[str, Any],
+) -> None:
+    """
+    Stores the cached response of a request under the cache key of another request.
+
+    The alias keeps the original entry's freshness and expiry, so later requests made
+    with ``alias_params`` are served from the cache instead of calling the API again.
+    An existing entry for ``alias_params`` is left untouched.
+
+    Args:
+        endpoint (OpenWeatherEndpoint): The API endpoint.
+        params (dict): Query parameters of the cached request.
+        alias_params (dict): Query parameters of the equivalent request.
+    """
+    if _get_response_ttl(endpoint, params) is None:
+        return
+
+    alias_key = _get_cache_key(endpoint, alias_params)
+    entry = _response_cache.get(_get_cache_key(endpoint, params))
+    if entry is None or _response_cache.get(alias_key) is not None:
+        return
+
+    # Entries are kept for the endpoint's stale period past their freshness
+    fresh_until, data = entry
+    fresh_for = fresh_until - time.monotonic()
+    keep_for = fresh_for + _STALE_TTLS.get(endpoint, 0)
+    if keep_for <= 0:
+        return
+
+    _response_cache.set(alias_key, entry, ttl=keep_for)
+    await response_cache.set(
+        orjson.dumps(alias_key).decode(), data, fresh_for, keep_for
+    )
+
+
+async def _refresh_cached(
+    cache_key: tuple,
+    endpoint: OpenWeatherEndpoint,
+    params: dict[str, Any],
+    ttl: float,
+) -> None:
+    """
+    Refreshes a stale cached response in the background.
+
+    Only a few refreshes call the API at once, the rest wait their turn. Failures are
+    logged and otherwise ignored; the stale entry keeps being served until it expires.
+    The tool call that triggered the refresh has already returned, so its MCP context
+    is not used and nothing is reported to the client.
+
+    Args:
+        cache_key (tuple): Cache key of the request.
+        endpoint (OpenWeatherEndpoint): The API endpoint.
+        params (dict): Query parameters for the API call, without 'appid'.
+        ttl (float): Time-to-live of the response, in seconds.
+    """
+    try:
+        async with _refresh_semaphore:
+            await _fetch_cached(cache_key, endpoint, params, None, ttl)
+    except Exception as e:
+        logger.warning("OpenWeather API background refresh failed: %s", e)
+
+
+async def _notify(mcp_ctx: Context | None, level: str, message: str) -> None:
+    """
+    Sends a log message to the MCP client, if there is one to notify.
+
+    Args:
+        mcp_ctx (Context | None): MCP context of the tool call, or None.
+        level (str): Log level method of the context ("info", "warning" or "error").
+        message (str): The message.
+    """
+    if mcp_ctx is not None:
+        await getattr(mcp_ctx, level)(message)
+
+
+async def _report_progress(
+    mcp_ctx: Context | None, progress: float, message: str
+) -> None:
+    """
+    Reports progress of the tool call to the MCP client, if there is one to notify.
+
+    Args:
+        mcp_ctx (Context | None): MCP context of the tool call, or None.
+        progress (float): Progress out of 100.
+        message (str): Description of the current step.
+    """
+    if mcp_ctx is not None:
+        await mcp_ctx.report_progress(progress, total=100, message=message)
+
+
+async def _request_openweather_api(
+    endpoint: OpenWeatherEndpoint,
+    params: dict[str, Any],
+    mcp_ctx: Context | None,
+) -> dict[str, Any]:
+    """
+    Sends a request to an OpenWeatherMap API endpoint, bypassing the response cache.
+
+    Args:
+        endpoint (OpenWeatherEndpoint): The API endpoint.
+        params (dict): Query parameters for the API call, without 'appid'.
+        mcp_ctx (Context | None): MCP context of the tool call, used for client
+            notifications and progress. None for background work that outlives the
+            call, which only logs on the server.
+
+    Returns:
+        dict: Parsed JSON response from the OpenWeather API.
+
+    Raises:
+        ToolError: If the API responds with an error or the request fails.
+    """
+    # Full URL to the specific OpenWeather endpoint
+    url = _get_endpoint_url(endpoint)
+
+    request_id = mcp_ctx.request_id if mcp_ctx is not None else None
+    client_id = mcp_ctx.client_id if mcp_ctx is not None else None
+    log_extra = {"request_id": request_id, "client_id": client_id}
 
     # logging the call
-    await mcp_ctx.info(
-        f"Calling OpenWeather API with params (request_id={mcp_ctx.request_id}, client_id={mcp_ctx.client_id}) : {params}"
+    await _notify(
+        mcp_ctx,
+        "info",
+        f"Calling OpenWeather API with params (request_id={request_id}, client_id={client_id}) : {params}",
     )
     logger.info(
-        f"Calling OpenWeather API with params : {params}",
-        extra={
-            "request_id": mcp_ctx.request_id,
-            "client_id": mcp_ctx.client_id,
-        },
+        "Calling OpenWeather API [%s] with params : %s",
+        endpoint.value,
+        params,
+        extra=log_extra,
     )
 
-    # Copy original params to avoid mutating caller input
-    user_params = params.copy()
-
-    # Add API key and default units
-    user_params["appid"] = get_settings().openweather_api_key
-    user_params.setdefault("units", "metric")
+    # Build the query in one allocation without mutating caller input:
+    # default units first (caller may override), API key last (always wins)
+    user_params = {
+        "units": "metric",
+        **params,
+        "appid": _API_KEY,
+    }
 
     # report initial progress
-    await mcp_ctx.report_progress(
-        10, total=100, message="Preparing OpenWeather API request"
-    )
+    await _report_progress(mcp_ctx, 10, "Preparing OpenWeather API request")
 
     try:
         # report progress for API call
-        await mcp_ctx.report_progress(
-            30, total=100, message="Calling OpenWeather API request"
-        )
+        await _report_progress(mcp_ctx, 30, "Calling OpenWeather API request")
 
-        # Make async GET request to the API
-        async with httpx.AsyncClient(timeout=2.0) as client:
-            response = await client.get(url, params=user_params)
+        # Make async GET request to the API using the shared client, paced to stay
+        # within the OpenWeather rate limit and the adaptive concurrency limit
+        response = await _send(url, user_params)
 
-            # report progress for API response
-            await mcp_ctx.report_progress(
-                80, total=100, message="OpenWeather API request completed"
-            )
+        # report progress for API response
+        await _report_progress(mcp_ctx, 80, "OpenWeather API request completed")
 
-            # Raise error for any HTTP response with 4xx or 5xx status
-            response.raise_for_status()
+        # Raise error for any HTTP response with 4xx or 5xx status
+        response.raise_for_status()
 
-            # get JSON response
-            data = response.json()
+        # Parse the JSON response body
+        data = orjson.loads(response.content)
 
-            # log and report progress for successful response
-            await mcp_ctx.info(
-                f"OpenWeather API response (request_id={mcp_ctx.request_id}, client_id={mcp_ctx.client_id}) : {data}"
-            )
-            await mcp_ctx.report_progress(
-                100, total=100, message="OpenWeather API call successful"
-            )
-            logger.info(
-                f"OpenWeather API response : {data}",
-                extra={
-                    "request_id": mcp_ctx.request_id,
-                    "client_id": mcp_ctx.client_id,
-                },
-            )
+        # log and report progress for successful response
+        await _notify(
+            mcp_ctx,
+            "info",
+            f"OpenWeather API response (request_id={request_id}, client_id={client_id}) : {data}",
+        )
+        await _report_progress(mcp_ctx, 100, "OpenWeather API call successful")
+        logger.info(
+            "OpenWeather API response : %s",
+            data,
+            extra=log_extra,
+        )
 
-            # Return parsed JSON data
-            return data
+        # Return parsed JSON data
+        return data
 
     except httpx.HTTPStatusError as e:
         # Log HTTP error response
         logger.warning(
-            f"OpenWeather API error: {e}",
-            extra={"request_id": mcp_ctx.request_id, "client_id": mcp_ctx.client_id},
+            "OpenWeather API error: %s",
+            e,
+            extra=log_extra,
         )
-        await mcp_ctx.warning(
-            f"OpenWeather API error (request_id={mcp_ctx.request_id}, client_id={mcp_ctx.client_id})"
+        await _notify(
+            mcp_ctx,
+            "warning",
+            f"OpenWeather API error (request_id={request_id}, client_id={client_id})",
         )
         if e.response.status_code == 404:
-            raise ToolError("Weather data not found for the given location.")
+            raise LocationNotFoundError(
+                "Weather data not found for the given location."
+            )
 
         raise ToolError("Weather service returned an error. Try again later.")
 
+    except CircuitOpenError:
+        logger.warning(
+            "OpenWeather API circuit open, rejecting request [%s]",
+            endpoint.value,
+            extra=log_extra,
+        )
+        raise ToolError("Weather service is temporarily unavailable. Try again later.")
+
     except httpx.RequestError as e:
         # Log network or connection error
         logger.error(
-            f"OpenWeather API request error: {e}",
-            extra={"request_id": mcp_ctx.request_id, "client_id": mcp_ctx.client_id},
+            "OpenWeather API request error: %s",
+            e,
+            extra=log_extra,
         )
-        await mcp_ctx.error(
-            f"OpenWeather API request error (request_id={mcp_ctx.request_id}, client_id={mcp_ctx.client_id})"
+        await _notify(
+            mcp_ctx,
+            "error",
+            f"OpenWeather API request error (request_id={request_id}, client_id={client_id})",
         )
 
         raise ToolError("An unexpected error occurred.")
+
+
+async def call_openweather_api_batch(
+    endpoint: OpenWeatherEndpoint,
+    requests: list[dict[str, Any]],
+    mcp_ctx: Context,
+) -> list[dict[str, Any]]:
+    """
+    Calls one OpenWeatherMap API endpoint for several sets of query parameters.
+
+    Requests run concurrently, bounded like gather_bounded. Identical requests are
+    coalesced by call_openweather_api, so duplicates cost a single upstream call.
+
+    Args:
+        endpoint (OpenWeatherEndpoint): The API endpoint.
+        requests (list): Query parameters of each request.
+        mcp_ctx (Context): MCP context for logging or other purposes.
+
+    Returns:
+        list: One entry per request, in the same order: the parsed JSON response, or
+            {"error": message} if that request failed.
+    """
+    results = await gather_bounded(
+        call_openweather_api(endpoint, params, mcp_ctx) for params in requests
+    )
+
+    responses: list[dict[str, Any]] = []
+    for result in results:
+        if isinstance(result, ToolError):
+            responses.append({"error": str(result)})
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            responses.append(result)
+    return responses
+
+
+def get_city_query(city: str, country_code: str | None = None) -> str:
+    """
+    Builds the ``q`` location query for OpenWeather city-name lookups.
+
+    Args:
+        city (str): City name.
+        country_code (str | None, optional): ISO 3166-1 alpha-2 country code.
+
+    Returns:
+        str: The city name, qualified with the country code when given.
+    """
+    return f"{city},{country_code}" if country_code else city
+
+
+async def gather_bounded(
+    aws: Iterable[Awaitable[Any]], limit: int | None = None
+) -> list[Any]:
+    """
+    Awaits several awaitables concurrently, with at most ``limit`` in flight.
+
+    Exceptions are returned in place of results rather than raised, so one failure
+    does not cancel the rest.
+
+    Args:
+        aws (Iterable[Awaitable]): The awaitables to run.
+        limit (int | None, optional): Maximum number of awaitables in flight.
+            Defaults to the ``openweather_max_concurrency`` setting.
+
+    Returns:
+        list: Results or exceptions, in the same order as ``aws``.
+    """
+    semaphore = asyncio.Semaphore(limit or settings.openweather_max_concurrency)
+
+    async def _run(aw: Awaitable[Any]) -> Any:
+        async with semaphore:
+            return await aw
+
+    return list(await asyncio.gather(*(_run(aw) for aw in aws), return_exceptions=True))
@@ -1,15 +1,24 @@
+from pathlib import Path
 from unittest.mock import mock_open, patch
 
 import pytest
 import yaml
 
 from config.logging_config import setup_logging
+from config.settings_config import get_settings
+
+
+@pytest.fixture(autouse=True)
+def isolated_config_cache(monkeypatch, tmp_path):
+    """Use an empty cache directory so every test starts cold"""
+    monkeypatch.setenv("LOGGING_CACHE_DIR", str(tmp_path / "logging"))
+    monkeypatch.setattr("config.logging_config._MISSING_ENV_CONFIGS", set())
 
 
 class TestSetupLogging:
     """Test cases for the setup_logging function."""
 
-    @patch("config.logging_config.yaml.safe_load", wraps=yaml.safe_load)
+    @patch("config.logging_config.yaml.load", wraps=yaml.load)
     def test_setup_logging_base_config_only(self, mock_yaml_load, monkeypatch):
         """Test setup_logging with only base configuration."""
         # Set environment variable for testing
@@ -18,17 +27,17 @@ class TestSetupLogging:
         # Call the function
         setup_logging()
 
-        # Verify that yaml.safe_load was called once (base config only)
+        # Verify that yaml.load was called once (base config only)
         assert mock_yaml_load.call_count == 1
 
-    @patch("config.logging_config.yaml.safe_load", wraps=yaml.safe_load)
+    @patch("config.logging_config.yaml.load", wraps=yaml.load)
     @patch("logging.config.dictConfig")
     def test_setup_logging_with_env_config(self, mock_dict_config, mock_yaml_load):
         """Test setup_logging with environment-specific override."""
         # Call the function
         setup_logging()
 
-        # Verify that yaml.safe_load was called twice (base + override)
+        # Verify that yaml.load was called twice (base + override)
         assert mock_yaml_load.call_count == 2
 
         # Verify that dictConfig was called with merged config
@@ -39,6 +48,68 @@ class TestSetupLogging:
         assert call_args["root"]["level"] == "DEBUG"
         assert call_args["root"]["handlers"] == ["console"]
 
+    @patch("config.logging_config.yaml.load", wraps=yaml.load)
+    @patch("logging.config.dictConfig")
+    def test_setup_logging_uses_cached_config(self, mock_dict_config, mock_yaml_load):
+        """Test setup_logging reuses the parsed config cache on the next call."""
+        setup_logging()
+        first_config = mock_dict_config.call_args[0][0]
+
+        setup_logging()
+
+        # YAML is only parsed on the first call (base + override)
+        assert mock_yaml_load.call_count == 2
+        assert mock_dict_config.call_args[0][0] == first_config
+
+    @patch("config.logging_config.yaml.load", wraps=yaml.load)
+    def test_setup_logging_cache_keyed_by_env(self, mock_yaml_load, monkeypatch):
+        """Test setup_logging does not reuse a cache built for another env."""
+        setup_logging()
+
+        monkeypatch.setenv("ENV", "test")
+        get_settings.cache_clear()
+        setup_logging()
+
+        # base + override for "local", then base only for "test"
+        assert mock_yaml_load.call_count == 3
+
+    def test_setup_logging_remembers_missing_env_config(self, monkeypatch):
+        """Test setup_logging skips the lookup for a known-absent env config."""
+        monkeypatch.setenv("ENV", "test")
+        get_settings.cache_clear()
+        setup_logging()
+
+        with patch.object(Path, "is_file") as mock_is_file:
+            setup_logging()
+
+        # The absent "test" override is not looked up again
+        mock_is_file.assert_not_called()
+
+    def test_setup_logging_cache_dir_is_private(self, tmp_path):
+        """Test setup_logging creates the cache directory readable by the owner only."""
+        setup_logging()
+
+        cache_dir = tmp_path / "logging"
+        assert cache_dir.stat().st_mode & 0o777 == 0o700
+        assert [p.suffix for p in cache_dir.iterdir()] == [".cache"]
+
+    @patch("config.logging_config.yaml.load", wraps=yaml.load)
+    def test_setup_logging_skips_shared_cache_dir(
+        self, mock_yaml_load, monkeypatch, tmp_path
+    ):
+        """Test setup_logging ignores a cache directory other users can write to."""
+        shared_dir = tmp_path / "shared"
+        shared_dir.mkdir()
+        shared_dir.chmod(0o777)
+        monkeypatch.setenv("LOGGING_CACHE_DIR", str(shared_dir))
+
+        setup_logging()
+        setup_logging()
+
+        # Nothing is cached, so YAML is parsed on both calls (base + override)
+        assert mock_yaml_load.call_count == 4
+        assert list(shared_dir.iterdir()) == []
+
     @patch("builtins.open", new_callable=mock_open)
     def test_setup_logging_base_config_not_found(self, mock_file):
         """Test setup_logging when base config file doesn't exist."""
@@ -49,7 +120,7 @@ class TestSetupLogging:
         with pytest.raises(FileNotFoundError):
             setup_logging()
 
-    @patch("config.logging_config.yaml.safe_load")
+    @patch("config.logging_config.yaml.load")
     def test_setup_logging_yaml_parse_error(self, mock_yaml_load):
         """Test setup_logging when YAML parsing fails."""
         # Setup mocks
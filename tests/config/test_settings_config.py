@@ -1,4 +1,5 @@
 import pytest
+from pydantic import ValidationError
 
 from config.settings_config import get_settings
 
@@ -48,3 +49,24 @@ class TestSettingsConfig:
             settings.mcp_project_info
             == f"{settings.mcp_project_name} - {settings.mcp_project_version}"
         )
+
+    def test_settings_are_frozen(self):
+        """Test Settings cannot be modified after creation"""
+
+        settings = get_settings()
+
+        with pytest.raises(ValidationError):
+            settings.mcp_port = 1234
+
+        assert hash(settings) == hash(get_settings())
+
+    def test_settings_fall_back_to_env_file(self, monkeypatch):
+        """Test Settings reads values missing from the environment from .env"""
+        monkeypatch.delenv("OPENWEATHER_GEO_BASE_URL", raising=False)
+
+        settings = get_settings()
+
+        assert (
+            str(settings.openweather_geo_base_url)
+            == "https://api.openweathermap.org/geo/1.0"
+        )
@@ -0,0 +1,129 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from core.aimd_gate import AIMDGate, CircuitOpenError
+
+
+class TestAIMDGate:
+    """Test cases for the AIMDGate class."""
+
+    @pytest.mark.asyncio
+    async def test_success_grows_limit_additively(self):
+        """Test that a fast successful call raises the limit by 0.5."""
+        gate = AIMDGate(initial=4, maximum=5, latency_target=1.0)
+
+        for _ in range(3):
+            await gate.acquire()
+            await gate.release(True, 0.1)
+
+        assert gate.limit == 5
+
+    @pytest.mark.asyncio
+    async def test_failure_halves_limit(self):
+        """Test that a failed call halves the limit, down to 1."""
+        gate = AIMDGate(initial=4, maximum=8, latency_target=1.0)
+
+        for expected in (2, 1, 1):
+            await gate.acquire()
+            await gate.release(False, 0.1)
+            assert gate.limit == expected
+
+    @pytest.mark.asyncio
+    async def test_release_without_outcome_only_frees_slot(self):
+        """Test that a call without an outcome leaves the limit and circuit as is."""
+        gate = AIMDGate(initial=1, maximum=8, latency_target=1.0, failure_threshold=1)
+
+        for _ in range(3):
+            await gate.acquire()
+            await gate.release(None, 0.1)
+
+        assert gate.limit == 1
+        assert not gate.is_open
+
+    @pytest.mark.asyncio
+    async def test_slow_calls_halve_limit(self):
+        """Test that exceeding the latency target halves the limit."""
+        gate = AIMDGate(initial=4, maximum=8, latency_target=1.0)
+
+        await gate.acquire()
+        await gate.release(True, 3.0)
+
+        assert gate.limit == 2
+
+    @pytest.mark.asyncio
+    async def test_slow_calls_in_one_round_halve_limit_once(self):
+        """Test that slow calls running together halve the limit once, not each."""
+        gate = AIMDGate(initial=8, maximum=16, latency_target=1.0)
+
+        for _ in range(4):
+            await gate.acquire()
+        for _ in range(4):
+            await gate.release(True, 3.0)
+
+        assert gate.limit == 4
+
+    @pytest.mark.asyncio
+    async def test_fast_calls_recover_after_slow_calls(self):
+        """Test that fast calls after slow ones grow the limit again right away."""
+        gate = AIMDGate(initial=8, maximum=16, latency_target=1.0)
+        for _ in range(4):
+            await gate.acquire()
+        for _ in range(4):
+            await gate.release(True, 3.0)
+
+        for _ in range(4):
+            await gate.acquire()
+            await gate.release(True, 0.1)
+
+        assert gate.limit == 6
+
+    @pytest.mark.asyncio
+    async def test_limit_bounds_concurrency(self):
+        """Test that callers wait once the limit is reached."""
+        gate = AIMDGate(initial=1, maximum=8, latency_target=1.0)
+        await gate.acquire()
+
+        waiter = asyncio.create_task(gate.acquire())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        await gate.release(True, 0.1)
+        await asyncio.wait_for(waiter, timeout=1)
+
+    @pytest.mark.asyncio
+    @patch("core.aimd_gate.time.monotonic")
+    async def test_circuit_opens_after_consecutive_failures(self, mock_monotonic):
+        """Test that the circuit rejects calls during the cooldown, then recovers."""
+        mock_monotonic.return_value = 100.0
+        gate = AIMDGate(
+            initial=4, maximum=8, latency_target=1.0, failure_threshold=2, cooldown=30
+        )
+
+        for _ in range(2):
+            await gate.acquire()
+            await gate.release(False, 0.1)
+
+        assert gate.is_open
+        with pytest.raises(CircuitOpenError):
+            await gate.acquire()
+
+        # After the cooldown a trial call is let through and closes the circuit
+        mock_monotonic.return_value = 131.0
+        await gate.acquire()
+        await gate.release(True, 0.1)
+
+        assert not gate.is_open
+
+    @pytest.mark.asyncio
+    @patch("core.aimd_gate.asyncio.sleep")
+    @patch("core.aimd_gate.time.monotonic", return_value=100.0)
+    async def test_hold_pauses_new_calls(self, mock_monotonic, mock_sleep):
+        """Test that acquire waits out a requested pause."""
+        gate = AIMDGate(initial=4, maximum=8, latency_target=1.0)
+        gate.hold(2.5)
+
+        await gate.acquire()
+
+        mock_sleep.assert_awaited_once_with(2.5)
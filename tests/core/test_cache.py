@@ -0,0 +1,250 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from core.cache import LFUTTLCache, SingleFlight, TTLCache
+
+
+class TestTTLCache:
+    """Test cases for the TTLCache class."""
+
+    def test_get_missing_key(self):
+        """Test that a missing key returns None."""
+        cache = TTLCache(maxsize=2, ttl=60)
+
+        assert cache.get("missing") is None
+
+    def test_set_and_get(self):
+        """Test that a stored value is returned before it expires."""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+
+        assert cache.get("a") == 1
+        assert len(cache) == 1
+
+    @patch("core.cache.time.monotonic")
+    def test_expired_entry_is_dropped(self, mock_monotonic):
+        """Test that an entry is dropped once its ttl has elapsed."""
+        mock_monotonic.return_value = 100.0
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2, ttl=10)
+
+        mock_monotonic.return_value = 120.0
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert len(cache) == 1
+
+    def test_evicts_least_recently_used(self):
+        """Test that the least recently used entry is evicted when full."""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        # Touch "a" so "b" becomes the least recently used entry
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_clear(self):
+        """Test that clear removes every entry."""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.clear()
+
+        assert len(cache) == 0
+
+
+class TestLFUTTLCache:
+    """Test cases for the LFUTTLCache class."""
+
+    def test_set_and_get(self):
+        """Test that a stored value is returned before it expires."""
+        cache = LFUTTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+
+        assert cache.get("a") == 1
+        assert cache.get("missing") is None
+
+    def test_evicts_least_frequently_used(self):
+        """Test that a popular entry survives a burst of one-off entries."""
+        cache = LFUTTLCache(maxsize=2, ttl=60)
+        cache.set("popular", 1)
+        for _ in range(3):
+            cache.get("popular")
+
+        for i in range(5):
+            cache.set(f"one-off-{i}", i)
+
+        assert cache.get("popular") == 1
+        assert cache.get("one-off-4") == 4
+        assert cache.get("one-off-3") is None
+        assert len(cache) == 2
+
+    def test_ties_evict_least_recently_used(self):
+        """Test that entries with equal use counts are evicted oldest first."""
+        cache = LFUTTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+        assert cache.get("c") == 3
+
+    @patch("core.cache.time.monotonic")
+    def test_expired_entry_keeps_use_count(self, mock_monotonic):
+        """Test that a refreshed popular entry is not evicted after expiry."""
+        mock_monotonic.return_value = 100.0
+        cache = LFUTTLCache(maxsize=2, ttl=60)
+        cache.set("popular", 1)
+        for _ in range(3):
+            cache.get("popular")
+
+        mock_monotonic.return_value = 200.0
+        assert cache.get("popular") is None
+
+        cache.set("popular", 2)
+        cache.set("one-off-1", 1)
+        cache.set("one-off-2", 2)
+
+        assert cache.get("popular") == 2
+        assert cache.get("one-off-1") is None
+
+    @patch("core.cache.time.monotonic")
+    def test_expired_entries_evicted_first(self, mock_monotonic):
+        """Test that expired popular entries make room before live new ones."""
+        mock_monotonic.return_value = 100.0
+        cache = LFUTTLCache(maxsize=3, ttl=60)
+        for key in ("a", "b", "c"):
+            cache.set(key, key)
+            cache.get(key)
+
+        mock_monotonic.return_value = 200.0
+        for key in ("x", "y", "z"):
+            cache.set(key, key)
+
+        assert [cache.get(key) for key in ("x", "y", "z")] == ["x", "y", "z"]
+        assert len(cache) == 3
+
+    def test_expiry_heap_stays_bounded(self):
+        """Test that repeatedly refreshed keys do not grow the expiry heap."""
+        cache = LFUTTLCache(maxsize=2, ttl=60)
+        for i in range(100):
+            cache.set("a", i)
+
+        assert cache.get("a") == 99
+        assert len(cache._expiries) <= 4
+
+    def test_clear(self):
+        """Test that clear removes every entry."""
+        cache = LFUTTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.clear()
+        cache.set("b", 2)
+
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+        assert len(cache) == 1
+
+
+class TestSingleFlight:
+    """Test cases for the SingleFlight class."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_result(self):
+        """Test that concurrent calls with the same key run once."""
+        flight = SingleFlight()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0)
+            return "result"
+
+        results = await asyncio.gather(*(flight.do("key", fetch) for _ in range(5)))
+
+        assert results == ["result"] * 5
+        assert calls == 1
+        assert len(flight) == 0
+
+    @pytest.mark.asyncio
+    async def test_exception_shared_with_waiters(self):
+        """Test that a failure is raised for every caller sharing the call."""
+        flight = SingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            flight.do("key", fail), flight.do("key", fail), return_exceptions=True
+        )
+
+        assert all(isinstance(result, ValueError) for result in results)
+        assert len(flight) == 0
+
+    @pytest.mark.asyncio
+    async def test_sequential_calls_run_again(self):
+        """Test that a finished call is not reused by later callers."""
+        flight = SingleFlight()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            return calls
+
+        assert await flight.do("key", fetch) == 1
+        assert await flight.do("key", fetch) == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_does_not_cancel_followers(self):
+        """Test that cancelling the first caller leaves the shared call running."""
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def fetch():
+            await release.wait()
+            return "result"
+
+        leader = asyncio.create_task(flight.do("key", fetch))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flight.do("key", fetch))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await follower == "result"
+        assert leader.cancelled()
+        assert len(flight) == 0
+
+    @pytest.mark.asyncio
+    async def test_call_cancelled_when_all_callers_cancel(self):
+        """Test that the shared call stops once nobody is waiting for it."""
+        flight = SingleFlight()
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def fetch():
+            started.set()
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        caller = asyncio.create_task(flight.do("key", fetch))
+        await started.wait()
+        caller.cancel()
+
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+        assert len(flight) == 0
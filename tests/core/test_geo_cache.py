@@ -0,0 +1,57 @@
+from unittest.mock import patch
+
+import pytest
+
+from core import geo_cache
+
+
+@pytest.fixture(autouse=True)
+def isolated_geo_cache(monkeypatch, tmp_path):
+    """Point the geocoding disk cache at an empty temporary directory"""
+    monkeypatch.setenv("GEO_CACHE_DIR", str(tmp_path))
+    yield
+    geo_cache.close()
+
+
+class TestGeoCache:
+    """Test cases for the on-disk geocoding cache."""
+
+    @pytest.mark.asyncio
+    async def test_get_missing_key(self):
+        """Test that an unknown key is a miss."""
+        assert await geo_cache.get(("tokyo", "13", "jp")) is None
+
+    @pytest.mark.asyncio
+    async def test_set_and_get(self):
+        """Test that stored coordinates are returned."""
+        await geo_cache.set(("tokyo", "13", "jp"), 35.6895, 139.6917)
+
+        assert await geo_cache.get(("tokyo", "13", "jp")) == (35.6895, 139.6917)
+
+    @pytest.mark.asyncio
+    async def test_survives_reopen(self):
+        """Test that entries persist after the connection is closed."""
+        await geo_cache.set(("tokyo", "13", "jp"), 35.6895, 139.6917)
+        geo_cache.close()
+
+        assert await geo_cache.get(("tokyo", "13", "jp")) == (35.6895, 139.6917)
+
+    @pytest.mark.asyncio
+    @patch("core.geo_cache.time.time")
+    async def test_expired_entry_is_a_miss(self, mock_time):
+        """Test that entries older than the ttl are ignored."""
+        mock_time.return_value = 1_000.0
+        await geo_cache.set(("tokyo", "13", "jp"), 35.6895, 139.6917)
+
+        mock_time.return_value = 1_000.0 + geo_cache._TTL_SECONDS
+
+        assert await geo_cache.get(("tokyo", "13", "jp")) is None
+
+    @pytest.mark.asyncio
+    @patch("core.geo_cache._store._get_connection")
+    async def test_errors_are_treated_as_miss(self, mock_get_connection):
+        """Test that disk cache failures do not propagate."""
+        mock_get_connection.side_effect = OSError("read-only filesystem")
+
+        assert await geo_cache.get(("tokyo", "13", "jp")) is None
+        await geo_cache.set(("tokyo", "13", "jp"), 35.6895, 139.6917)
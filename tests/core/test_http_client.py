@@ -0,0 +1,57 @@
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from core import http_client
+from core.http_client import close_http_client, get_http_client, warmup_openweather
+
+
+class TestHttpClient:
+    """Test cases for the shared HTTP client."""
+
+    @pytest.mark.asyncio
+    async def test_client_is_reused(self):
+        """Test that the same client instance is returned on every call."""
+        client = get_http_client()
+
+        assert get_http_client() is client
+
+        await close_http_client()
+
+    @pytest.mark.asyncio
+    async def test_close_resets_client(self):
+        """Test that closing the client releases it and a new one is created."""
+        client = get_http_client()
+
+        await close_http_client()
+
+        assert client.is_closed
+        assert http_client._client is None
+        assert get_http_client() is not client
+
+        await close_http_client()
+
+    @pytest.mark.asyncio
+    @patch("httpx.AsyncClient.head", new_callable=AsyncMock)
+    async def test_warmup_heads_each_origin(self, mock_head):
+        """Test that warmup sends one HEAD request per OpenWeather origin."""
+        await warmup_openweather()
+
+        origins = {str(call.args[0]) for call in mock_head.call_args_list}
+        assert mock_head.call_count == len(origins)
+        assert all(origin.endswith("/") for origin in origins)
+
+        await close_http_client()
+
+    @pytest.mark.asyncio
+    @patch("httpx.AsyncClient.head", new_callable=AsyncMock)
+    async def test_warmup_failure_is_ignored(self, mock_head):
+        """Test that a failed warmup request does not raise."""
+        mock_head.side_effect = httpx.ConnectError("unreachable")
+
+        await warmup_openweather()
+
+        assert mock_head.called
+
+        await close_http_client()
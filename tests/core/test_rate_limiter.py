@@ -0,0 +1,51 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from core.rate_limiter import AsyncRateLimiter
+
+
+class TestAsyncRateLimiter:
+    """Test cases for the AsyncRateLimiter class."""
+
+    @pytest.mark.asyncio
+    @patch("core.rate_limiter.asyncio.sleep", new_callable=AsyncMock)
+    @patch("core.rate_limiter.time.monotonic", return_value=100.0)
+    async def test_burst_within_rate_does_not_wait(self, mock_monotonic, mock_sleep):
+        """Test that up to max_rate acquisitions go through immediately."""
+        limiter = AsyncRateLimiter(3, time_period=60)
+
+        for _ in range(3):
+            async with limiter:
+                pass
+
+        mock_sleep.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch("core.rate_limiter.asyncio.sleep", new_callable=AsyncMock)
+    @patch("core.rate_limiter.time.monotonic", return_value=100.0)
+    async def test_waits_for_bucket_to_drain(self, mock_monotonic, mock_sleep):
+        """Test that an acquisition over the rate waits for one slot to drain."""
+        limiter = AsyncRateLimiter(2, time_period=60)
+
+        for _ in range(3):
+            await limiter.acquire()
+
+        # 2 per 60 seconds drains one slot every 30 seconds
+        mock_sleep.assert_awaited_once_with(30.0)
+
+    @pytest.mark.asyncio
+    @patch("core.rate_limiter.asyncio.sleep", new_callable=AsyncMock)
+    @patch("core.rate_limiter.time.monotonic")
+    async def test_bucket_drains_over_time(self, mock_monotonic, mock_sleep):
+        """Test that capacity is restored as time passes."""
+        mock_monotonic.return_value = 100.0
+        limiter = AsyncRateLimiter(2, time_period=60)
+        await limiter.acquire()
+        await limiter.acquire()
+
+        mock_monotonic.return_value = 160.0
+        await limiter.acquire()
+        await limiter.acquire()
+
+        mock_sleep.assert_not_called()
@@ -0,0 +1,89 @@
+import math
+from unittest.mock import patch
+
+import pytest
+
+from core import response_cache
+
+
+@pytest.fixture(autouse=True)
+def isolated_response_cache(monkeypatch, tmp_path):
+    """Point the response disk cache at an empty temporary directory"""
+    monkeypatch.setenv("RESPONSE_CACHE_DIR", str(tmp_path))
+    yield
+    response_cache.close()
+
+
+class TestResponseCache:
+    """Test cases for the on-disk response cache."""
+
+    @pytest.mark.asyncio
+    async def test_get_missing_key(self):
+        """Test that an unknown key is a miss."""
+        assert await response_cache.get("weather:london") is None
+
+    @pytest.mark.asyncio
+    @patch("core.response_cache.time.time")
+    async def test_set_and_get(self, mock_time):
+        """Test that stored responses are returned with their remaining lifetimes."""
+        mock_time.return_value = 1_000.0
+        await response_cache.set("weather:london", {"name": "London"}, 300, 600)
+
+        mock_time.return_value = 1_100.0
+
+        assert await response_cache.get("weather:london") == (
+            {"name": "London"},
+            200.0,
+            500.0,
+        )
+
+    @pytest.mark.asyncio
+    async def test_survives_reopen(self):
+        """Test that entries persist after the connection is closed."""
+        await response_cache.set("weather:london", {"name": "London"}, 300, 600)
+        response_cache.close()
+
+        data, _, _ = await response_cache.get("weather:london")
+        assert data == {"name": "London"}
+
+    @pytest.mark.asyncio
+    async def test_infinite_ttl(self):
+        """Test that responses without expiry are kept."""
+        await response_cache.set("history:london", [1, 2], math.inf, math.inf)
+
+        assert await response_cache.get("history:london") == (
+            [1, 2],
+            math.inf,
+            math.inf,
+        )
+
+    @pytest.mark.asyncio
+    @patch("core.response_cache.time.time")
+    async def test_expired_entry_is_a_miss(self, mock_time):
+        """Test that entries past their expiry are ignored."""
+        mock_time.return_value = 1_000.0
+        await response_cache.set("weather:london", {"name": "London"}, 300, 600)
+
+        mock_time.return_value = 1_600.0
+
+        assert await response_cache.get("weather:london") is None
+
+    @pytest.mark.asyncio
+    @patch("core.response_cache._MAX_ENTRIES", 2)
+    @patch("core.response_cache._PRUNE_EVERY", 1)
+    async def test_oldest_entries_pruned(self):
+        """Test that entries beyond the size limit are pruned oldest first."""
+        for i in range(3):
+            await response_cache.set(f"key:{i}", i, 300, 600)
+
+        assert await response_cache.get("key:0") is None
+        assert (await response_cache.get("key:2"))[0] == 2
+
+    @pytest.mark.asyncio
+    @patch("core.response_cache._store._get_connection")
+    async def test_errors_are_treated_as_miss(self, mock_get_connection):
+        """Test that disk cache failures do not propagate."""
+        mock_get_connection.side_effect = OSError("read-only filesystem")
+
+        assert await response_cache.get("weather:london") is None
+        await response_cache.set("weather:london", {"name": "London"}, 300, 600)
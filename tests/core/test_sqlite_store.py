@@ -0,0 +1,48 @@
+import pytest
+
+from core.sqlite_store import SQLiteStore
+
+SCHEMA = "CREATE TABLE IF NOT EXISTS items (key TEXT PRIMARY KEY, value TEXT)"
+
+
+@pytest.fixture
+def store(tmp_path):
+    """A store backed by a database in a not yet existing directory"""
+    store = SQLiteStore(lambda: tmp_path / "nested" / "store.sqlite3", SCHEMA)
+    yield store
+    store.close()
+
+
+class TestSQLiteStore:
+    """Test cases for the SQLiteStore class."""
+
+    def test_creates_database_and_schema(self, store, tmp_path):
+        """Test that the directory, database and table are created on first use."""
+        store.run(lambda c: c.execute("INSERT INTO items VALUES ('a', '1')"))
+
+        assert (tmp_path / "nested" / "store.sqlite3").is_file()
+        assert store.run(lambda c: c.execute("SELECT * FROM items").fetchall()) == [
+            ("a", "1")
+        ]
+
+    def test_uses_write_ahead_log(self, store):
+        """Test that the database is opened in WAL mode."""
+        mode = store.run(lambda c: c.execute("PRAGMA journal_mode").fetchone())
+
+        assert mode == ("wal",)
+
+    @pytest.mark.asyncio
+    async def test_reopens_after_close(self, store):
+        """Test that committed data survives closing and reopening the store."""
+
+        def _insert(connection):
+            connection.execute("INSERT INTO items VALUES ('a', '1')")
+            connection.commit()
+
+        await store.run_in_thread(_insert)
+        store.close()
+
+        rows = await store.run_in_thread(
+            lambda c: c.execute("SELECT value FROM items").fetchall()
+        )
+        assert rows == [("1",)]
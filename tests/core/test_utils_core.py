@@ -1,4 +1,4 @@
-from core.utils import deep_merge
+from core.utils import deep_merge, normalize_text
 
 
 class TestDeepMerge:
@@ -63,3 +63,24 @@ class TestDeepMerge:
         # The function should modify base in place
         assert base is result
         assert base == {"a": 1, "b": 2}
+
+    def test_merge_nested_dicts_in_place(self):
+        """Test that nested dictionaries of the base are merged in place."""
+        nested = {"x": 1}
+        base = {"a": nested}
+        override = {"a": {"y": 2}}
+        result = deep_merge(base, override)
+
+        assert result["a"] is nested
+        assert nested == {"x": 1, "y": 2}
+
+
+class TestNormalizeText:
+    def test_case_and_whitespace(self):
+        """Test that case and surrounding whitespace are normalized."""
+        assert normalize_text("  São Paulo ") == "são paulo"
+
+    def test_unicode_variants(self):
+        """Test that compatibility and case-folding variants share a form."""
+        assert normalize_text("Ｐａｒｉｓ") == normalize_text("paris")
+        assert normalize_text("STRASSE") == normalize_text("Straße")
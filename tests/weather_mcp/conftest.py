@@ -4,6 +4,51 @@ from unittest.mock import AsyncMock
 import pytest
 from mcp.server.fastmcp import Context
 
+from core import geo_cache, response_cache
+from core.aimd_gate import AIMDGate
+from core.rate_limiter import AsyncRateLimiter
+from weather_mcp.tools.air_pollution import _history_cache
+from weather_mcp.tools.forecast import _city_coords
+from weather_mcp.tools.geocoding import _geo_cache
+from weather_mcp.utils import _not_found_cache, _response_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_geo_cache(monkeypatch, tmp_path):
+    """Automatically clear the geocoding caches before each test"""
+    monkeypatch.setenv("GEO_CACHE_DIR", str(tmp_path))
+    _geo_cache.clear()
+    yield
+    _geo_cache.clear()
+    geo_cache.close()
+
+
+@pytest.fixture(autouse=True)
+def clear_response_cache(monkeypatch, tmp_path):
+    """Automatically clear the OpenWeather response caches before each test"""
+    monkeypatch.setenv("RESPONSE_CACHE_DIR", str(tmp_path))
+    _response_cache.clear()
+    _not_found_cache.clear()
+    _history_cache.clear()
+    _city_coords.clear()
+    yield
+    _response_cache.clear()
+    _not_found_cache.clear()
+    _history_cache.clear()
+    _city_coords.clear()
+    response_cache.close()
+
+
+@pytest.fixture(autouse=True)
+def reset_rate_limiter(monkeypatch):
+    """Give each test a fresh OpenWeather rate limiter and concurrency gate"""
+    monkeypatch.setattr(
+        "weather_mcp.utils._rate_limiter", AsyncRateLimiter(1000, time_period=60)
+    )
+    monkeypatch.setattr(
+        "weather_mcp.utils._gate", AIMDGate(initial=8, maximum=64, latency_target=1.0)
+    )
+
 
 @pytest.fixture
 def mock_context():
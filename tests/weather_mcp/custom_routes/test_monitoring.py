@@ -6,6 +6,7 @@ from prometheus_client import CONTENT_TYPE_LATEST
 from starlette.requests import Request
 from starlette.responses import JSONResponse, PlainTextResponse
 
+from core.monitoring import registry
 from weather_mcp.custom_routes.monitoring import healthz, metrics_endpoint, readyz
 
 
@@ -35,9 +36,9 @@ class TestReadyzEndpoint:
     """Test suite for /readyz endpoint"""
 
     @pytest.mark.asyncio
-    @patch("httpx.AsyncClient")
+    @patch("weather_mcp.custom_routes.monitoring.get_http_client")
     @patch("weather_mcp.custom_routes.monitoring.logger")
-    async def test_readyz_success(self, mock_logger, mock_client_class):
+    async def test_readyz_success(self, mock_logger, mock_get_client):
         """Test readyz endpoint when OpenWeather API is available"""
         # Create a mock response
         mock_response = MagicMock()
@@ -53,8 +54,8 @@ class TestReadyzEndpoint:
         mock_client_instance = MagicMock()
         mock_client_instance.get = AsyncMock(return_value=mock_response)
 
-        # Mock the context manager behavior
-        mock_client_class.return_value.__aenter__.return_value = mock_client_instance
+        # Mock the shared client
+        mock_get_client.return_value = mock_client_instance
 
         # Create mock request and call endpoint
         request = MagicMock(spec=Request)
@@ -68,15 +69,15 @@ class TestReadyzEndpoint:
         mock_logger.debug.assert_any_call("Readiness check endpoint called")
 
     @pytest.mark.asyncio
-    @patch("httpx.AsyncClient")
+    @patch("weather_mcp.custom_routes.monitoring.get_http_client")
     @patch("weather_mcp.custom_routes.monitoring.logger")
-    async def test_readyz_http_status_error(self, mock_logger, mock_client_class):
+    async def test_readyz_http_status_error(self, mock_logger, mock_get_client):
         """Test readyz endpoint when OpenWeather API returns HTTP error"""
         # Simulate an HTTP error from the OpenWeather API
         mock_error = httpx.HTTPStatusError(
             "Bad Request", request=MagicMock(), response=MagicMock(status_code=400)
         )
-        mock_client_class.side_effect = mock_error
+        mock_get_client.side_effect = mock_error
 
         # Create a mock request
         request = MagicMock(spec=Request)
@@ -91,12 +92,12 @@ class TestReadyzEndpoint:
         mock_logger.debug.assert_called_with("Readiness check endpoint called")
 
     @pytest.mark.asyncio
-    @patch("httpx.AsyncClient")
+    @patch("weather_mcp.custom_routes.monitoring.get_http_client")
     @patch("weather_mcp.custom_routes.monitoring.logger")
-    async def test_readyz_request_error(self, mock_logger, mock_client_class):
+    async def test_readyz_request_error(self, mock_logger, mock_get_client):
         """Test readyz endpoint when OpenWeather API has connection issues"""
         mock_error = httpx.RequestError("Connection timeout")
-        mock_client_class.side_effect = mock_error
+        mock_get_client.side_effect = mock_error
 
         # Create a mock request
         request = MagicMock(spec=Request)
@@ -115,22 +116,20 @@ class TestMetricsEndpoint:
     """Test suite for /metrics endpoint"""
 
     @pytest.fixture
-    def mock_process_data(self):
-        """Mock psutil.Process for testing"""
-        mock_proc = MagicMock()
-        mock_proc.memory_info.return_value.rss = 1024 * 1024 * 100  # 100MB
-        mock_proc.cpu_percent.return_value = 25.5
-        return mock_proc
+    def mock_process(self):
+        """Mock the cached psutil.Process for testing"""
+        with patch("weather_mcp.custom_routes.monitoring._process") as mock_proc:
+            mock_proc.memory_info.return_value.rss = 1024 * 1024 * 100  # 100MB
+            mock_proc.cpu_percent.return_value = 25.5
+            yield mock_proc
 
     @pytest.mark.asyncio
     @patch("weather_mcp.custom_routes.monitoring.logger")
     @patch("weather_mcp.custom_routes.monitoring.generate_latest")
-    @patch("weather_mcp.custom_routes.monitoring.psutil.Process")
     async def test_metrics_endpoint_success(
-        self, mock_psutil_process, mock_generate, mock_logger, mock_process_data
+        self, mock_generate, mock_logger, mock_process
     ):
         """Test metrics endpoint returns Prometheus format metrics"""
-        mock_psutil_process.return_value = mock_process_data
         mock_generate.return_value = b"# Prometheus metrics data"
 
         request = MagicMock(spec=Request)
@@ -141,25 +140,23 @@ class TestMetricsEndpoint:
         assert response.body == b"# Prometheus metrics data"
         assert response.headers["content-type"] == CONTENT_TYPE_LATEST
 
-        # Verify psutil calls
-        mock_process_data.memory_info.assert_called_once()
-        mock_process_data.cpu_percent.assert_called_once()
+        # Verify the cached process handle was used
+        mock_process.memory_info.assert_called_once()
+        mock_process.cpu_percent.assert_called_once()
 
         # Verify logging
         mock_logger.debug.assert_called_once_with("Metrics endpoint called")
 
-        # Verify generate_latest was called
-        mock_generate.assert_called_once()
+        # Verify generate_latest was called with the application registry
+        mock_generate.assert_called_once_with(registry)
 
     @pytest.mark.asyncio
     @patch("weather_mcp.custom_routes.monitoring.memory_usage")
     @patch("weather_mcp.custom_routes.monitoring.generate_latest")
-    @patch("weather_mcp.custom_routes.monitoring.psutil.Process")
     async def test_metrics_endpoint_sets_memory_usage(
-        self, mock_psutil_process, mock_generate, mock_memory_gauge, mock_process_data
+        self, mock_generate, mock_memory_gauge, mock_process
     ):
         """Test that metrics endpoint sets memory usage gauge"""
-        mock_psutil_process.return_value = mock_process_data
         mock_generate.return_value = b""
 
         request = MagicMock(spec=Request)
@@ -171,12 +168,10 @@ class TestMetricsEndpoint:
     @pytest.mark.asyncio
     @patch("weather_mcp.custom_routes.monitoring.cpu_usage")
     @patch("weather_mcp.custom_routes.monitoring.generate_latest")
-    @patch("weather_mcp.custom_routes.monitoring.psutil.Process")
     async def test_metrics_endpoint_sets_cpu_usage(
-        self, mock_psutil_process, mock_generate, mock_cpu_gauge, mock_process_data
+        self, mock_generate, mock_cpu_gauge, mock_process
     ):
         """Test that metrics endpoint sets CPU usage gauge"""
-        mock_psutil_process.return_value = mock_process_data
         mock_generate.return_value = b""
 
         request = MagicMock(spec=Request)
@@ -184,3 +179,14 @@ class TestMetricsEndpoint:
 
         # Verify CPU usage was set
         mock_cpu_gauge.set.assert_called_once_with(25.5)
+
+    @pytest.mark.asyncio
+    async def test_metrics_endpoint_includes_default_collectors(self, mock_process):
+        """Test that metrics include the process, GC and platform series"""
+        request = MagicMock(spec=Request)
+        response = await metrics_endpoint(request)
+
+        assert b"mcp_memory_usage_bytes" in response.body
+        assert b"python_gc_objects_collected_total" in response.body
+        assert b"python_info" in response.body
+        assert b"process_" in response.body
@@ -1,17 +1,30 @@
-from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock, call, patch
 
 import httpx
+import orjson
 import pytest
 from mcp.server.fastmcp.exceptions import ToolError
 
 from config.settings_config import get_settings
 from enums.openweather import OpenWeatherEndpoint
-from weather_mcp.utils import call_openweather_api
+from weather_mcp.utils import (
+    _get_cache_key,
+    _get_endpoint_url,
+    _get_retry_delay,
+    _get_response_ttl,
+    _refreshes,
+    _response_cache,
+    call_openweather_api,
+    gather_bounded,
+    get_city_query,
+)
 
 
 class TestCallOpenWeatherApi:
     @pytest.mark.asyncio
-    @patch("httpx.AsyncClient")
+    @patch("weather_mcp.utils.get_http_client")
     async def test_successful_weather_api_call(
         self, mock_client, mock_context, sample_weather_response
     ):
@@ -21,13 +34,11 @@ class TestCallOpenWeatherApi:
         # Mock the HTTP response
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = sample_weather_response
+        mock_response.content = orjson.dumps(sample_weather_response)
         mock_response.raise_for_status = MagicMock()
 
         # Mock the async context manager
-        mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-            return_value=mock_response
-        )
+        mock_client.return_value.get = AsyncMock(return_value=mock_response)
 
         result = await call_openweather_api(
             OpenWeatherEndpoint.CURRENT_WEATHER, params, mock_context
@@ -60,7 +71,7 @@ class TestCallOpenWeatherApi:
         )
 
     @pytest.mark.asyncio
-    @patch("httpx.AsyncClient")
+    @patch("weather_mcp.utils.get_http_client")
     async def test_geocoding_endpoint_uses_correct_base_url(
         self, mock_client, mock_context
     ):
@@ -69,22 +80,20 @@ class TestCallOpenWeatherApi:
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = [
-            {"name": "London", "lat": 51.5085, "lon": -0.1257}
-        ]
+        mock_response.content = orjson.dumps(
+            [{"name": "London", "lat": 51.5085, "lon": -0.1257}]
+        )
         mock_response.raise_for_status = MagicMock()
 
-        mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-            return_value=mock_response
-        )
+        mock_client.return_value.get = AsyncMock(return_value=mock_response)
 
         await call_openweather_api(
             OpenWeatherEndpoint.DIRECT_GEOCODING, params, mock_context
         )
 
         # Verify the correct URL was constructed
-        mock_client.return_value.__aenter__.return_value.get.assert_called_once()
-        call_args = mock_client.return_value.__aenter__.return_value.get.call_args
+        mock_client.return_value.get.assert_called_once()
+        call_args = mock_client.return_value.get.call_args
 
         # The URL should contain the geo base URL
         assert (
@@ -93,7 +102,7 @@ class TestCallOpenWeatherApi:
         )
 
     @pytest.mark.asyncio
-    @patch("httpx.AsyncClient")
+    @patch("weather_mcp.utils.get_http_client")
     async def test_api_key_and_units_added_automatically(
         self, mock_client, mock_context, sample_weather_response
     ):
@@ -102,19 +111,17 @@ class TestCallOpenWeatherApi:
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = sample_weather_response
+        mock_response.content = orjson.dumps(sample_weather_response)
         mock_response.raise_for_status = MagicMock()
 
-        mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-            return_value=mock_response
-        )
+        mock_client.return_value.get = AsyncMock(return_value=mock_response)
 
         await call_openweather_api(
             OpenWeatherEndpoint.CURRENT_WEATHER, params, mock_context
         )
 
         # Verify API key and units were added
-        call_args = mock_client.return_value.__aenter__.return_value.get.call_args
+        call_args = mock_client.return_value.get.call_args
         expected_params = {
             "q": "London",
             "appid": get_settings().openweather_api_key,
@@ -123,7 +130,7 @@ class TestCallOpenWeatherApi:
         assert call_args[1]["params"] == expected_params
 
     @pytest.mark.asyncio
-    @patch("httpx.AsyncClient")
+    @patch("weather_mcp.utils.get_http_client")
     async def test_custom_units_preserved(
         self, mock_client, mock_context, sample_weather_response
     ):
@@ -132,19 +139,17 @@ class TestCallOpenWeatherApi:
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = sample_weather_response
+        mock_response.content = orjson.dumps(sample_weather_response)
         mock_response.raise_for_status = MagicMock()
 
-        mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-            return_value=mock_response
-        )
+        mock_client.return_value.get = AsyncMock(return_value=mock_response)
 
         await call_openweather_api(
             OpenWeatherEndpoint.CURRENT_WEATHER, params, mock_context
         )
 
         # Verify custom units were preserved
-        call_args = mock_client.return_value.__aenter__.return_value.get.call_args
+        call_args = mock_client.return_value.get.call_args
         expected_params = {
             "q": "London",
             "appid": get_settings().openweather_api_key,
@@ -153,7 +158,28 @@ class TestCallOpenWeatherApi:
         assert call_args[1]["params"] == expected_params
 
     @pytest.mark.asyncio
-    @patch("httpx.AsyncClient")
+    @patch("weather_mcp.utils.get_http_client")
+    async def test_caller_params_not_mutated(
+        self, mock_client, mock_context, sample_weather_response
+    ):
+        """Test that the caller's params dict is left untouched."""
+        params = {"q": "London"}
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = orjson.dumps(sample_weather_response)
+        mock_response.raise_for_status = MagicMock()
+
+        mock_client.return_value.get = AsyncMock(return_value=mock_response)
+
+        await call_openweather_api(
+            OpenWeatherEndpoint.CURRENT_WEATHER, params, mock_context
+        )
+
+        assert params == {"q": "London"}
+
+    @pytest.mark.asyncio
+    @patch("weather_mcp.utils.get_http_client")
     async def test_http_404_error_handling(self, mock_client, mock_context):
         """Test handling of 404 HTTP errors."""
         params = {"q": "NonexistentCity"}
@@ -168,9 +194,7 @@ class TestCallOpenWeatherApi:
         )
         mock_response.raise_for_status.side_effect = http_error
 
-        mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-            return_value=mock_response
-        )
+        mock_client.return_value.get = AsyncMock(return_value=mock_response)
 
         with pytest.raises(
             ToolError, match="Weather data not found for the given location"
@@ -183,7 +207,7 @@ class TestCallOpenWeatherApi:
         mock_context.warning.assert_called_once()
 
     @pytest.mark.asyncio
-    @patch("httpx.AsyncClient")
+    @patch("weather_mcp.utils.get_http_client")
     async def test_http_500_error_handling(self, mock_client, mock_context):
         """Test handling of 500 HTTP errors."""
         params = {"q": "London"}
@@ -198,9 +222,7 @@ class TestCallOpenWeatherApi:
         )
         mock_response.raise_for_status.side_effect = http_error
 
-        mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-            return_value=mock_response
-        )
+        mock_client.return_value.get = AsyncMock(return_value=mock_response)
 
         with pytest.raises(ToolError, match="Weather service returned an error"):
             await call_openweather_api(
@@ -211,16 +233,14 @@ class TestCallOpenWeatherApi:
         mock_context.warning.assert_called_once()
 
     @pytest.mark.asyncio
-    @patch("httpx.AsyncClient")
+    @patch("weather_mcp.utils.get_http_client")
     async def test_network_error_handling(self, mock_client, mock_context):
         """Test handling of network/connection errors."""
         params = {"q": "London"}
 
         # Mock network error
         network_error = httpx.RequestError("Connection failed")
-        mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-            side_effect=network_error
-        )
+        mock_client.return_value.get = AsyncMock(side_effect=network_error)
 
         with pytest.raises(ToolError, match="An unexpected error occurred"):
             await call_openweather_api(
@@ -231,27 +251,721 @@ class TestCallOpenWeatherApi:
         mock_context.error.assert_called_once()
 
     @pytest.mark.asyncio
-    @patch("httpx.AsyncClient")
+    @patch("weather_mcp.utils.get_http_client")
     async def test_timeout_configuration(
-        self, mock_client_class, mock_context, sample_weather_response
+        self, mock_get_client, mock_context, sample_weather_response
     ):
-        """Test that HTTP client is configured with correct timeout."""
+        """Test that the request is sent through the shared client with a timeout."""
         params = {"q": "London"}
 
-        mock_client_instance = MagicMock()
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = sample_weather_response
+        mock_response.content = orjson.dumps(sample_weather_response)
         mock_response.raise_for_status = MagicMock()
 
-        mock_client_instance.__aenter__.return_value.get = AsyncMock(
-            return_value=mock_response
+        mock_get_client.return_value.get = AsyncMock(return_value=mock_response)
+
+        await call_openweather_api(
+            OpenWeatherEndpoint.CURRENT_WEATHER, params, mock_context
+        )
+
+        # Verify the shared client was used with the correct timeout
+        mock_get_client.assert_called_once_with()
+        assert mock_get_client.return_value.get.call_args[1]["timeout"] == 2.0
+
+
+class TestCircuitBreaker:
+    @pytest.mark.asyncio
+    @patch("weather_mcp.utils.get_http_client")
+    async def test_repeated_server_errors_open_circuit(self, mock_client, mock_context):
+        """Test that consecutive 5xx responses stop further upstream calls."""
+        mock_response = MagicMock()
+        mock_response.status_code = 503
+        mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
+            "Service unavailable", request=MagicMock(), response=mock_response
+        )
+        mock_client.return_value.get = AsyncMock(return_value=mock_response)
+
+        for _ in range(5):
+            with pytest.raises(ToolError, match="returned an error"):
+                await call_openweather_api(
+                    OpenWeatherEndpoint.FORECAST, {"q": "London"}, mock_context
+                )
+
+        with pytest.raises(ToolError, match="temporarily unavailable"):
+            await call_openweather_api(
+                OpenWeatherEndpoint.FORECAST, {"q": "London"}, mock_context
+            )
+
+        assert mock_client.return_value.get.call_count == 5
+
+    @pytest.mark.asyncio
+    @patch("weather_mcp.utils.get_http_client")
+    async def test_not_found_does_not_count_as_failure(self, mock_client, mock_context):
+        """Test that 404 responses do not trip the circuit breaker."""
+        mock_response = MagicMock()
+        mock_response.status_code = 404
+        mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
+            "Not found", request=MagicMock(), response=mock_response
+        )
+        mock_client.return_value.get = AsyncMock(return_value=mock_response)
+
+        for i in range(6):
+            with pytest.raises(ToolError, match="not found"):
+                await call_openweather_api(
+                    OpenWeatherEndpoint.FORECAST, {"q": f"Nowhere{i}"}, mock_context
+                )
+
+        assert mock_client.return_value.get.call_count == 6
+
+    @pytest.mark.asyncio
+    @patch("weather_mcp.utils.get_http_client")
+    async def test_cancelled_requests_do_not_open_circuit(
+        self, mock_client, mock_context, sample_weather_response
+    ):
+        """Test that requests cancelled by the client are not counted as failures."""
+        mock_client.return_value.get = AsyncMock(side_effect=asyncio.CancelledError)
+
+        for i in range(6):
+            with pytest.raises(asyncio.CancelledError):
+                await call_openweather_api(
+                    OpenWeatherEndpoint.CURRENT_WEATHER, {"q": f"City{i}"}, mock_context
+                )
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = orjson.dumps(sample_weather_response)
+        mock_client.return_value.get = AsyncMock(return_value=mock_response)
+
+        result = await call_openweather_api(
+            OpenWeatherEndpoint.CURRENT_WEATHER, {"q": "London"}, mock_context
+        )
+
+        assert result == sample_weather_response
+
+
+class TestRateLimitRetry:
+    @staticmethod
+    def _rate_limited(headers):
+        response = MagicMock()
+        response.status_code = 429
+        response.headers = httpx.Headers(headers)
+        response.raise_for_status.side_effect = httpx.HTTPStatusError(
+            "Too many requests", request=MagicMock(), response=response
+        )
+        return response
+
+    @pytest.mark.asyncio
+    @patch("weather_mcp.utils.get_http_client")
+    async def test_retries_after_retry_after(
+        self, mock_client, mock_context, sample_weather_response
+    ):
+        """Test that a 429 is retried after the advertised delay."""
+        ok_response = MagicMock()
+        ok_response.status_code = 200
+        ok_response.content = orjson.dumps(sample_weather_response)
+        mock_client.return_value.get = AsyncMock(
+            side_effect=[self._rate_limited({"Retry-After": "0"}), ok_response]
+        )
+
+        result = await call_openweather_api(
+            OpenWeatherEndpoint.FORECAST, {"q": "London"}, mock_context
+        )
+
+        assert result == sample_weather_response
+        assert mock_client.return_value.get.call_count == 2
+
+    @pytest.mark.asyncio
+    @patch("weather_mcp.utils.get_http_client")
+    async def test_gives_up_after_max_retries(self, mock_client, mock_context):
+        """Test that persistent 429 responses end in a ToolError."""
+        mock_client.return_value.get = AsyncMock(
+            return_value=self._rate_limited({"Retry-After": "0"})
+        )
+
+        with pytest.raises(ToolError):
+            await call_openweather_api(
+                OpenWeatherEndpoint.FORECAST, {"q": "London"}, mock_context
+            )
+
+        assert mock_client.return_value.get.call_count == 3
+
+    @pytest.mark.asyncio
+    @patch("weather_mcp.utils.get_http_client")
+    async def test_long_delay_not_retried(self, mock_client, mock_context):
+        """Test that a 429 asking for a long wait fails without retrying."""
+        mock_client.return_value.get = AsyncMock(
+            return_value=self._rate_limited({"Retry-After": "3600"})
+        )
+
+        with pytest.raises(ToolError):
+            await call_openweather_api(
+                OpenWeatherEndpoint.FORECAST, {"q": "London"}, mock_context
+            )
+
+        mock_client.return_value.get.assert_called_once()
+
+
+class TestGetRetryDelay:
+    def test_retry_after_seconds(self):
+        """Test that Retry-After delta-seconds are used as is."""
+        assert _get_retry_delay(httpx.Headers({"Retry-After": "3"})) == 3.0
+
+    @patch("weather_mcp.utils.time.time", return_value=1_700_000_000.0)
+    def test_retry_after_http_date(self, mock_time):
+        """Test that a Retry-After HTTP date is converted to a delay."""
+        headers = httpx.Headers({"Retry-After": "Tue, 14 Nov 2023 22:13:25 GMT"})
+
+        assert _get_retry_delay(headers) == 5.0
+
+    @patch("weather_mcp.utils.time.time", return_value=1_700_000_000.0)
+    def test_rate_limit_reset_timestamp(self, mock_time):
+        """Test that an absolute X-RateLimit-Reset is converted to a delay."""
+        headers = httpx.Headers({"X-RateLimit-Reset": "1700000004"})
+
+        assert _get_retry_delay(headers) == 4.0
+
+    def test_default_delay(self):
+        """Test the fallback delay when no header is present."""
+        assert _get_retry_delay(httpx.Headers()) == 1.0
+
+
+class TestGetEndpointUrl:
+    def test_weather_endpoint_uses_base_url(self):
+        """Test that weather endpoints are built from the base URL."""
+        assert _get_endpoint_url(OpenWeatherEndpoint.FORECAST) == (
+            str(get_settings().openweather_base_url).rstrip("/") + "/forecast"
+        )
+
+    def test_geocoding_endpoint_uses_geo_base_url(self):
+        """Test that geocoding endpoints are built from the geo base URL."""
+        assert _get_endpoint_url(OpenWeatherEndpoint.REVERSE_GEOCODING) == (
+            str(get_settings().openweather_geo_base_url).rstrip("/") + "/reverse"
+        )
+
+    def test_url_is_cached(self):
+        """Test that the URL is only built once per endpoint."""
+        url = _get_endpoint_url(OpenWeatherEndpoint.CURRENT_WEATHER)
+
+        assert _get_endpoint_url(OpenWeatherEndpoint.CURRENT_WEATHER) is url
+
+    def test_url_is_parsed(self):
+        """Test that the URL is returned pre-parsed for httpx."""
+        url = _get_endpoint_url(OpenWeatherEndpoint.CURRENT_AIR_POLLUTION)
+
+        assert isinstance(url, httpx.URL)
+        assert url.path.endswith("/air_pollution")
+
+
+class TestGatherBounded:
+    @pytest.mark.asyncio
+    async def test_limits_concurrency(self):
+        """Test that no more than ``limit`` awaitables run at once."""
+        running = 0
+        peak = 0
+
+        async def task(value):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0)
+            running -= 1
+            return value
+
+        result = await gather_bounded((task(i) for i in range(10)), limit=3)
+
+        assert result == list(range(10))
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_exceptions_returned_in_place(self):
+        """Test that a failure is returned without cancelling the others."""
+
+        async def fail():
+            raise ToolError("boom")
+
+        async def succeed():
+            return "ok"
+
+        result = await gather_bounded([fail(), succeed()], limit=2)
+
+        assert isinstance(result[0], ToolError)
+        assert result[1] == "ok"
+
+
+class TestResponseCache:
+    @pytest.mark.asyncio
+    @patch("weather_mcp.utils.get_http_client")
+    async def test_air_pollution_response_cached(
+        self, mock_client, mock_context, sample_weather_response
+    ):
+        """Test that nearby coordinates reuse a cached air pollution response."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = orjson.dumps(sample_weather_response)
+        mock_client.return_value.get = AsyncMock(return_value=mock_response)
+
+        first = await call_openweather_api(
+            OpenWeatherEndpoint.CURRENT_AIR_POLLUTION,
+            {"lat": 51.5085, "lon": -0.1257},
+            mock_context,
+        )
+        second = await call_openweather_api(
+            OpenWeatherEndpoint.CURRENT_AIR_POLLUTION,
+            {"lat": 51.5091, "lon": -0.1263},
+            mock_context,
+        )
+
+        assert first == second == sample_weather_response
+        mock_client.return_value.get.assert_called_once()
+
+    @pytest.mark.asyncio
+    @patch("weather_mcp.utils.cache_requests_counter")
+    @patch("weather_mcp.utils.get_http_client")
+    async def test_hits_and_misses_counted(
+        self, mock_client, mock_counter, mock_context, sample_weather_response
+    ):
+        """Test that cache lookups are counted by endpoint and result."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = orjson.dumps(sample_weather_response)
+        mock_client.return_value.get = AsyncMock(return_value=mock_response)
+
+        for _ in range(2):
+            await call_openweather_api(
+                OpenWeatherEndpoint.CURRENT_WEATHER, {"q": "London"}, mock_context
+            )
+
+        assert mock_counter.labels.call_args_list == [
+            call("weather", "miss"),
+            call("weather", "hit"),
+        ]
+
+    @pytest.mark.asyncio
+    @patch("weather_mcp.utils.get_http_client")
+    async def test_concurrent_identical_requests_coalesced(
+        self, mock_client, mock_context, sample_weather_response
+    ):
+        """Test that concurrent identical requests share one network call."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = orjson.dumps(sample_weather_response)
+        mock_client.return_value.get = AsyncMock(return_value=mock_response)
+
+        results = await asyncio.gather(
+            *(
+                call_openweather_api(
+                    OpenWeatherEndpoint.CURRENT_AIR_POLLUTION,
+                    {"lat": 40.71, "lon": -74.01},
+                    mock_context,
+                )
+                for _ in range(5)
+            )
+        )
+
+        assert results == [sample_weather_response] * 5
+        mock_client.return_value.get.assert_called_once()
+
+    @pytest.mark.asyncio
+    @patch("weather_mcp.utils.get_http_client")
+    async def test_uncached_endpoint_concurrent_requests_coalesced(
+        self, mock_client, mock_context, sample_weather_response
+    ):
+        """Test that concurrent identical uncached requests share one call."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = orjson.dumps(sample_weather_response)
+
+        async def slow_get(*args, **kwargs):
+            await asyncio.sleep(0)
+            return mock_response
+
+        mock_client.return_value.get = AsyncMock(side_effect=slow_get)
+
+        params = {"lat": 51.5085, "lon": -0.1257}
+        await asyncio.gather(
+            call_openweather_api(
+                OpenWeatherEndpoint.REVERSE_GEOCODING, params, mock_context
+            ),
+            call_openweather_api(
+                OpenWeatherEndpoint.REVERSE_GEOCODING, params, mock_context
+            ),
+            call_openweather_api(
+                OpenWeatherEndpoint.REVERSE_GEOCODING,
+                {"lat": 51.5091, "lon": -0.1257},
+                mock_context,
+            ),
         )
-        mock_client_class.return_value = mock_client_instance
 
+        # The two identical requests share a call; the nearby point does not
+        assert mock_client.return_value.get.call_count == 2
+
+    @pytest.mark.asyncio
+    @patch("weather_mcp.utils.get_http_client")
+    async def test_disk_cache_survives_memory_clear(
+        self, mock_client, mock_context, sample_weather_response
+    ):
+        """Test that responses are served from disk after the memory cache is lost."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = orjson.dumps(sample_weather_response)
+        mock_client.return_value.get = AsyncMock(return_value=mock_response)
+
+        params = {"q": "London", "lang": "en"}
         await call_openweather_api(
             OpenWeatherEndpoint.CURRENT_WEATHER, params, mock_context
         )
 
-        # Verify client was created with correct timeout
-        mock_client_class.assert_called_once_with(timeout=2.0)
+        # Simulate a restart
+        _response_cache.clear()
+
+        result = await call_openweather_api(
+            OpenWeatherEndpoint.CURRENT_WEATHER, params, mock_context
+        )
+
+        assert result == sample_weather_response
+        mock_client.return_value.get.assert_called_once()
+
+    @pytest.mark.asyncio
+    @patch("weather_mcp.utils.get_http_client")
+    async def test_stale_response_served_while_refreshing(
+        self, mock_client, mock_context, sample_weather_response
+    ):
+        """Test that a stale weather response is served and refreshed in the background."""
+        old_response = MagicMock()
+        old_response.status_code = 200
+        old_response.content = orjson.dumps({"main": {"temp": 10}})
+        mock_client.return_value.get = AsyncMock(return_value=old_response)
+
+        params = {"q": "London", "lang": "en"}
+        await call_openweather_api(
+            OpenWeatherEndpoint.CURRENT_WEATHER, params, mock_context
+        )
+
+        # Mark the cached entry as past its ttl but within the stale period
+        key = _get_cache_key(OpenWeatherEndpoint.CURRENT_WEATHER, params)
+        _, data = _response_cache.get(key)
+        _response_cache.set(key, (time.monotonic() - 1, data))
+
+        new_response = MagicMock()
+        new_response.status_code = 200
+        new_response.content = orjson.dumps(sample_weather_response)
+        mock_client.return_value.get = AsyncMock(return_value=new_response)
+
+        stale = await call_openweather_api(
+            OpenWeatherEndpoint.CURRENT_WEATHER, params, mock_context
+        )
+        assert stale == {"main": {"temp": 10}}
+
+        await asyncio.gather(*_refreshes.values())
+
+        fresh = await call_openweather_api(
+            OpenWeatherEndpoint.CURRENT_WEATHER, params, mock_context
+        )
+        assert fresh == sample_weather_response
+        mock_client.return_value.get.assert_called_once()
+
+    @pytest.mark.asyncio
+    @patch("weather_mcp.utils.get_http_client")
+    async def test_background_refresh_does_not_notify_client(
+        self, mock_client, mock_context, sample_weather_response
+    ):
+        """Test that a background refresh leaves the finished call's context alone."""
+        response = MagicMock()
+        response.status_code = 200
+        response.content = orjson.dumps(sample_weather_response)
+        mock_client.return_value.get = AsyncMock(return_value=response)
+
+        params = {"q": "London", "lang": "en"}
+        await call_openweather_api(
+            OpenWeatherEndpoint.CURRENT_WEATHER, params, mock_context
+        )
+
+        key = _get_cache_key(OpenWeatherEndpoint.CURRENT_WEATHER, params)
+        _, data = _response_cache.get(key)
+        _response_cache.set(key, (time.monotonic() - 1, data))
+
+        await call_openweather_api(
+            OpenWeatherEndpoint.CURRENT_WEATHER, params, mock_context
+        )
+        # The session is gone by the time the refresh runs
+        mock_context.reset_mock()
+        mock_context.info.side_effect = RuntimeError("session closed")
+        mock_context.report_progress.side_effect = RuntimeError("session closed")
+
+        await asyncio.gather(*_refreshes.values())
+
+        assert mock_client.return_value.get.call_count == 2
+        mock_context.info.assert_not_called()
+        mock_context.report_progress.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch("time.monotonic")
+    @patch("weather_mcp.utils.get_http_client")
+    async def test_forecast_served_stale_for_longer(
+        self, mock_client, mock_monotonic, mock_context, sample_forecast_response
+    ):
+        """Test that a forecast is served stale well past its ttl while refreshing."""
+        mock_monotonic.return_value = 10_000.0
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = orjson.dumps(sample_forecast_response)
+        mock_client.return_value.get = AsyncMock(return_value=mock_response)
+
+        params = {"q": "London", "lang": "en"}
+        await call_openweather_api(OpenWeatherEndpoint.FORECAST, params, mock_context)
+
+        # Past the 30 minute ttl, within the 90 minute stale period
+        mock_monotonic.return_value += 100 * 60
+        result = await call_openweather_api(
+            OpenWeatherEndpoint.FORECAST, params, mock_context
+        )
+        await asyncio.gather(*_refreshes.values())
+
+        assert result == sample_forecast_response
+        assert mock_client.return_value.get.call_count == 2
+
+    @pytest.mark.asyncio
+    @patch("weather_mcp.utils.random.uniform")
+    @patch("time.monotonic")
+    @patch("weather_mcp.utils.get_http_client")
+    async def test_ttl_jittered(
+        self,
+        mock_client,
+        mock_monotonic,
+        mock_uniform,
+        mock_context,
+        sample_weather_response,
+    ):
+        """Test that cached responses expire after a jittered ttl."""
+        mock_monotonic.return_value = 10_000.0
+        mock_uniform.return_value = 0.9
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = orjson.dumps(sample_weather_response)
+        mock_client.return_value.get = AsyncMock(return_value=mock_response)
+
+        params = {"q": "London", "lang": "en"}
+        await call_openweather_api(
+            OpenWeatherEndpoint.CURRENT_WEATHER, params, mock_context
+        )
+
+        mock_uniform.assert_called_once_with(0.9, 1.1)
+        fresh_until, _ = _response_cache.get(
+            _get_cache_key(OpenWeatherEndpoint.CURRENT_WEATHER, params)
+        )
+        assert fresh_until == pytest.approx(10_000.0 + 0.9 * 5 * 60)
+
+    @pytest.mark.asyncio
+    @patch("weather_mcp.utils.get_http_client")
+    async def test_failed_refresh_keeps_stale_response(
+        self, mock_client, mock_context, sample_weather_response
+    ):
+        """Test that a failed background refresh keeps serving the stale response."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = orjson.dumps(sample_weather_response)
+        mock_client.return_value.get = AsyncMock(return_value=mock_response)
+
+        params = {"q": "London", "lang": "en"}
+        await call_openweather_api(
+            OpenWeatherEndpoint.CURRENT_WEATHER, params, mock_context
+        )
+
+        key = _get_cache_key(OpenWeatherEndpoint.CURRENT_WEATHER, params)
+        _, data = _response_cache.get(key)
+        _response_cache.set(key, (time.monotonic() - 1, data))
+
+        mock_client.return_value.get = AsyncMock(
+            side_effect=httpx.ConnectError("Connection failed")
+        )
+
+        for _ in range(2):
+            result = await call_openweather_api(
+                OpenWeatherEndpoint.CURRENT_WEATHER, params, mock_context
+            )
+            assert result == sample_weather_response
+            await asyncio.gather(*_refreshes.values())
+
+        assert mock_client.return_value.get.call_count == 2
+
+    @pytest.mark.asyncio
+    @patch("weather_mcp.utils.get_http_client")
+    async def test_not_found_remembered(self, mock_client, mock_context):
+        """Test that repeated lookups of an unknown location fail without a request."""
+        mock_response = MagicMock()
+        mock_response.status_code = 404
+        mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
+            "Not found", request=MagicMock(), response=mock_response
+        )
+        mock_client.return_value.get = AsyncMock(return_value=mock_response)
+
+        for _ in range(3):
+            with pytest.raises(
+                ToolError, match="Weather data not found for the given location"
+            ):
+                await call_openweather_api(
+                    OpenWeatherEndpoint.FORECAST, {"q": "Xyzzy"}, mock_context
+                )
+
+        mock_client.return_value.get.assert_called_once()
+
+    @pytest.mark.asyncio
+    @patch("weather_mcp.utils.get_http_client")
+    async def test_server_error_not_remembered(self, mock_client, mock_context):
+        """Test that failures other than 404 are retried on the next request."""
+        mock_response = MagicMock()
+        mock_response.status_code = 500
+        mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
+            "Server error", request=MagicMock(), response=mock_response
+        )
+        mock_client.return_value.get = AsyncMock(return_value=mock_response)
+
+        for _ in range(2):
+            with pytest.raises(ToolError, match="Try again later"):
+                await call_openweather_api(
+                    OpenWeatherEndpoint.FORECAST, {"q": "London"}, mock_context
+                )
+
+        assert mock_client.return_value.get.call_count == 2
+
+    @pytest.mark.asyncio
+    @patch("weather_mcp.utils.get_http_client")
+    async def test_uncached_endpoint_always_fetched(
+        self, mock_client, mock_context, sample_weather_response
+    ):
+        """Test that endpoints without a ttl are not cached."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = orjson.dumps(sample_weather_response)
+        mock_client.return_value.get = AsyncMock(return_value=mock_response)
+
+        for _ in range(2):
+            await call_openweather_api(
+                OpenWeatherEndpoint.REVERSE_GEOCODING,
+                {"lat": 51.5085, "lon": -0.1257},
+                mock_context,
+            )
+
+        assert mock_client.return_value.get.call_count == 2
+
+    @pytest.mark.asyncio
+    @patch("weather_mcp.utils.get_http_client")
+    async def test_errors_not_cached(self, mock_client, mock_context):
+        """Test that failed responses are not cached."""
+        mock_response = MagicMock()
+        mock_response.status_code = 500
+        mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
+            "Server error", request=MagicMock(), response=mock_response
+        )
+        mock_client.return_value.get = AsyncMock(return_value=mock_response)
+
+        for _ in range(2):
+            with pytest.raises(ToolError):
+                await call_openweather_api(
+                    OpenWeatherEndpoint.CURRENT_AIR_POLLUTION,
+                    {"lat": 51.5085, "lon": -0.1257},
+                    mock_context,
+                )
+
+        assert mock_client.return_value.get.call_count == 2
+
+
+class TestGetResponseTtl:
+    def test_current_air_pollution(self):
+        """Test that current air pollution uses its endpoint ttl."""
+        assert _get_response_ttl(
+            OpenWeatherEndpoint.CURRENT_AIR_POLLUTION, {"lat": 0, "lon": 0}
+        ) == (10 * 60)
+
+    def test_old_history_never_expires(self):
+        """Test that historical data well in the past is cached without expiry."""
+        params = {"lat": 0, "lon": 0, "start": 0, "end": 86_400}
+
+        assert _get_response_ttl(
+            OpenWeatherEndpoint.HISTORICAL_AIR_POLLUTION, params
+        ) == float("inf")
+
+    def test_recent_history_expires(self):
+        """Test that historical data ending recently still expires."""
+        params = {"lat": 0, "lon": 0, "start": 0, "end": int(time.time())}
+
+        assert _get_response_ttl(
+            OpenWeatherEndpoint.HISTORICAL_AIR_POLLUTION, params
+        ) == (10 * 60)
+
+    def test_current_weather(self):
+        """Test that current weather uses its endpoint ttl."""
+        assert _get_response_ttl(
+            OpenWeatherEndpoint.CURRENT_WEATHER, {"q": "London"}
+        ) == (5 * 60)
+
+    def test_forecasts(self):
+        """Test that forecasts are cached longer than current weather."""
+        assert _get_response_ttl(OpenWeatherEndpoint.FORECAST, {"q": "London"}) == (
+            30 * 60
+        )
+
+    def test_geocoding_not_cached(self):
+        """Test that endpoints without a ttl are not cached."""
+        assert (
+            _get_response_ttl(
+                OpenWeatherEndpoint.REVERSE_GEOCODING, {"lat": 0, "lon": 0}
+            )
+            is None
+        )
+
+
+class TestGetCacheKey:
+    def test_location_query_normalized(self):
+        """Test that location queries differing in case or padding share a key."""
+        assert _get_cache_key(
+            OpenWeatherEndpoint.CURRENT_WEATHER, {"q": " London,GB ", "lang": "en"}
+        ) == _get_cache_key(
+            OpenWeatherEndpoint.CURRENT_WEATHER, {"q": "london,gb", "lang": "en"}
+        )
+
+    def test_weather_coordinates_keep_more_precision(self):
+        """Test that weather keys round coordinates to 3 decimal places."""
+        key = _get_cache_key(
+            OpenWeatherEndpoint.CURRENT_WEATHER, {"lat": 51.50853, "lon": -0.12574}
+        )
+
+        assert key == (
+            OpenWeatherEndpoint.CURRENT_WEATHER,
+            (("lat", 51.509), ("lon", -0.126)),
+        )
+
+    def test_forecast_keys_collapse_variants(self):
+        """Test that forecast keys ignore city spelling variants and GPS jitter."""
+        assert _get_cache_key(
+            OpenWeatherEndpoint.FORECAST, {"q": " LONDON,gb ", "lang": "en"}
+        ) == _get_cache_key(
+            OpenWeatherEndpoint.FORECAST, {"q": "London,GB", "lang": "en"}
+        )
+        assert _get_cache_key(
+            OpenWeatherEndpoint.FORECAST, {"lat": 51.50853, "lon": -0.12574}
+        ) == _get_cache_key(
+            OpenWeatherEndpoint.FORECAST, {"lat": 51.50871, "lon": -0.12551}
+        )
+
+    def test_air_pollution_coordinates_rounded(self):
+        """Test that air pollution keys round coordinates to 2 decimal places."""
+        key = _get_cache_key(
+            OpenWeatherEndpoint.CURRENT_AIR_POLLUTION, {"lat": 51.5085, "lon": -0.1257}
+        )
+
+        assert key == (
+            OpenWeatherEndpoint.CURRENT_AIR_POLLUTION,
+            (("lat", 51.51), ("lon", -0.13)),
+        )
+
+
+class TestGetCityQuery:
+    def test_city_only(self):
+        """Test that a city without a country is used as is."""
+        assert get_city_query("London") == "London"
+
+    def test_city_with_country(self):
+        """Test that the country code qualifies the city."""
+        assert get_city_query("London", "GB") == "London,GB"
@@ -2,12 +2,19 @@ import json
 from datetime import datetime, timedelta
 from unittest.mock import ANY, patch
 
+import orjson
 import pytest
 from mcp.server.fastmcp.exceptions import ToolError
 from mcp.types import TextContent
 
 from enums.openweather import OpenWeatherEndpoint
 from weather_mcp.server import mcp
+from weather_mcp.tools.air_pollution import (
+    _get_historical_air_pollution,
+    _pack_records,
+    _to_columns,
+    _unpack_records,
+)
 
 GET_CURRENT_AIR_POLLUTION_BY_GEO = "get_current_air_pollution_by_geo"
 GET_CURRENT_AIR_POLLUTION_BY_CITY = "get_current_air_pollution_by_city"
@@ -15,6 +22,10 @@ GET_FORECAST_AIR_POLLUTION_BY_GEO = "get_forecast_air_pollution_by_geo"
 GET_FORECAST_AIR_POLLUTION_BY_CITY = "get_forecast_air_pollution_by_city"
 GET_HISTORICAL_AIR_POLLUTION_BY_GEO = "get_historical_air_pollution_by_geo"
 GET_HISTORICAL_AIR_POLLUTION_BY_CITY = "get_historical_air_pollution_by_city"
+GET_CURRENT_AIR_POLLUTION_BULK = "get_current_air_pollution_bulk"
+GET_HISTORICAL_AIR_POLLUTION_COLUMNS_BY_GEO = (
+    "get_historical_air_pollution_columns_by_geo"
+)
 
 
 class TestAirPollutionToolsRregistration:
@@ -33,6 +44,8 @@ class TestAirPollutionToolsRregistration:
         assert GET_FORECAST_AIR_POLLUTION_BY_CITY in tool_names
         assert GET_HISTORICAL_AIR_POLLUTION_BY_GEO in tool_names
         assert GET_HISTORICAL_AIR_POLLUTION_BY_CITY in tool_names
+        assert GET_CURRENT_AIR_POLLUTION_BULK in tool_names
+        assert GET_HISTORICAL_AIR_POLLUTION_COLUMNS_BY_GEO in tool_names
 
 
 class TestGetCurrentAirPollutionByGeo:
@@ -343,6 +356,106 @@ class TestGetCurrentAirPollutionByCity:
                 )
 
 
+class TestGetCurrentAirPollutionBulk:
+    """Test suite for get_current_air_pollution_bulk"""
+
+    @pytest.mark.asyncio
+    @patch("weather_mcp.tools.air_pollution.call_openweather_api")
+    @patch("weather_mcp.tools.geocoding.call_openweather_api")
+    async def test_results_keep_input_order(
+        self,
+        mock_geo_call_openweather_api,
+        mock_call_openweather_api,
+        sample_air_pollution_response,
+    ):
+        """Test that results are aligned with the input locations."""
+        mock_geo_call_openweather_api.side_effect = [
+            [{"lat": 51.5085, "lon": -0.1257}],
+            [{"lat": 48.8534, "lon": 2.3488}],
+        ]
+        mock_call_openweather_api.side_effect = lambda endpoint, params, mcp_ctx: {
+            "coord": params
+        }
+
+        result = await mcp.call_tool(
+            GET_CURRENT_AIR_POLLUTION_BULK,
+            {
+                "locations": [
+                    {"city": "London", "state_code": "EN", "country_code": "GB"},
+                    {"city": "Paris", "state_code": "IF", "country_code": "FR"},
+                ]
+            },
+        )
+
+        assert [json.loads(content.text) for content in result] == [
+            {"coord": {"lat": 51.5085, "lon": -0.1257}},
+            {"coord": {"lat": 48.8534, "lon": 2.3488}},
+        ]
+
+    @pytest.mark.asyncio
+    @patch("weather_mcp.tools.air_pollution.call_openweather_api")
+    @patch("weather_mcp.tools.geocoding.call_openweather_api")
+    async def test_duplicate_locations_fetched_once(
+        self,
+        mock_geo_call_openweather_api,
+        mock_call_openweather_api,
+        sample_air_pollution_response,
+        sample_geo_response,
+    ):
+        """Test that duplicate locations share a single request."""
+        mock_geo_call_openweather_api.return_value = sample_geo_response
+        mock_call_openweather_api.return_value = sample_air_pollution_response
+
+        location = {"city": "New York", "state_code": "NY", "country_code": "US"}
+        result = await mcp.call_tool(
+            GET_CURRENT_AIR_POLLUTION_BULK, {"locations": [location, location]}
+        )
+
+        assert len(result) == 2
+        mock_geo_call_openweather_api.assert_called_once()
+        mock_call_openweather_api.assert_called_once()
+
+    @pytest.mark.asyncio
+    @patch("weather_mcp.tools.air_pollution.call_openweather_api")
+    @patch("weather_mcp.tools.geocoding.call_openweather_api")
+    async def test_failed_location_reports_error(
+        self,
+        mock_geo_call_openweather_api,
+        mock_call_openweather_api,
+        sample_air_pollution_response,
+        sample_geo_response,
+    ):
+        """Test that one failing location does not fail the whole batch."""
+        mock_geo_call_openweather_api.side_effect = [sample_geo_response, []]
+        mock_call_openweather_api.return_value = sample_air_pollution_response
+
+        result = await mcp.call_tool(
+            GET_CURRENT_AIR_POLLUTION_BULK,
+            {
+                "locations": [
+                    {"city": "New York", "state_code": "NY", "country_code": "US"},
+                    {"city": "Nowhere", "state_code": "XX", "country_code": "US"},
+                ]
+            },
+        )
+
+        assert json.loads(result[0].text) == sample_air_pollution_response
+        assert json.loads(result[1].text) == {"error": "Location not found."}
+
+    @pytest.mark.asyncio
+    @patch("weather_mcp.tools.air_pollution.call_openweather_api")
+    async def test_too_many_locations_rejected(self, mock_call_openweather_api):
+        """Test that a batch larger than the limit is rejected before any request."""
+        location = {"city": "London", "state_code": "EN", "country_code": "GB"}
+
+        with pytest.raises(ToolError):
+            await mcp.call_tool(
+                GET_CURRENT_AIR_POLLUTION_BULK, {"locations": [location] * 51}
+            )
+
+        mock_call_openweather_api.assert_not_called()
+
+
 class TestGetForecastAirPollutionByGeo:
     """Test suite for get_forecast_air_pollution_by_geo"""
 
@@ -1144,3 +1257,237 @@ class TestGetHistoricalAirPollutionByCity:
                     "end": -1,
                 },
             )
+
+
+class TestGetHistoricalAirPollutionColumnsByGeo:
+    """Test suite for get_historical_air_pollution_columns_by_geo"""
+
+    @pytest.mark.asyncio
+    @patch("weather_mcp.tools.air_pollution.call_openweather_api")
+    async def test_columns_aligned_with_records(
+        self, mock_call_openweather_api, sample_air_pollution_historical_response
+    ):
+        """Test that each field becomes one list aligned by measurement."""
+        end_time = int(datetime.now().timestamp())
+        start_time = int((datetime.now() - timedelta(days=30)).timestamp())
+
+        mock_call_openweather_api.return_value = (
+            sample_air_pollution_historical_response
+        )
+
+        result = await mcp.call_tool(
+            GET_HISTORICAL_AIR_POLLUTION_COLUMNS_BY_GEO,
+            {"lat": 35.6762, "lon": 139.6503, "start": start_time, "end": end_time},
+        )
+
+        records = sample_air_pollution_historical_response["list"]
+        columns = json.loads(result[0].text)
+
+        assert columns["coord"] == sample_air_pollution_historical_response["coord"]
+        assert columns["dt"] == [record["dt"] for record in records]
+        assert columns["aqi"] == [record["main"]["aqi"] for record in records]
+        assert columns["pm2_5"] == [record["components"]["pm2_5"] for record in records]
+
+    def test_empty_response(self):
+        """Test that an empty response yields empty columns."""
+        assert _to_columns({"coord": {"lat": 0, "lon": 0}, "list": []}) == {
+            "coord": {"lat": 0, "lon": 0},
+            "dt": [],
+            "aqi": [],
+        }
+
+
+class TestHistoricalAirPollutionDayCache:
+    """Test suite for the day-bucketed historical air pollution cache"""
+
+    DAY = 24 * 60 * 60
+    # A UTC midnight far enough in the past for its days to be final
+    BASE = 1_700_006_400
+
+    @staticmethod
+    def _hourly_response(endpoint, params, mcp_ctx):
+        return {
+            "coord": {"lon": params["lon"], "lat": params["lat"]},
+            "list": [
+                {"dt": dt, "main": {"aqi": 2}}
+                for dt in range(params["start"], params["end"] + 1, 3600)
+            ],
+        }
+
+    @pytest.mark.asyncio
+    @patch("weather_mcp.tools.air_pollution.call_openweather_api")
+    async def test_overlapping_range_fetches_only_missing_days(
+        self, mock_call_openweather_api, mock_context
+    ):
+        """Test that a wider range only requests the days not cached yet."""
+        mock_call_openweather_api.side_effect = self._hourly_response
+        end = self.BASE + 10 * self.DAY - 1
+
+        await _get_historical_air_pollution(
+            35.6762, 139.6503, self.BASE, end, mcp_ctx=mock_context
+        )
+        result = await _get_historical_air_pollution(
+            35.6762, 139.6503, self.BASE - 5 * self.DAY, end, mcp_ctx=mock_context
+        )
+
+        assert mock_call_openweather_api.call_count == 2
+        mock_call_openweather_api.assert_called_with(
+            OpenWeatherEndpoint.HISTORICAL_AIR_POLLUTION,
+            {
+                "lat": 35.6762,
+                "lon": 139.6503,
+                "start": self.BASE - 5 * self.DAY,
+                "end": self.BASE - 1,
+            },
+            mcp_ctx=mock_context,
+        )
+        assert [record["dt"] for record in result["list"]] == list(
+            range(self.BASE - 5 * self.DAY, end + 1, 3600)
+        )
+        assert result["coord"] == {"lon": 139.6503, "lat": 35.6762}
+
+    @pytest.mark.asyncio
+    @patch("weather_mcp.tools.air_pollution.call_openweather_api")
+    async def test_cached_range_served_without_request(
+        self, mock_call_openweather_api, mock_context
+    ):
+        """Test that a range made of cached days is served from the cache."""
+        mock_call_openweather_api.side_effect = self._hourly_response
+        end = self.BASE + 10 * self.DAY - 1
+
+        first = await _get_historical_air_pollution(
+            35.6762, 139.6503, self.BASE, end, mcp_ctx=mock_context
+        )
+        second = await _get_historical_air_pollution(
+            35.6762, 139.6503, self.BASE + self.DAY, end, mcp_ctx=mock_context
+        )
+
+        mock_call_openweather_api.assert_called_once()
+        assert second["list"] == first["list"][24:]
+
+    @pytest.mark.asyncio
+    @patch("weather_mcp.tools.air_pollution.call_openweather_api")
+    async def test_cached_days_trimmed_to_range(
+        self, mock_call_openweather_api, mock_context
+    ):
+        """Test that a range starting and ending mid-day over cached days is trimmed."""
+        mock_call_openweather_api.side_effect = self._hourly_response
+
+        await _get_historical_air_pollution(
+            35.6762, 139.6503, self.BASE, self.BASE + 4 * self.DAY - 1, mock_context
+        )
+        start = self.BASE + self.DAY + 12 * 3600
+        end = self.BASE + 2 * self.DAY + 12 * 3600
+        result = await _get_historical_air_pollution(
+            35.6762, 139.6503, start, end, mcp_ctx=mock_context
+        )
+
+        mock_call_openweather_api.assert_called_once()
+        assert [record["dt"] for record in result["list"]] == list(
+            range(start, end + 1, 3600)
+        )
+
+    @pytest.mark.asyncio
+    @patch("weather_mcp.tools.air_pollution.call_openweather_api")
+    async def test_scattered_cached_days_fetched_in_one_request(
+        self, mock_call_openweather_api, mock_context
+    ):
+        """Test that gaps between cached days cost a single request for their span."""
+        mock_call_openweather_api.side_effect = self._hourly_response
+        end = self.BASE + 20 * self.DAY - 1
+
+        # Cache every other day
+        for day in range(0, 20, 2):
+            day_start = self.BASE + day * self.DAY
+            await _get_historical_air_pollution(
+                35.6762, 139.6503, day_start, day_start + self.DAY - 1, mock_context
+            )
+        mock_call_openweather_api.reset_mock()
+
+        result = await _get_historical_air_pollution(
+            35.6762, 139.6503, self.BASE, end, mcp_ctx=mock_context
+        )
+
+        mock_call_openweather_api.assert_called_once_with(
+            OpenWeatherEndpoint.HISTORICAL_AIR_POLLUTION,
+            {
+                "lat": 35.6762,
+                "lon": 139.6503,
+                "start": self.BASE + self.DAY,
+                "end": self.BASE + 20 * self.DAY - 1,
+            },
+            mcp_ctx=mock_context,
+        )
+        assert [record["dt"] for record in result["list"]] == list(
+            range(self.BASE, end + 1, 3600)
+        )
+
+    @pytest.mark.asyncio
+    @patch("weather_mcp.tools.air_pollution.call_openweather_api")
+    async def test_recent_days_not_cached(
+        self, mock_call_openweather_api, mock_context
+    ):
+        """Test that days which may still change are requested again."""
+        mock_call_openweather_api.side_effect = self._hourly_response
+        end = int(datetime.now().timestamp())
+        start = end - 3600
+
+        for _ in range(2):
+            await _get_historical_air_pollution(
+                35.6762, 139.6503, start, end, mcp_ctx=mock_context
+            )
+
+        assert mock_call_openweather_api.call_count == 2
+
+
+class TestHistoryRecordPacking:
+    """Test suite for the compact storage of cached historical records"""
+
+    RECORDS = [
+        {
+            "main": {"aqi": 2 + i % 3},
+            "components": {"co": 200.0 + i, "no2": 15.5, "pm2_5": 8.25},
+            "dt": 1_700_006_400 + i * 3600,
+        }
+        for i in range(24)
+    ]
+
+    def test_round_trip(self):
+        """Test that packed records unpack to the original records."""
+        packed = _pack_records(self.RECORDS)
+
+        assert isinstance(packed, tuple)
+        assert _unpack_records(packed) == self.RECORDS
+
+    def test_round_trip_keeps_integer_components(self):
+        """Test that integer concentrations are not turned into floats."""
+        records = [
+            {"main": {"aqi": 1}, "components": {"no": 0, "co": 201.94}, "dt": 1},
+            {"main": {"aqi": 1}, "components": {"no": 3, "co": 200.0}, "dt": 2},
+        ]
+
+        unpacked = _unpack_records(_pack_records(records))
+
+        assert orjson.dumps(unpacked) == orjson.dumps(records)
+
+    def test_mixed_component_types_stored_unchanged(self):
+        """Test that a component mixing ints and floats is not packed."""
+        records = [
+            {"main": {"aqi": 1}, "components": {"no": 0}, "dt": 1},
+            {"main": {"aqi": 1}, "components": {"no": 0.5}, "dt": 2},
+        ]
+
+        assert _pack_records(records) is records
+
+    def test_empty_records(self):
+        """Test that an empty day is stored as an empty list."""
+        assert _unpack_records(_pack_records([])) == []
+
+    def test_irregular_records_stored_unchanged(self):
+        """Test that records with an unexpected shape are not packed."""
+        records = [{"dt": 1, "main": {"aqi": 2}, "components": {}, "extra": True}]
+
+        assert _pack_records(records) is records
+        assert _pack_records([{"dt": 1, "main": {"aqi": -1}, "components": {}}])[0][
+            "main"
+        ] == {"aqi": -1}
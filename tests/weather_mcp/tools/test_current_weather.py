@@ -10,6 +10,7 @@ from weather_mcp.server import mcp
 
 GET_CURRENT_WEATHER_BY_GEO = "get_current_weather_by_geo"
 GET_CURRENT_WEATHER_BY_CITY = "get_current_weather_by_city"
+GET_CURRENT_WEATHER_BATCH = "get_current_weather_batch"
 
 
 class TestCurrentWeatherToolsRregistration:
@@ -24,6 +25,7 @@ class TestCurrentWeatherToolsRregistration:
 
         assert GET_CURRENT_WEATHER_BY_GEO in tool_names
         assert GET_CURRENT_WEATHER_BY_CITY in tool_names
+        assert GET_CURRENT_WEATHER_BATCH in tool_names
 
 
 class TestGetCurrentWeatherByGeo:
@@ -173,11 +175,11 @@ class TestGetCurrentWeatherByGeo:
         """Test invalid language code format"""
         mock_call_openweather_api.return_value = sample_weather_response
 
-        invalid_langs = ["eng", "E", "123", "en-US", "EN"]
+        invalid_langs = ["eng", "E", "123", "en-US", "EN", "xx"]
 
         for lang in invalid_langs:
             with pytest.raises(ToolError):
-                # This should raise ValidationError due to Pydantic pattern validation (^[a-z]{2}$)
+                # This should raise ValidationError for unsupported language codes
                 await mcp.call_tool(
                     GET_CURRENT_WEATHER_BY_GEO,
                     {"lat": 35.6762, "lon": 139.6503, "lang": lang},
@@ -253,6 +255,25 @@ class TestGetCurrentWeatherByCity:
             mcp_ctx=ANY,
         )
 
+    @pytest.mark.asyncio
+    @patch("weather_mcp.tools.current_weather.call_openweather_api")
+    async def test_city_with_regional_language(
+        self, mock_call_openweather_api, sample_weather_response
+    ):
+        """Test weather retrieval with a regional language code"""
+        mock_call_openweather_api.return_value = sample_weather_response
+
+        await mcp.call_tool(
+            GET_CURRENT_WEATHER_BY_CITY,
+            {"city": "Taipei", "country_code": "TW", "lang": "zh_tw"},
+        )
+
+        mock_call_openweather_api.assert_called_once_with(
+            OpenWeatherEndpoint.CURRENT_WEATHER,
+            {"q": "Taipei,TW", "lang": "zh_tw"},
+            mcp_ctx=ANY,
+        )
+
     @pytest.mark.asyncio
     @patch("weather_mcp.tools.current_weather.call_openweather_api")
     async def test_unicode_city_names(
@@ -354,12 +375,89 @@ class TestGetCurrentWeatherByCity:
         """Test invalid language code format"""
         mock_call_openweather_api.return_value = sample_weather_response
 
-        invalid_langs = ["eng", "E", "123", "en-US", "EN"]
+        invalid_langs = ["eng", "E", "123", "en-US", "EN", "xx"]
 
         for lang in invalid_langs:
             with pytest.raises(ToolError):
-                # This should raise ValidationError due to Pydantic pattern validation (^[a-z]{2}$)
+                # This should raise ValidationError for unsupported language codes
                 await mcp.call_tool(
                     GET_CURRENT_WEATHER_BY_CITY,
                     {"city": "Tokyo", "lang": lang},
                 )
+
+
+class TestGetCurrentWeatherBatch:
+    """Test suite for get_current_weather_batch function"""
+
+    @pytest.mark.asyncio
+    @patch("weather_mcp.utils.call_openweather_api")
+    async def test_results_keep_input_order(self, mock_call_openweather_api):
+        """Test that results are aligned with the input locations"""
+        mock_call_openweather_api.side_effect = lambda endpoint, params, mcp_ctx: {
+            "params": params
+        }
+
+        result = await mcp.call_tool(
+            GET_CURRENT_WEATHER_BATCH,
+            {
+                "locations": [
+                    {"lat": 35.6762, "lon": 139.6503},
+                    {"city": "London", "country_code": "GB"},
+                    {"city": "Paris"},
+                ],
+                "lang": "fr",
+            },
+        )
+
+        assert [json.loads(content.text) for content in result] == [
+            {"params": {"lat": 35.6762, "lon": 139.6503, "lang": "fr"}},
+            {"params": {"q": "London,GB", "lang": "fr"}},
+            {"params": {"q": "Paris", "lang": "fr"}},
+        ]
+
+    @pytest.mark.asyncio
+    @patch("weather_mcp.utils.call_openweather_api")
+    async def test_failed_location_reports_error(
+        self, mock_call_openweather_api, sample_weather_response
+    ):
+        """Test that one failing location does not fail the whole batch"""
+        mock_call_openweather_api.side_effect = [
+            sample_weather_response,
+            ToolError("Weather data not found for the given location."),
+        ]
+
+        result = await mcp.call_tool(
+            GET_CURRENT_WEATHER_BATCH,
+            {"locations": [{"city": "London"}, {"city": "Nowhere"}]},
+        )
+
+        assert json.loads(result[0].text) == sample_weather_response
+        assert json.loads(result[1].text) == {
+            "error": "Weather data not found for the given location."
+        }
+
+    @pytest.mark.asyncio
+    @patch("weather_mcp.utils.call_openweather_api")
+    async def test_incomplete_location_rejected(self, mock_call_openweather_api):
+        """Test that each location needs a coordinate pair or a city"""
+        invalid_locations = [{"lat": 35.6762}, {}, {"country_code": "GB"}]
+
+        for location in invalid_locations:
+            with pytest.raises(ToolError):
+                await mcp.call_tool(
+                    GET_CURRENT_WEATHER_BATCH, {"locations": [location]}
+                )
+
+        mock_call_openweather_api.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch("weather_mcp.utils.call_openweather_api")
+    async def test_too_many_locations_rejected(self, mock_call_openweather_api):
+        """Test that a batch larger than the limit is rejected before any request"""
+        with pytest.raises(ToolError):
+            await mcp.call_tool(
+                GET_CURRENT_WEATHER_BATCH,
+                {"locations": [{"city": "London"}] * 51},
+            )
+
+        mock_call_openweather_api.assert_not_called()
@@ -1,15 +1,18 @@
 import json
-from unittest.mock import ANY, patch
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
+import orjson
 import pytest
 from mcp.server.fastmcp.exceptions import ToolError
 from mcp.types import TextContent
 
 from enums.openweather import OpenWeatherEndpoint
 from weather_mcp.server import mcp
+from weather_mcp.tools.forecast import get_forecast_by_city
 
 GET_FORECAST_BY_GEO = "get_forecast_by_geo"
 GET_FORECAST_BY_CITY = "get_forecast_by_city"
+GET_FORECAST_BATCH = "get_forecast_batch"
 
 
 class TestForecastToolsRregistration:
@@ -24,6 +27,7 @@ class TestForecastToolsRregistration:
 
         assert GET_FORECAST_BY_GEO in tool_names
         assert GET_FORECAST_BY_CITY in tool_names
+        assert GET_FORECAST_BATCH in tool_names
 
 
 class TestGetForecastByGeo:
@@ -184,6 +188,70 @@ class TestGetForecastByGeo:
                 )
 
 
+class TestForecastFields:
+    """Test suite for trimming forecast entries with the fields argument"""
+
+    @pytest.mark.asyncio
+    @patch("weather_mcp.tools.forecast.call_openweather_api")
+    async def test_geo_fields_selected(
+        self, mock_call_openweather_api, sample_forecast_response
+    ):
+        """Test that only the requested entry fields and dt are returned"""
+        mock_call_openweather_api.return_value = sample_forecast_response
+
+        result = await mcp.call_tool(
+            GET_FORECAST_BY_GEO,
+            {"lat": 51.5085, "lon": -0.1257, "fields": ["pop", "rain"]},
+        )
+
+        data = json.loads(result[0].text)
+        assert data["city"] == sample_forecast_response["city"]
+        assert data["list"] == [
+            {"dt": 1640995200, "pop": 0.1},
+            {"dt": 1641006000, "pop": 0.05, "rain": {"3h": 0.2}},
+        ]
+        # The (cached) response itself is left untouched
+        assert "main" in sample_forecast_response["list"][0]
+
+    @pytest.mark.asyncio
+    @patch("weather_mcp.tools.forecast.call_openweather_api")
+    async def test_city_fields_selected(
+        self, mock_call_openweather_api, sample_forecast_response
+    ):
+        """Test that city forecasts are trimmed the same way"""
+        mock_call_openweather_api.return_value = sample_forecast_response
+
+        result = await mcp.call_tool(
+            GET_FORECAST_BY_CITY, {"city": "London", "fields": ["main"]}
+        )
+
+        entries = json.loads(result[0].text)["list"]
+        assert [set(entry) for entry in entries] == [{"dt", "main"}] * 2
+
+    @pytest.mark.asyncio
+    @patch("weather_mcp.tools.forecast.call_openweather_api")
+    async def test_summary_projection(
+        self, mock_call_openweather_api, sample_forecast_response
+    ):
+        """Test that summary returns only the compact per-entry projection"""
+        mock_call_openweather_api.return_value = sample_forecast_response
+
+        result = await mcp.call_tool(
+            GET_FORECAST_BY_CITY,
+            {"city": "London", "summary": True, "fields": ["main"]},
+        )
+
+        data = json.loads(result[0].text)
+        assert data == {
+            "cnt": 40,
+            "city": sample_forecast_response["city"],
+            "list": [
+                {"dt": 1640995200, "temp": 15.5, "pop": 0.1, "cond": "Clear"},
+                {"dt": 1641006000, "temp": 18.2, "pop": 0.05, "cond": "Clouds"},
+            ],
+        }
+
+
 class TestGetForecastByCity:
     """Test suite for get_forecast_by_city function"""
 
@@ -363,3 +431,121 @@ class TestGetForecastByCity:
                     GET_FORECAST_BY_CITY,
                     {"city": "Tokyo", "lang": lang},
                 )
+
+
+class TestForecastCityCoords:
+    """Test suite for reusing resolved city coordinates"""
+
+    @pytest.mark.asyncio
+    @patch("weather_mcp.tools.forecast.call_openweather_api")
+    async def test_repeat_city_uses_coordinates(
+        self, mock_call_openweather_api, sample_forecast_response
+    ):
+        """Test that a repeat city query is sent by the coordinates resolved first"""
+        mock_call_openweather_api.return_value = sample_forecast_response
+
+        await mcp.call_tool(GET_FORECAST_BY_CITY, {"city": "London"})
+        await mcp.call_tool(GET_FORECAST_BY_CITY, {"city": " london "})
+
+        first, second = mock_call_openweather_api.call_args_list
+        assert first.args[1] == {"q": "London", "lang": "en"}
+        assert second.args[1] == {"lat": 51.5085, "lon": -0.1257, "lang": "en"}
+
+    @pytest.mark.asyncio
+    @patch("weather_mcp.utils.get_http_client")
+    async def test_repeat_city_served_from_cache(
+        self, mock_client, mock_context, sample_forecast_response
+    ):
+        """Test that routing by coordinates does not cost another upstream call"""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = orjson.dumps(sample_forecast_response)
+        mock_client.return_value.get = AsyncMock(return_value=mock_response)
+
+        for _ in range(3):
+            result = await get_forecast_by_city(mock_context, "London")
+            assert result == sample_forecast_response
+
+        mock_client.return_value.get.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    @patch("weather_mcp.tools.forecast.call_openweather_api")
+    async def test_country_code_is_part_of_key(
+        self, mock_call_openweather_api, sample_forecast_response
+    ):
+        """Test that the same city in another country is still queried by name"""
+        mock_call_openweather_api.return_value = sample_forecast_response
+
+        await mcp.call_tool(GET_FORECAST_BY_CITY, {"city": "London"})
+        await mcp.call_tool(
+            GET_FORECAST_BY_CITY, {"city": "London", "country_code": "CA"}
+        )
+
+        assert mock_call_openweather_api.call_args.args[1] == {
+            "q": "London,CA",
+            "lang": "en",
+        }
+
+
+class TestGetForecastBatch:
+    """Test suite for get_forecast_batch function"""
+
+    @pytest.mark.asyncio
+    @patch("weather_mcp.utils.call_openweather_api")
+    async def test_results_keep_input_order(self, mock_call_openweather_api):
+        """Test that forecasts are fetched per location and kept in input order"""
+        mock_call_openweather_api.side_effect = lambda endpoint, params, mcp_ctx: {
+            "endpoint": endpoint.value,
+            "params": params,
+        }
+
+        result = await mcp.call_tool(
+            GET_FORECAST_BATCH,
+            {
+                "locations": [
+                    {"city": "London", "country_code": "GB"},
+                    {"lat": 48.8534, "lon": 2.3488},
+                ]
+            },
+        )
+
+        assert [json.loads(content.text) for content in result] == [
+            {"endpoint": "forecast", "params": {"q": "London,GB", "lang": "en"}},
+            {
+                "endpoint": "forecast",
+                "params": {"lat": 48.8534, "lon": 2.3488, "lang": "en"},
+            },
+        ]
+
+    @pytest.mark.asyncio
+    @patch("weather_mcp.utils.call_openweather_api")
+    async def test_failed_location_reports_error(
+        self, mock_call_openweather_api, sample_forecast_response
+    ):
+        """Test that one failing location does not fail the whole batch"""
+        mock_call_openweather_api.side_effect = [
+            ToolError("Weather data not found for the given location."),
+            sample_forecast_response,
+        ]
+
+        result = await mcp.call_tool(
+            GET_FORECAST_BATCH,
+            {"locations": [{"city": "Nowhere"}, {"city": "London"}]},
+        )
+
+        assert json.loads(result[0].text) == {
+            "error": "Weather data not found for the given location."
+        }
+        assert json.loads(result[1].text) == sample_forecast_response
+
+    @pytest.mark.asyncio
+    @patch("weather_mcp.utils.call_openweather_api")
+    async def test_too_many_locations_rejected(self, mock_call_openweather_api):
+        """Test that a batch larger than the limit is rejected before any request"""
+        with pytest.raises(ToolError):
+            await mcp.call_tool(
+                GET_FORECAST_BATCH,
+                {"locations": [{"lat": 51.5085, "lon": -0.1257}] * 51},
+            )
+
+        mock_call_openweather_api.assert_not_called()
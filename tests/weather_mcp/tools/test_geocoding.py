@@ -1,3 +1,4 @@
+import asyncio
 import json
 from unittest.mock import ANY, patch
 
@@ -7,6 +8,7 @@ from mcp.types import TextContent
 
 from enums.openweather import OpenWeatherEndpoint
 from weather_mcp.server import mcp
+from weather_mcp.tools.geocoding import _geo_cache, _geo_inflight, _resolve_city
 
 GET_GEO_BY_LOCATION = "get_geo_by_location"
 GET_LOCATOPN_BY_GEO = "get_localtion_by_geo"
@@ -380,3 +382,98 @@ class TestDirectGeoByCoordinates:
                     GET_LOCATOPN_BY_GEO,
                     {"lat": 40.7128, "lon": -74.0060, "limit": limit},
                 )
+
+
+class TestResolveCity:
+    """Test suite for the cached _resolve_city helper."""
+
+    @pytest.mark.asyncio
+    @patch("weather_mcp.tools.geocoding.call_openweather_api")
+    async def test_cached_after_first_lookup(
+        self, mock_call_openweather_api, mock_context, sample_geo_response
+    ):
+        """Test that repeated lookups for the same city hit the cache."""
+        mock_call_openweather_api.return_value = sample_geo_response
+
+        first = await _resolve_city("New York", "NY", "US", mcp_ctx=mock_context)
+        second = await _resolve_city(" new york ", "ny", "us", mcp_ctx=mock_context)
+
+        assert first == second == (40.7128, -74.006)
+        mock_call_openweather_api.assert_called_once_with(
+            OpenWeatherEndpoint.DIRECT_GEOCODING,
+            {"q": "New York,NY,US", "limit": 1},
+            mcp_ctx=mock_context,
+        )
+
+    @pytest.mark.asyncio
+    @patch("weather_mcp.tools.geocoding.call_openweather_api")
+    async def test_disk_cache_survives_memory_clear(
+        self, mock_call_openweather_api, mock_context, sample_geo_response
+    ):
+        """Test that a cold in-memory cache is refilled from the disk cache."""
+        mock_call_openweather_api.return_value = sample_geo_response
+
+        await _resolve_city("New York", "NY", "US", mcp_ctx=mock_context)
+        _geo_cache.clear()
+        coords = await _resolve_city("New York", "NY", "US", mcp_ctx=mock_context)
+
+        assert coords == (40.7128, -74.006)
+        mock_call_openweather_api.assert_called_once()
+
+    @pytest.mark.asyncio
+    @patch("weather_mcp.tools.geocoding.call_openweather_api")
+    async def test_concurrent_misses_single_lookup(
+        self, mock_call_openweather_api, mock_context, sample_geo_response
+    ):
+        """Test that concurrent misses for the same city share one lookup."""
+        mock_call_openweather_api.return_value = sample_geo_response
+
+        results = await asyncio.gather(
+            *(
+                _resolve_city("Tokyo", "13", "JP", mcp_ctx=mock_context)
+                for _ in range(5)
+            )
+        )
+
+        assert len(set(results)) == 1
+        mock_call_openweather_api.assert_called_once()
+
+    @pytest.mark.asyncio
+    @patch("weather_mcp.tools.geocoding.call_openweather_api")
+    async def test_concurrent_unknown_city_single_lookup(
+        self, mock_call_openweather_api, mock_context
+    ):
+        """Test that concurrent lookups of an unknown city all fail on one request."""
+
+        async def _empty(*args, **kwargs):
+            await asyncio.sleep(0)
+            return []
+
+        mock_call_openweather_api.side_effect = _empty
+
+        results = await asyncio.gather(
+            *(
+                _resolve_city("Nowhere", "XX", "US", mcp_ctx=mock_context)
+                for _ in range(5)
+            ),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, IndexError) for result in results)
+        mock_call_openweather_api.assert_called_once()
+
+    @pytest.mark.asyncio
+    @patch("weather_mcp.tools.geocoding.call_openweather_api")
+    async def test_empty_result_not_cached(
+        self, mock_call_openweather_api, mock_context
+    ):
+        """Test that an empty geocoding result raises and is not cached."""
+        mock_call_openweather_api.return_value = []
+
+        for _ in range(2):
+            with pytest.raises(IndexError):
+                await _resolve_city("Nowhere", "XX", "US", mcp_ctx=mock_context)
+
+        assert mock_call_openweather_api.call_count == 2
+        # Nothing is left in flight after a failure
+        assert len(_geo_inflight) == 0